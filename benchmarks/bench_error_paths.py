@@ -0,0 +1,111 @@
+"""
+예외 경로와 결과 값 경로 비교
+==========================
+잘못된 값 비율별로 예외를 내는 함수(try/except로 받음)와
+*_result 함수(오류 싱글턴 반환)의 호출 한 번당 시간을 비교한다.
+
+    python -m benchmarks.bench_error_paths
+    python -m benchmarks.bench_error_paths --rates 0.01 0.5 --n 1e6
+
+잘못된 값이 많을수록 예외 경로가 느려진다 (예외 객체, 메시지, traceback).
+잘못된 값이 1% 정도로 드물면 정상 값에 튜플을 만들지 않는 예외 경로가 오히려 빠르다.
+"""
+
+import argparse
+import time
+from itertools import cycle, islice
+
+from src.parsing import (
+    divide,
+    divide_result,
+    parse,
+    parse_result,
+    process,
+    process_result,
+    validate_score,
+    validate_score_result,
+)
+
+
+POOL_SIZE = 1000
+
+# 이름 → (예외를 내는 함수, 결과 함수, 정상 입력 인자, 잘못된 입력 인자)
+# 인자는 튜플 하나 (func(*args)로 부른다)
+CASES = {
+    "divide": (divide, divide_result, lambda i: (i, i % 7 + 1), lambda i: (i, 0)),
+    "process": (process, process_result, lambda i: (i,),
+                lambda i: (None,) if i % 2 else (-i - 1,)),
+    "validate_score": (validate_score, validate_score_result, lambda i: (i % 101,),
+                       lambda i: (-1,) if i % 2 else (101 + i,)),
+    "parse": (parse, parse_result, lambda i: (str(i),),
+              lambda i: ("",) if i % 2 else (f"{i}점",)),
+}
+
+
+def make_inputs(good, bad, rate):
+    """잘못된 값이 rate 비율로 고르게 섞인 인자 목록 (POOL_SIZE개)"""
+    inputs = []
+    errors = 0
+    for i in range(POOL_SIZE):
+        # 지금까지 오류 수가 목표보다 적으면 잘못된 값을 넣는다
+        if errors < (i + 1) * rate:
+            inputs.append(bad(i))
+            errors += 1
+        else:
+            inputs.append(good(i))
+    return inputs
+
+
+def run_raising(func, inputs, n):
+    failed = 0
+    for args in islice(cycle(inputs), n):
+        try:
+            func(*args)
+        except (ValueError, TypeError):
+            failed += 1
+    return failed
+
+
+def run_result(func, inputs, n):
+    failed = 0
+    for args in islice(cycle(inputs), n):
+        ok, _ = func(*args)
+        if not ok:
+            failed += 1
+    return failed
+
+
+def best_of(repeat, func):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--cases", nargs="+", choices=sorted(CASES), default=list(CASES))
+    parser.add_argument("--rates", type=float, nargs="+", default=[0.01, 0.1, 0.5])
+    parser.add_argument("--n", type=float, default=2e5)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+    n = int(args.n)
+
+    print(f"n={n:,}")
+    print(f"{'case':<16} {'error rate':>10} {'raise ns/op':>12} {'result ns/op':>13} {'speedup':>8}")
+    for name in args.cases:
+        raising, result, good, bad = CASES[name]
+        for rate in args.rates:
+            inputs = make_inputs(good, bad, rate)
+            # 두 경로가 같은 수의 오류를 세는지 먼저 확인
+            assert run_raising(raising, inputs, POOL_SIZE) == run_result(result, inputs, POOL_SIZE)
+            raise_s = best_of(args.repeat, lambda: run_raising(raising, inputs, n))
+            result_s = best_of(args.repeat, lambda: run_result(result, inputs, n))
+            print(f"{name:<16} {rate:>10.0%} {raise_s / n * 1e9:>12.1f} "
+                  f"{result_s / n * 1e9:>13.1f} {raise_s / result_s:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
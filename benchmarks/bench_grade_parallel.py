@@ -0,0 +1,63 @@
+"""
+grade_parallel 손익분기점 측정
+============================
+입력 크기별로 단일 프로세스와 병렬 집계 시간을 비교한다.
+
+    python -m benchmarks.bench_grade_parallel
+    python -m benchmarks.bench_grade_parallel --workers 8 --sizes 1e5 1e6 1e7
+
+병렬이 처음으로 더 빨라지는 크기가 손익분기점이다.
+src/parallel.py의 MIN_PARALLEL_SIZE는 이 값을 보고 정한다.
+"""
+
+import argparse
+import os
+import time
+from array import array
+
+from src.parallel import grade_parallel, new_pool
+
+
+def best_of(repeat, func):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--sizes", type=float, nargs="+",
+                        default=[1e4, 3e4, 1e5, 3e5, 1e6, 3e6, 1e7])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    print(f"workers={args.workers}")
+    print(f"{'size':>12} {'serial ms':>10} {'parallel ms':>12} {'speedup':>8}")
+
+    crossover = None
+    with new_pool(args.workers) as pool:
+        # 워커 프로세스를 미리 띄워둔다 (시작 비용은 측정에서 제외)
+        grade_parallel([0] * args.workers, workers=args.workers, executor=pool, min_size=0)
+
+        for size in map(int, args.sizes):
+            scores = array("h", (i % 101 for i in range(size)))
+            serial = best_of(args.repeat, lambda: grade_parallel(scores, workers=1))
+            parallel = best_of(args.repeat, lambda: grade_parallel(
+                scores, workers=args.workers, executor=pool, min_size=0))
+            speedup = serial / parallel
+            print(f"{size:>12,} {serial * 1e3:>10.2f} {parallel * 1e3:>12.2f} {speedup:>7.2f}x")
+            if crossover is None and speedup > 1:
+                crossover = size
+
+    if crossover is None:
+        print("손익분기점: 측정 범위 안에서 병렬이 더 빠른 크기 없음")
+    else:
+        print(f"손익분기점: 약 {crossover:,}개부터 병렬이 더 빠름")
+
+
+if __name__ == "__main__":
+    main()
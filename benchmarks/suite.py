@@ -0,0 +1,291 @@
+"""
+벤치마크 모음
+============
+테스트 대상 함수들의 성능 기준선을 재고, 기준선보다 느려지면 실패한다.
+
+    # 측정 후 기준선 저장
+    python -m benchmarks.suite --save benchmarks/baseline.json
+
+    # 측정 후 기준선과 비교 (25% 넘게 느려지면 종료 코드 1)
+    python -m benchmarks.suite --baseline benchmarks/baseline.json
+
+    # 일부만
+    python -m benchmarks.suite --cases add get_grade --sizes 1e3 1e5
+
+항목별로 다음을 기록한다.
+- ns_per_op: 호출 한 번당 시간 (입력 반복 비용 포함)
+- alloc_peak_bytes: tracemalloc으로 잰 최대 할당량 (최대 TRACE_LIMIT번 호출 기준)
+- alloc_blocks: 실행 후 남은 메모리 블록 수 변화 (sys.getallocatedblocks)
+- peak_rss_bytes: 프로세스 최대 RSS
+
+측정마다 새 프로세스를 띄우므로 RSS가 앞 측정의 영향을 받지 않는다.
+표준 라이브러리만 사용한다.
+"""
+
+import argparse
+import gc
+import json
+import platform
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+from itertools import cycle, islice
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parent.parent
+
+DEFAULT_SIZES = (10**3, 10**5, 10**7)
+DEFAULT_TOLERANCE = 0.25
+
+# 입력은 이 크기의 풀을 돌려 쓴다. 큰 n에서도 입력 때문에 메모리가 늘지 않음
+POOL_SIZE = 1000
+
+# tracemalloc은 느리므로 이 횟수까지만 추적한다
+TRACE_LIMIT = 10**5
+
+CASES = {}
+
+
+def case(name):
+    """
+    벤치마크 등록
+
+    등록 함수는 n을 받아서 "n번 호출하는 함수"를 반환한다.
+    준비 작업(import, 입력 생성)은 측정에서 빠진다.
+    """
+    def decorator(setup):
+        CASES[name] = setup
+        return setup
+    return decorator
+
+
+def _cycled(pool, n):
+    return islice(cycle(pool), n)
+
+
+@case("add")
+def _add(n):
+    from src.calculator import add
+    pairs = [(i, POOL_SIZE - i) for i in range(POOL_SIZE)]
+
+    def run():
+        for a, b in _cycled(pairs, n):
+            add(a, b)
+    return run
+
+
+@case("get_grade")
+def _get_grade(n):
+    from src.grading import get_grade
+    scores = [i % 101 for i in range(POOL_SIZE)]
+
+    def run():
+        for score in _cycled(scores, n):
+            get_grade(score)
+    return run
+
+
+@case("is_valid_username")
+def _is_valid_username(n):
+    from src.usernames import is_valid_username
+    names = ["abc", "user123", "", "ab", "abcdefghijk", "user@name", "홍길동", "abcdefghij"]
+
+    def run():
+        for name in _cycled(names, n):
+            is_valid_username(name)
+    return run
+
+
+@case("divide")
+def _divide(n):
+    from src.parsing import divide
+    pairs = [(i, i % 7 + 1) for i in range(POOL_SIZE)]
+
+    def run():
+        for a, b in _cycled(pairs, n):
+            divide(a, b)
+    return run
+
+
+@case("validate_score")
+def _validate_score(n):
+    from src.parsing import validate_score
+    scores = [i % 101 for i in range(POOL_SIZE)]
+
+    def run():
+        for score in _cycled(scores, n):
+            validate_score(score)
+    return run
+
+
+@case("parse")
+def _parse(n):
+    from src.parsing import parse
+    texts = [str(i) for i in range(POOL_SIZE)]
+
+    def run():
+        for text in _cycled(texts, n):
+            parse(text)
+    return run
+
+
+@case("cart_add")
+def _cart_add(n):
+    from src.cart import Cart
+    lines = [(f"상품{i}", 1000 + i) for i in range(POOL_SIZE)]
+
+    def run():
+        add = Cart().add
+        for name, price in _cycled(lines, n):
+            add(name, price)
+    return run
+
+
+@case("cart_update_qty")
+def _cart_update_qty(n):
+    from src.cart import Cart
+    cart = Cart.from_items(
+        {"name": f"상품{i}", "price": 1000, "qty": 1} for i in range(POOL_SIZE)
+    )
+    names = [item.name for item in cart]
+
+    def run():
+        update_qty = cart.update_qty
+        for i, name in enumerate(_cycled(names, n)):
+            update_qty(name, 1 + i % 5)
+    return run
+
+
+def measure(name, n):
+    """벤치마크 하나를 현재 프로세스에서 측정한다"""
+    run = CASES[name](n)
+
+    gc.collect()
+    blocks_before = sys.getallocatedblocks()
+    start = time.perf_counter_ns()
+    run()
+    elapsed = time.perf_counter_ns() - start
+    gc.collect()
+    blocks_after = sys.getallocatedblocks()
+
+    traced = CASES[name](min(n, TRACE_LIMIT))
+    tracemalloc.start()
+    try:
+        traced()
+        _, alloc_peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "case": name,
+        "n": n,
+        "ns_per_op": elapsed / n,
+        "seconds": elapsed / 1e9,
+        "alloc_peak_bytes": alloc_peak,
+        "alloc_blocks": blocks_after - blocks_before,
+        "peak_rss_bytes": _peak_rss(),
+    }
+
+
+def _peak_rss():
+    # 리눅스의 ru_maxrss 단위는 KB
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def measure_isolated(name, n):
+    """벤치마크 하나를 새 프로세스에서 측정한다"""
+    output = subprocess.run(
+        [sys.executable, "-m", "benchmarks.suite", "--worker", name, str(n)],
+        check=True, capture_output=True, text=True, cwd=ROOT,
+    ).stdout
+    return json.loads(output)
+
+
+def run_suite(cases, sizes, isolate=True, report=print):
+    results = []
+    for name in cases:
+        for n in sizes:
+            result = measure_isolated(name, n) if isolate else measure(name, n)
+            results.append(result)
+            report(format_result(result))
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+def format_result(result):
+    return (
+        f"{result['case']:<20} n={result['n']:<10,} "
+        f"{result['ns_per_op']:>10.1f} ns/op  "
+        f"alloc_peak={result['alloc_peak_bytes'] / 1024:>9.1f}KB  "
+        f"blocks={result['alloc_blocks']:>+7}  "
+        f"rss={result['peak_rss_bytes'] / 2**20:>7.1f}MB"
+    )
+
+
+def compare(current, baseline, tolerance=DEFAULT_TOLERANCE):
+    """
+    기준선보다 ns_per_op가 tolerance 비율 넘게 커진 항목의 설명 목록
+
+    기준선에 없는 항목은 비교하지 않는다.
+    """
+    expected = {(r["case"], r["n"]): r for r in baseline["results"]}
+    regressions = []
+    for result in current["results"]:
+        base = expected.get((result["case"], result["n"]))
+        if base is None:
+            continue
+        limit = base["ns_per_op"] * (1 + tolerance)
+        if result["ns_per_op"] > limit:
+            regressions.append(
+                f"{result['case']} n={result['n']:,}: "
+                f"{base['ns_per_op']:.1f} → {result['ns_per_op']:.1f} ns/op "
+                f"(+{result['ns_per_op'] / base['ns_per_op'] - 1:.0%})"
+            )
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="벤치마크 모음")
+    parser.add_argument("--cases", nargs="+", choices=sorted(CASES), default=list(CASES))
+    parser.add_argument("--sizes", nargs="+", type=float, default=DEFAULT_SIZES)
+    parser.add_argument("--save", metavar="PATH", help="결과를 JSON으로 저장")
+    parser.add_argument("--baseline", metavar="PATH", help="비교할 기준선 JSON")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument("--in-process", action="store_true",
+                        help="새 프로세스를 띄우지 않고 측정 (RSS가 누적됨)")
+    parser.add_argument("--worker", nargs=2, metavar=("CASE", "N"), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        name, n = args.worker
+        print(json.dumps(measure(name, int(n))))
+        return 0
+
+    sizes = [int(size) for size in args.sizes]
+    current = run_suite(args.cases, sizes, isolate=not args.in_process)
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(current, f, ensure_ascii=False, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(current, baseline, args.tolerance)
+        if regressions:
+            print(f"\n기준선 대비 {args.tolerance:.0%} 넘게 느려짐:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print("\n기준선 대비 성능 저하 없음")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
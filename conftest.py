@@ -0,0 +1,7 @@
+# 저장소 전체에서 쓰는 pytest 플러그인
+pytest_plugins = [
+    "src.plugins.parallel",
+    "src.plugins.lazy_params",
+    "src.plugins.profiler",
+    "src.plugins.incremental",
+]
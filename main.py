@@ -1,6 +1,236 @@
-def main():
-    print("Hello from testing-lab!")
+"""
+testing-lab 명령줄 도구
+=====================
+셸 반복문에서 수천 번 불려도 부담이 없도록, 명령에 필요한 모듈만 그때 import 한다.
+(argparse, json 등도 이 파일 맨 위에서는 import 하지 않는다)
+
+    python main.py grade 95 85 72          # 점수마다 등급 한 줄씩
+    python main.py grade --file scores.txt # 파일(- 이면 표준 입력)을 읽어 등급별 인원
+    python main.py validate abc user@x     # 사용자명 검사. 잘못된 것이 있으면 종료 코드 1
+    python main.py validate --score 50 120 # 점수 범위 검사
+    python main.py cart total items.json   # JSON 배열 또는 JSONL 장바구니의 합계
+    python main.py cart import orders.csv  # 주문 파일(CSV/JSONL)의 장바구니별 합계
+    python main.py bench --cases add       # benchmarks.suite에 그대로 넘김
+    python main.py serve                   # 상주 프로세스 (Unix 소켓, src/daemon.py 참고)
+    python main.py send grade 95 85        # 상주 프로세스에 요청. 없으면 직접 처리
+
+종료 코드: 0 정상, 1 잘못된 값 있음, 2 사용법 오류
+"""
+
+import sys
+
+
+USAGE = """사용법: python main.py <명령> [인자...]
+
+명령:
+  grade SCORE...           점수마다 등급 출력
+  grade --file PATH        파일(- 이면 표준 입력)의 점수를 읽어 등급별 인원 출력
+  validate NAME...         사용자명 검사
+  validate --score N...    점수가 0 ~ 100 사이인지 검사
+  cart total PATH          장바구니 파일(JSON 배열 또는 JSONL)의 합계
+  cart import PATH         주문 파일(CSV 또는 JSONL)의 장바구니별 합계 (cart_id, total, lines, first_line)
+  bench [옵션...]          벤치마크 실행 (python -m benchmarks.suite --help 참고)
+  serve [--socket PATH]    상주 프로세스로 요청을 받음 (NDJSON)
+  send OP ARG... [--socket PATH]
+                           상주 프로세스에 요청 (grade, validate, validate_score, parse)
+"""
+
+
+class UsageError(Exception):
+    """명령줄 인자가 잘못됨 (종료 코드 2)"""
+
+
+def cmd_grade(args):
+    if args[:1] == ["--file"]:
+        if len(args) != 2:
+            raise UsageError("grade --file 에는 경로 하나가 필요함")
+        from src.grading import grade_stream
+
+        source = sys.stdin if args[1] == "-" else args[1]
+        try:
+            report = grade_stream(source)
+        except (OSError, ValueError) as e:  # 파일 없음, 인코딩 오류
+            print(f"{args[1]}: {e}", file=sys.stderr)
+            return 1
+        for label, count in reversed(report.grade_counts().items()):
+            print(f"{label}\t{count}")
+        for line_no, raw, message in report.errors:
+            print(f"{line_no}번 줄 {raw.strip()!r}: {message}", file=sys.stderr)
+        return 1 if report.error_count else 0
+
+    if not args:
+        raise UsageError("grade 에는 점수가 하나 이상 필요함")
+    from src.grading import get_grade
+    from src.parsing import validate_score
+
+    status = 0
+    for raw in args:
+        try:
+            print(get_grade(validate_score(int(raw))))
+        except ValueError as e:
+            print(f"{raw}: {e}", file=sys.stderr)
+            status = 1
+    return status
+
+
+def cmd_validate(args):
+    if args[:1] == ["--score"]:
+        return _validate_scores(args[1:])
+    if not args:
+        raise UsageError("validate 에는 사용자명이 하나 이상 필요함")
+    from src.usernames import is_valid_username
+
+    status = 0
+    for name in args:
+        if not is_valid_username(name):
+            print(f"{name}: 잘못된 사용자명", file=sys.stderr)
+            status = 1
+    return status
+
+
+def _validate_scores(args):
+    if not args:
+        raise UsageError("validate --score 에는 점수가 하나 이상 필요함")
+    from src.parsing import validate_score
+
+    status = 0
+    for raw in args:
+        try:
+            validate_score(int(raw))
+        except ValueError as e:
+            print(f"{raw}: {e}", file=sys.stderr)
+            status = 1
+    return status
+
+
+def cmd_cart(args):
+    if len(args) != 2 or args[0] not in ("total", "import"):
+        raise UsageError("cart total PATH 또는 cart import PATH 형식이어야 함")
+    if args[0] == "import":
+        return _import_carts(args[1])
+    import json
+
+    from src.cart import Cart
+
+    try:
+        with open(args[1], encoding="utf-8") as f:
+            text = f.read()
+        if text.lstrip().startswith("["):
+            items = json.loads(text)
+        else:
+            items = [json.loads(line) for line in text.splitlines() if line.strip()]
+        cart = Cart.from_items(items)
+    except (OSError, KeyError, TypeError, ValueError) as e:  # JSON 오류는 ValueError
+        print(f"{args[1]}: {e}", file=sys.stderr)
+        return 1
+    print(cart.total)
+    return 0
+
+
+def _import_carts(path):
+    from src.cart_import import import_carts, write_totals
+
+    result = import_carts(path)
+    try:
+        write_totals(result, sys.stdout)
+    except OSError as e:  # 파일은 읽기 시작할 때 연다
+        print(f"{path}: {e}", file=sys.stderr)
+        return 1
+    for line_no, raw, message in result.errors:
+        print(f"{line_no}번 줄 {raw.strip()!r}: {message}", file=sys.stderr)
+    if result.error_count > len(result.errors):
+        print(f"... 오류 {result.error_count}개 중 {len(result.errors)}개만 표시", file=sys.stderr)
+    return 1 if result.error_count else 0
+
+
+def cmd_bench(args):
+    from benchmarks.suite import main as bench_main
+
+    return bench_main(args)
+
+
+def _pop_socket(args):
+    """args에서 --socket PATH를 빼고 (나머지, 경로)를 반환한다"""
+    if "--socket" not in args:
+        return args, None
+    i = args.index("--socket")
+    if i + 1 >= len(args):
+        raise UsageError("--socket 에는 경로가 필요함")
+    return args[:i] + args[i + 2:], args[i + 1]
+
+
+def cmd_serve(args):
+    args, path = _pop_socket(args)
+    if args:
+        raise UsageError("serve 는 --socket 외의 인자를 받지 않음")
+    from src.daemon import serve
+
+    try:
+        serve(path, ready=lambda server: print(f"대기 중: {server.server_address}", flush=True))
+    except RuntimeError as e:
+        print(e, file=sys.stderr)
+        return 1
+    return 0
+
+
+def cmd_send(args):
+    args, path = _pop_socket(args)
+    if not args:
+        raise UsageError("send 에는 op가 필요함")
+    from src.daemon import Client
+
+    with Client(path) as client:
+        response = client.request(args[0], args[1:])
+    if not response["ok"]:
+        print(response["error"], file=sys.stderr)
+        return 1
+    result = response["result"]
+    if not isinstance(result, list):  # ping
+        print(result)
+        return 0
+    status = 0
+    for raw, value in zip(args[1:], result):
+        if isinstance(value, dict):
+            print(f"{raw}: {value['error']}", file=sys.stderr)
+            status = 1
+        elif isinstance(value, bool):
+            print("true" if value else "false")
+            if not value:  # 같은 검사를 직접 실행할 때(validate)처럼 실패로 끝낸다
+                status = 1
+        else:
+            print(value)
+    return status
+
+
+COMMANDS = {
+    "grade": cmd_grade,
+    "validate": cmd_validate,
+    "cart": cmd_cart,
+    "bench": cmd_bench,
+    "serve": cmd_serve,
+    "send": cmd_send,
+}
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if not argv:
+        print(USAGE, end="", file=sys.stderr)
+        return 2
+    if argv[0] in ("-h", "--help", "help"):
+        print(USAGE, end="")
+        return 0
+
+    command = COMMANDS.get(argv[0])
+    if command is None:
+        print(f"알 수 없는 명령: {argv[0]}\n\n{USAGE}", end="", file=sys.stderr)
+        return 2
+    try:
+        return command(argv[1:])
+    except UsageError as e:
+        print(f"{e}\n\n{USAGE}", end="", file=sys.stderr)
+        return 2
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
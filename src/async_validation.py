@@ -0,0 +1,169 @@
+"""
+비동기 검사
+==========
+asyncio 서버에서 요청마다 들어오는 사용자명/점수 묶음을 검사한다.
+
+    names_ok = await avalidate_usernames(["abc", "user@x"])   # [True, False]
+    scores_ok = await avalidate_scores([95, 101])              # [True, False]
+
+동시에 들어온 요청들을 짧은 시간(window) 동안 모아서 한 번에 검사한다
+(마이크로 배치). 호출 비용이 요청 수가 아니라 배치 수만큼 든다.
+
+모인 값이 offload_threshold개 이상이면 이벤트 루프 밖(executor)에서 검사한다.
+그래서 큰 묶음이 들어와도 다른 요청 처리가 멈추지 않는다.
+기본 executor는 스레드 풀이고, 큰 묶음은 offload_threshold개씩 잘라서
+한 번에 concurrency개(기본 1)씩 넘긴다. CPU를 더 쓰려면 프로세스 풀과
+워커 수만큼의 concurrency를 넘긴다.
+
+    service = ValidationService(window=0.005, executor=new_pool(4), concurrency=4)
+    await avalidate_usernames(names, service=service)
+"""
+
+import asyncio
+import weakref
+from itertools import chain
+
+from .parsing import validate_scores
+from .usernames import validate_usernames
+
+
+DEFAULT_WINDOW = 0.002          # 초
+DEFAULT_MAX_BATCH = 50_000      # 모인 값이 이만큼 되면 window를 기다리지 않음
+DEFAULT_OFFLOAD_THRESHOLD = 10_000
+
+
+class MicroBatcher:
+    """
+    여러 호출자의 값을 모아서 func(값 목록) → 결과 목록 한 번으로 처리한다
+
+    func는 입력과 같은 길이의 결과 리스트를 반환해야 한다.
+    프로세스 풀에 넘기려면 모듈 최상위 함수여야 한다 (pickle 가능).
+    """
+
+    def __init__(self, func, window=DEFAULT_WINDOW, max_batch=DEFAULT_MAX_BATCH,
+                 offload_threshold=DEFAULT_OFFLOAD_THRESHOLD, executor=None, concurrency=1):
+        if window < 0:
+            raise ValueError("window는 음수일 수 없음")
+        if min(max_batch, offload_threshold, concurrency) < 1:
+            raise ValueError("max_batch, offload_threshold, concurrency는 1 이상이어야 함")
+        self.func = func
+        self.window = window
+        self.max_batch = max_batch
+        self.offload_threshold = offload_threshold
+        self.executor = executor
+        self.concurrency = concurrency
+        self.calls = 0      # submit 횟수
+        self.batches = 0    # func 호출 묶음 수
+        self._pending = []  # (값 목록, future)
+        self._size = 0
+        self._timer = None
+        self._tasks = set()
+
+    def __repr__(self):
+        return f"MicroBatcher({self.func.__name__}, calls={self.calls}, batches={self.batches})"
+
+    async def submit(self, items):
+        """items를 다음 배치에 넣고 결과를 기다린다"""
+        if type(items) is not list:
+            items = list(items)
+        if not items:
+            return []
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((items, future))
+        self._size += len(items)
+        self.calls += 1
+        if self._size >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+        return await future
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        pending, self._pending, self._size = self._pending, [], 0
+        if not pending:
+            return
+        self.batches += 1
+        task = asyncio.get_running_loop().create_task(self._run(pending))
+        self._tasks.add(task)  # 실행 중인 태스크가 GC되지 않게
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, pending):
+        if len(pending) == 1:
+            combined = pending[0][0]
+        else:
+            combined = list(chain.from_iterable(items for items, _ in pending))
+        try:
+            results = await self._call(combined)
+        except Exception:
+            # 한 호출자의 잘못된 값 때문에 다른 호출자까지 실패하지 않게 따로 처리
+            for items, future in pending:
+                try:
+                    result = await self._call(items)
+                except Exception as e:
+                    if not future.done():
+                        future.set_exception(e)
+                else:
+                    if not future.done():
+                        future.set_result(result)
+            return
+
+        start = 0
+        for items, future in pending:
+            end = start + len(items)
+            if not future.done():  # 호출자가 취소했으면 버린다
+                future.set_result(results[start:end])
+            start = end
+
+    async def _call(self, items):
+        if len(items) < self.offload_threshold:
+            return self.func(items)
+        loop = asyncio.get_running_loop()
+        step = self.offload_threshold
+        chunks = [items[i:i + step] for i in range(0, len(items), step)]
+        parts = []
+        # 한 번에 concurrency개 조각만 executor에 넘긴다.
+        # 스레드 풀에서 조각을 한꺼번에 돌리면 스레드들이 GIL을 두고 루프와 경쟁해서
+        # 오히려 루프가 더 오래 멈춘다
+        for i in range(0, len(chunks), self.concurrency):
+            parts += await asyncio.gather(*(
+                loop.run_in_executor(self.executor, self.func, chunk)
+                for chunk in chunks[i:i + self.concurrency]
+            ))
+        return list(chain.from_iterable(parts))
+
+
+class ValidationService:
+    """사용자명/점수 MicroBatcher 한 쌍 (같은 설정)"""
+
+    def __init__(self, window=DEFAULT_WINDOW, max_batch=DEFAULT_MAX_BATCH,
+                 offload_threshold=DEFAULT_OFFLOAD_THRESHOLD, executor=None, concurrency=1):
+        options = dict(window=window, max_batch=max_batch, offload_threshold=offload_threshold,
+                       executor=executor, concurrency=concurrency)
+        self.usernames = MicroBatcher(validate_usernames, **options)
+        self.scores = MicroBatcher(validate_scores, **options)
+
+
+# 이벤트 루프마다 기본 서비스 하나 (future는 만든 루프에서만 쓸 수 있다)
+_services = weakref.WeakKeyDictionary()
+
+
+def default_service():
+    loop = asyncio.get_running_loop()
+    service = _services.get(loop)
+    if service is None:
+        service = _services[loop] = ValidationService()
+    return service
+
+
+async def avalidate_usernames(usernames, service=None):
+    """사용자명 여러 개를 검사한다. validate_usernames와 같은 결과"""
+    return await (service or default_service()).usernames.submit(usernames)
+
+
+async def avalidate_scores(scores, service=None):
+    """점수 여러 개를 검사한다. validate_scores와 같은 결과"""
+    return await (service or default_service()).scores.submit(scores)
@@ -0,0 +1,187 @@
+"""
+경계값 탐색
+==========
+구간으로 값을 분류하는 함수(get_grade, validate_score 등)의 결정 경계를
+이진 탐색으로 찾고, 경계 ±1 값만 모아서 한 번에 검사한다.
+
+0 ~ 100을 전부 돌리는 대신 (구간 수 × log 범위)번만 호출하므로
+32비트 정수 전체나 실수 범위에도 바로 쓸 수 있다.
+
+    result = sweep(get_grade, 0, 100)
+    [b.value for b in result.boundaries]   # [60, 70, 80, 90]
+    result.points                          # 0, 59, 60, 61, 69, 70, ... 100
+
+    # 예외도 하나의 구간으로 취급한다 (예외 종류 + 메시지가 같으면 같은 구간)
+    sweep(validate_score, INT32_MIN, INT32_MAX, key=lambda value: "ok")
+
+    # 실수: 경계 ±1 대신 바로 옆의 실수(math.nextafter)를 검사한다
+    sweep(get_grade, 0.0, 100.0, domain="float")
+
+전제: 각 구간은 한 덩어리다 (같은 결과가 떨어진 두 곳에 나오지 않음).
+처음에 probes개 지점을 고르게 찍어 보므로, 그 간격보다 넓은 구간은
+떨어져 있어도 찾는다.
+"""
+
+import math
+import struct
+from array import array
+from collections import namedtuple
+
+
+INT32_MIN = -(2**31)
+INT32_MAX = 2**31 - 1
+
+DOMAINS = ("int", "float")
+
+DEFAULT_PROBES = 17
+
+# 경계: value부터 결과가 below → above로 바뀐다
+Boundary = namedtuple("Boundary", "value below above")
+
+# 함수가 예외를 던진 결과
+Raised = namedtuple("Raised", "type message")
+
+# points: 검사한 값 (정렬), outcomes: 값마다 결과, calls: 함수 호출 횟수
+# mismatches: batch 결과가 하나씩 호출한 결과와 다른 [(값, 하나씩, batch), ...]
+SweepResult = namedtuple("SweepResult", "boundaries points outcomes calls mismatches")
+
+
+def outcome(func, x, key=None):
+    """func(x)의 결과. 예외는 Raised로, 반환값은 key(반환값)로 바꾼다"""
+    try:
+        value = func(x)
+    except Exception as e:
+        return Raised(type(e), str(e))
+    return value if key is None else key(value)
+
+
+class _Domain:
+    """값 ↔ 순서 번호(정수) 변환. 이웃한 값의 번호가 1 차이 난다"""
+
+    __slots__ = ("name", "to_ordinal", "from_ordinal", "typecode")
+
+    def __init__(self, name, to_ordinal, from_ordinal, typecode):
+        self.name = name
+        self.to_ordinal = to_ordinal
+        self.from_ordinal = from_ordinal
+        self.typecode = typecode
+
+
+_SIGN = 1 << 63
+_DOUBLE = struct.Struct("<d")
+_BITS = struct.Struct("<Q")
+
+
+def _float_ordinal(x):
+    """실수의 순서 번호. 0.0과 -0.0은 같은 번호(0)"""
+    if math.isnan(x):
+        raise ValueError("NaN은 범위로 쓸 수 없음")
+    (bits,) = _BITS.unpack(_DOUBLE.pack(x))
+    return -(bits ^ _SIGN) if bits & _SIGN else bits
+
+
+def _ordinal_float(n):
+    bits = (-n) | _SIGN if n < 0 else n
+    return _DOUBLE.unpack(_BITS.pack(bits))[0]
+
+
+_DOMAINS = {
+    "int": _Domain("int", int, int, "q"),
+    "float": _Domain("float", _float_ordinal, _ordinal_float, "d"),
+}
+
+
+def find_boundaries(func, lo, hi, domain="int", key=None, probes=DEFAULT_PROBES, _cache=None):
+    """
+    [lo, hi] 범위에서 func의 결과가 바뀌는 지점을 모두 찾는다
+
+    반환값은 Boundary 목록 (value 순서)
+    """
+    if domain not in _DOMAINS:
+        raise ValueError(f"domain은 {DOMAINS} 중 하나여야 함")
+    if probes < 2:
+        raise ValueError("probes는 2 이상이어야 함")
+    dom = _DOMAINS[domain]
+    start, stop = dom.to_ordinal(lo), dom.to_ordinal(hi)
+    if start > stop:
+        raise ValueError("lo가 hi보다 클 수 없음")
+
+    cache = {} if _cache is None else _cache
+
+    def at(n):
+        try:
+            return cache[n]
+        except KeyError:
+            result = cache[n] = outcome(func, dom.from_ordinal(n), key)
+            return result
+
+    # 고르게 찍은 지점 사이에서 결과가 다르면 그 사이를 이진 탐색한다
+    span = stop - start
+    marks = sorted({start + span * i // (probes - 1) for i in range(probes)})
+    found = []
+    for left, right in zip(marks, marks[1:]):
+        _bisect(at, left, right, found)
+    return [Boundary(dom.from_ordinal(n), at(n - 1), at(n)) for n in found]
+
+
+def _bisect(at, left, right, found):
+    """at(left) != at(right)인 구간을 좁혀서 경계(새 결과가 시작되는 번호)를 모은다"""
+    stack = [(left, right)]
+    while stack:
+        left, right = stack.pop()
+        if at(left) == at(right):
+            continue
+        if right - left == 1:
+            found.append(right)
+            continue
+        mid = left + (right - left) // 2
+        # 오른쪽을 먼저 넣어야 왼쪽부터 꺼내져서 결과가 정렬된다
+        stack.append((mid, right))
+        stack.append((left, mid))
+
+
+def boundary_points(boundaries, lo, hi, domain="int"):
+    """
+    양 끝과 경계 ±1 값 (정렬, 중복 없음, 범위 안)
+
+    정수는 array('q'), 실수는 array('d')를 반환한다.
+    64비트를 넘는 정수가 있으면 list를 반환한다.
+    """
+    dom = _DOMAINS[domain]
+    start, stop = dom.to_ordinal(lo), dom.to_ordinal(hi)
+    ordinals = {start, stop}
+    for boundary in boundaries:
+        n = dom.to_ordinal(boundary.value)
+        ordinals.update(m for m in (n - 1, n, n + 1) if start <= m <= stop)
+    values = [dom.from_ordinal(n) for n in sorted(ordinals)]
+    try:
+        return array(dom.typecode, values)
+    except OverflowError:
+        return values
+
+
+def sweep(func, lo, hi, domain="int", key=None, batch=None, probes=DEFAULT_PROBES):
+    """
+    경계를 찾고, 양 끝과 경계 ±1 값의 결과를 한 번에 구한다
+
+    batch: 값 목록을 받아서 결과 목록을 반환하는 함수 (예: grade_many + decode)
+           주면 func를 하나씩 호출한 결과와 비교해서 다른 값을 mismatches에 담는다
+    """
+    cache = {}
+    boundaries = find_boundaries(func, lo, hi, domain, key, probes, _cache=cache)
+    points = boundary_points(boundaries, lo, hi, domain)
+
+    to_ordinal = _DOMAINS[domain].to_ordinal
+    outcomes = []
+    for value in points:
+        n = to_ordinal(value)
+        if n not in cache:
+            cache[n] = outcome(func, value, key)
+        outcomes.append(cache[n])
+
+    mismatches = []
+    if batch is not None:
+        for value, expected, actual in zip(points, outcomes, batch(points)):
+            if expected != actual:
+                mismatches.append((value, expected, actual))
+    return SweepResult(boundaries, points, outcomes, len(cache), mismatches)
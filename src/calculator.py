@@ -0,0 +1,205 @@
+"""
+계산기
+=====
+이름으로 연산을 등록하고 꺼내 쓰는 계산기.
+
+- 연산마다 결과 캐시(LRU, 크기 제한)를 켤 수 있다
+- 캐시 적중/실패/제거 횟수를 연산별로 확인할 수 있다
+- add_many, multiply_many: 같은 길이의 두 수열을 원소별로 한 번에 계산
+
+    calc = Calculator()
+    calc.register("add", add)
+    calc.register("price", expensive_price, cache_size=1024)
+    calc["price"](sku, qty)
+    calc.stats("price")  # CacheStats(hits=..., misses=..., evictions=..., ...)
+"""
+
+import operator
+from array import array
+from collections import namedtuple
+from functools import lru_cache, wraps
+
+try:
+    import numpy as np
+except ImportError:  # numpy는 선택 의존성
+    np = None
+
+
+CacheStats = namedtuple("CacheStats", ["hits", "misses", "evictions", "size", "maxsize"])
+
+
+class _CachedOperation:
+    """
+    lru_cache로 감싼 연산
+
+    lru_cache는 C로 구현되어 있어서 적중 시 비용이 dict 조회 한 번 수준이다.
+    캐시를 비우면 lru_cache의 카운터도 0이 되므로, 비우기 전 값을 따로 누적한다.
+
+    제거 횟수는 lru_cache가 알려 주지 않으므로 실패(계산) 때만 도는 함수에서 센다.
+    계산이 끝났을 때 캐시가 이미 가득 차 있으면 결과를 넣으면서 가장 오래된 것이 밀려난다.
+    예외가 난 호출은 저장되지 않으므로 세지 않는다.
+    """
+
+    __slots__ = ("func", "cached", "_hits", "_misses", "_evictions")
+
+    def __init__(self, func, maxsize):
+        self.func = func
+        self._hits = self._misses = self._evictions = 0
+
+        @wraps(func)
+        def compute(*args, **kwargs):
+            result = func(*args, **kwargs)
+            if self.cached.cache_info().currsize >= maxsize:
+                self._evictions += 1
+            return result
+
+        self.cached = lru_cache(maxsize=maxsize)(compute)
+
+    def stats(self):
+        info = self.cached.cache_info()
+        return CacheStats(
+            hits=self._hits + info.hits,
+            misses=self._misses + info.misses,
+            evictions=self._evictions,
+            size=info.currsize,
+            maxsize=info.maxsize,
+        )
+
+    def clear(self):
+        info = self.cached.cache_info()
+        self._hits += info.hits
+        self._misses += info.misses
+        self.cached.cache_clear()
+
+
+class Calculator:
+    """연산 등록소. calc["add"](2, 3) 처럼 딕셔너리처럼 꺼내 쓴다"""
+
+    def __init__(self):
+        self._ops = {}       # 이름 → 호출할 함수 (캐시가 있으면 캐시 함수)
+        self._cached = {}    # 이름 → _CachedOperation
+
+    def register(self, name, func, cache_size=None):
+        """
+        연산을 등록한다
+
+        cache_size를 주면 최근 결과 cache_size개를 기억한다.
+        인자는 해시 가능해야 한다 (list, dict 인자는 TypeError).
+        """
+        if name in self._ops:
+            raise ValueError(f"이미 등록된 연산: {name}")
+        if cache_size is None:
+            self._ops[name] = func
+            return func
+        if type(cache_size) is not int or cache_size <= 0:
+            raise ValueError("캐시 크기는 양의 정수여야 함")
+        op = _CachedOperation(func, cache_size)
+        self._cached[name] = op
+        self._ops[name] = op.cached
+        return op.cached
+
+    def operation(self, name=None, cache_size=None):
+        """데코레이터로 등록한다. 이름을 안 주면 함수 이름을 쓴다"""
+        def decorator(func):
+            self.register(name or func.__name__, func, cache_size)
+            return func
+        return decorator
+
+    def __getitem__(self, name):
+        return self._ops[name]
+
+    def __contains__(self, name):
+        return name in self._ops
+
+    def __iter__(self):
+        return iter(self._ops)
+
+    def __len__(self):
+        return len(self._ops)
+
+    def stats(self, name=None):
+        """
+        캐시 통계
+
+        name을 주면 해당 연산의 CacheStats (캐시가 없으면 None),
+        안 주면 캐시를 쓰는 모든 연산의 {이름: CacheStats}.
+        """
+        if name is None:
+            return {n: op.stats() for n, op in self._cached.items()}
+        if name not in self._ops:
+            raise KeyError(name)
+        op = self._cached.get(name)
+        return None if op is None else op.stats()
+
+    def clear_cache(self, name=None):
+        """캐시를 비운다. name을 안 주면 모든 연산의 캐시를 비운다"""
+        if name is None:
+            for op in self._cached.values():
+                op.clear()
+            return
+        if name not in self._ops:
+            raise KeyError(name)
+        op = self._cached.get(name)
+        if op is not None:
+            op.clear()
+
+
+def add(a, b):
+    return a + b
+
+
+def multiply(a, b):
+    return a * b
+
+
+def default_calculator(cache_size=None):
+    """calculator fixture와 같은 add/multiply 계산기"""
+    calc = Calculator()
+    calc.register("add", add, cache_size)
+    calc.register("multiply", multiply, cache_size)
+    return calc
+
+
+def add_many(a, b):
+    """
+    두 수열을 원소별로 더한다 (add의 일괄 버전)
+
+    numpy 배열이 섞여 있으면 numpy 배열을, 아니면 array를 반환한다.
+    """
+    return _elementwise(operator.add, a, b, "add")
+
+
+def multiply_many(a, b):
+    """두 수열을 원소별로 곱한다 (multiply의 일괄 버전)"""
+    return _elementwise(operator.mul, a, b, "multiply")
+
+
+_FLOAT_TYPECODES = frozenset("fd")
+
+
+def _elementwise(op, a, b, np_name):
+    if len(a) != len(b):
+        raise ValueError(f"길이가 다름 ({len(a)} != {len(b)})")
+    if np is not None and (isinstance(a, np.ndarray) or isinstance(b, np.ndarray)):
+        return getattr(np, np_name)(np.asarray(a), np.asarray(b))
+
+    if isinstance(a, array) and isinstance(b, array):
+        # 타입을 이미 알고 있으므로 중간 리스트 없이 바로 만든다
+        is_float = a.typecode in _FLOAT_TYPECODES or b.typecode in _FLOAT_TYPECODES
+        try:
+            return array("d" if is_float else "q", map(op, a, b))
+        except OverflowError:
+            return list(map(op, a, b))
+
+    values = list(map(op, a, b))
+    # 정수 → 실수 순서로 시도. 64비트를 넘는 정수나 Decimal 등은 리스트 그대로
+    try:
+        return array("q", values)
+    except OverflowError:
+        return values
+    except TypeError:
+        pass
+    # array("d")는 Decimal, Fraction도 받아서 float으로 바꿔 버리므로 직접 확인한다
+    if all(type(value) in (int, float) for value in values):
+        return array("d", values)
+    return values
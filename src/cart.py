@@ -0,0 +1,385 @@
+"""
+장바구니
+=======
+상품을 담고 합계를 계산하는 장바구니.
+
+- 가격은 정수(최소 화폐 단위, 원/센트)로만 다룬다. 실수 오차 없음
+- 합계는 변경될 때마다 차액만 반영한다. total 조회는 O(1)
+- 상품은 이름으로 색인한다. 수정/삭제 시 목록을 다시 훑지 않음
+
+- Cart: 상품 한 줄 = LineItem 객체 하나
+- ColumnarCart: 상품명/단가/수량을 각각 배열 하나씩에 저장 (대량 장바구니용)
+"""
+
+from array import array
+from decimal import Decimal, ROUND_HALF_UP
+from operator import mul
+
+try:
+    import numpy as np
+except ImportError:  # numpy는 선택 의존성
+    np = None
+
+
+def to_cents(amount, scale=100):
+    """
+    금액을 정수 최소 단위로 변환한다
+
+    "10.99" → 1099, Decimal("0.5") → 50
+    float는 str()로 바꿔서 변환한다 (0.1 + 0.2 같은 오차 방지)
+    """
+    if type(amount) is int:
+        return amount * scale
+    if isinstance(amount, float):
+        amount = str(amount)
+    cents = (Decimal(amount) * scale).quantize(Decimal(1), rounding=ROUND_HALF_UP)
+    return int(cents)
+
+
+class LineItem:
+    """장바구니 한 줄 (상품명, 단가, 수량)"""
+
+    __slots__ = ("name", "price", "qty")
+
+    def __init__(self, name, price, qty):
+        self.name = name
+        self.price = price
+        self.qty = qty
+
+    def __repr__(self):
+        return f"LineItem({self.name!r}, price={self.price}, qty={self.qty})"
+
+    def __eq__(self, other):
+        if not isinstance(other, LineItem):
+            return NotImplemented
+        return (self.name, self.price, self.qty) == (other.name, other.price, other.qty)
+
+    @property
+    def subtotal(self):
+        return self.price * self.qty
+
+    def to_dict(self):
+        return {"name": self.name, "price": self.price, "qty": self.qty}
+
+
+def apply_rate(amount, rate_bp):
+    """
+    금액에 비율(bp, 1/10000)을 곱하고 반올림한다. 정수 연산만 사용
+
+    apply_rate(1000, 1000) → 100 (10%)
+    """
+    return (amount * rate_bp * 2 + 10000) // 20000
+
+
+def _check_rate(rate_bp):
+    if type(rate_bp) is not int:
+        raise TypeError("비율은 정수(bp)만 가능")
+    if not 0 <= rate_bp <= 10000:
+        raise ValueError("비율은 0 ~ 10000bp 사이여야 함")
+
+
+_INT64_MAX = (1 << 63) - 1
+
+
+def _check_price(price):
+    if type(price) is not int:
+        raise TypeError("가격은 정수(최소 화폐 단위)만 가능")
+    if price < 0:
+        raise ValueError("가격은 음수 불가")
+
+
+def _check_qty(qty):
+    if type(qty) is not int:
+        raise TypeError("수량은 정수만 가능")
+    if qty < 0:
+        raise ValueError("수량은 음수 불가")
+
+
+class Cart:
+    """
+    장바구니
+
+    cart = Cart()
+    cart.add("사과", 1000, 3)
+    cart.add("바나나", 500, 5)
+    cart.total  # 5500
+    """
+
+    __slots__ = ("_items", "_total")
+
+    def __init__(self):
+        self._items = {}  # 상품명 → LineItem (추가한 순서 유지)
+        self._total = 0
+
+    @classmethod
+    def from_items(cls, items):
+        """{"name", "price", "qty"} 딕셔너리 목록으로 장바구니를 만든다"""
+        cart = cls()
+        for item in items:
+            cart.add(item["name"], item["price"], item["qty"])
+        return cart
+
+    def __repr__(self):
+        return f"Cart({len(self._items)} items, total={self._total})"
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, name):
+        return name in self._items
+
+    def __iter__(self):
+        return iter(self._items.values())
+
+    def __getitem__(self, name):
+        return self._items[name]
+
+    @property
+    def total(self):
+        return self._total
+
+    @property
+    def items(self):
+        return list(self._items.values())
+
+    def add(self, name, price, qty=1):
+        """
+        상품을 담는다
+
+        이미 있는 상품이면 수량만 늘린다. 이때 단가가 다르면 ValueError.
+        """
+        _check_price(price)
+        _check_qty(qty)
+        item = self._items.get(name)
+        if item is None:
+            self._items[name] = LineItem(name, price, qty)
+        elif item.price != price:
+            raise ValueError(f"{name}: 단가가 다름 ({item.price} != {price})")
+        else:
+            item.qty += qty
+        self._total += price * qty
+
+    def remove(self, name):
+        """상품을 뺀다. 없는 상품이면 KeyError"""
+        item = self._items.pop(name)
+        self._total -= item.price * item.qty
+
+    def update_qty(self, name, qty):
+        """수량을 바꾼다. 0이면 상품을 뺀다"""
+        _check_qty(qty)
+        item = self._items[name]
+        if qty == 0:
+            self.remove(name)
+            return
+        self._total += item.price * (qty - item.qty)
+        item.qty = qty
+
+    def clear(self):
+        self._items.clear()
+        self._total = 0
+
+    def to_dict(self):
+        """fixture와 같은 {"items": [...], "total": ...} 형태로 변환한다"""
+        return {
+            "items": [item.to_dict() for item in self._items.values()],
+            "total": self._total,
+        }
+
+
+class ColumnarCart:
+    """
+    열(column) 단위로 저장하는 장바구니
+
+    Cart와 같은 방식으로 쓴다. 대신 상품마다 객체를 만들지 않고
+    상품명은 list, 단가/수량은 array('q')에 같은 위치(행)로 나란히 저장한다.
+
+        names  = ["사과", "바나나"]
+        prices = array('q', [1000, 500])
+        qtys   = array('q', [3, 5])
+
+    - 상품 한 줄의 메모리가 dict/객체 대비 훨씬 작다
+    - 합계, 할인, 세금은 배열 전체를 한 번에 계산한다
+    - remove는 마지막 행을 빈 자리로 옮긴다 (O(1)). 그래서 순서가 바뀔 수 있다
+    """
+
+    __slots__ = ("names", "prices", "qtys", "_index", "_total")
+
+    def __init__(self):
+        self.names = []
+        self.prices = array("q")
+        self.qtys = array("q")
+        self._index = {}  # 상품명 → 행 번호
+        self._total = 0
+
+    @classmethod
+    def from_items(cls, items):
+        """{"name", "price", "qty"} 딕셔너리 목록으로 장바구니를 만든다"""
+        cart = cls()
+        for item in items:
+            cart.add(item["name"], item["price"], item["qty"])
+        return cart
+
+    @classmethod
+    def from_columns(cls, names, prices, qtys):
+        """
+        열 데이터로 한 번에 장바구니를 만든다
+
+        상품명은 중복이 없어야 한다. 합계는 마지막에 한 번만 계산한다.
+        """
+        cart = cls()
+        cart.names = list(names)
+        cart.prices = array("q", prices)
+        cart.qtys = array("q", qtys)
+        if not len(cart.names) == len(cart.prices) == len(cart.qtys):
+            raise ValueError("열 길이가 다름")
+        cart._index = {name: row for row, name in enumerate(cart.names)}
+        if len(cart._index) != len(cart.names):
+            raise ValueError("상품명 중복 불가")
+        if cart.prices and min(cart.prices) < 0:
+            raise ValueError("가격은 음수 불가")
+        if cart.qtys and min(cart.qtys) < 0:
+            raise ValueError("수량은 음수 불가")
+        cart._total = cart.recompute_total()
+        return cart
+
+    def __repr__(self):
+        return f"ColumnarCart({len(self.names)} items, total={self._total})"
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, name):
+        return name in self._index
+
+    def __iter__(self):
+        return map(LineItem, self.names, self.prices, self.qtys)
+
+    def __getitem__(self, name):
+        row = self._index[name]
+        return LineItem(name, self.prices[row], self.qtys[row])
+
+    @property
+    def total(self):
+        return self._total
+
+    @property
+    def items(self):
+        return list(self)
+
+    def add(self, name, price, qty=1):
+        """
+        상품을 담는다
+
+        이미 있는 상품이면 수량만 늘린다. 이때 단가가 다르면 ValueError.
+        """
+        _check_price(price)
+        _check_qty(qty)
+        # 열 하나에만 들어가고 실패하면 열 길이가 어긋나므로 미리 검사한다
+        if price > _INT64_MAX or qty > _INT64_MAX:
+            raise OverflowError("가격/수량이 64비트 정수 범위를 넘음")
+        row = self._index.get(name)
+        if row is None:
+            self.prices.append(price)
+            self.qtys.append(qty)
+            self._index[name] = len(self.names)
+            self.names.append(name)
+        elif self.prices[row] != price:
+            raise ValueError(f"{name}: 단가가 다름 ({self.prices[row]} != {price})")
+        else:
+            self.qtys[row] += qty
+        self._total += price * qty
+
+    def remove(self, name):
+        """상품을 뺀다. 없는 상품이면 KeyError"""
+        row = self._index.pop(name)
+        self._total -= self.prices[row] * self.qtys[row]
+        last_name = self.names.pop()
+        last_price = self.prices.pop()
+        last_qty = self.qtys.pop()
+        if row < len(self.names):
+            # 마지막 행을 빈 자리로 옮긴다
+            self.names[row] = last_name
+            self.prices[row] = last_price
+            self.qtys[row] = last_qty
+            self._index[last_name] = row
+
+    def update_qty(self, name, qty):
+        """수량을 바꾼다. 0이면 상품을 뺀다"""
+        _check_qty(qty)
+        row = self._index[name]
+        if qty == 0:
+            self.remove(name)
+            return
+        old_qty = self.qtys[row]
+        self.qtys[row] = qty  # 범위를 넘으면 여기서 OverflowError (합계는 그대로)
+        self._total += self.prices[row] * (qty - old_qty)
+
+    def clear(self):
+        self.names.clear()
+        del self.prices[:]
+        del self.qtys[:]
+        self._index.clear()
+        self._total = 0
+
+    def subtotals(self):
+        """
+        행별 소계(단가 x 수량) 배열을 반환한다
+
+        소계가 64비트 범위를 넘으면 OverflowError (numpy가 있어도 같다).
+        """
+        if self._numpy_fits(1):
+            subtotals = _as_int64(self.prices) * _as_int64(self.qtys)
+            return array("q", subtotals.tobytes())
+        return array("q", map(mul, self.prices, self.qtys))
+
+    def recompute_total(self):
+        """합계를 배열 전체로부터 다시 계산한다"""
+        if self._numpy_fits(len(self.prices)):
+            return int(np.dot(_as_int64(self.prices), _as_int64(self.qtys)))
+        return sum(map(mul, self.prices, self.qtys))
+
+    def _numpy_fits(self, rows):
+        """
+        numpy int64 연산이 넘치지 않는지 (최대 단가 x 최대 수량 x rows로 어림)
+
+        numpy는 넘쳐도 예외 없이 값이 돌아가므로, 넘칠 수 있으면 파이썬 정수로 계산한다.
+        """
+        if np is None or not self.prices:
+            return False
+        bound = int(_as_int64(self.prices).max()) * int(_as_int64(self.qtys).max())
+        return bound * rows <= _INT64_MAX
+
+    def apply_discount(self, rate_bp):
+        """
+        모든 단가를 rate_bp(1/10000)만큼 할인한다
+
+        할인액은 행마다 반올림한다. 할인 후 합계를 다시 계산한다.
+        apply_discount(1000) → 10% 할인
+        """
+        _check_rate(rate_bp)
+        keep = 10000 - rate_bp
+        prices = self.prices
+        # apply_rate와 같은 식을 배열 전체에 한 번에 (중간값 price * keep * 2가 넘치지 않을 때)
+        if (np is not None and prices
+                and int(_as_int64(prices).max()) * keep * 2 + 10000 <= _INT64_MAX):
+            discounted = (_as_int64(prices) * (keep * 2) + 10000) // 20000
+            self.prices = array("q", discounted.tobytes())
+        else:
+            self.prices = array("q", [apply_rate(p, keep) for p in prices])
+        self._total = self.recompute_total()
+
+    def tax(self, rate_bp):
+        """합계에 대한 세금을 반환한다 (반올림). tax(1000) → 10%"""
+        _check_rate(rate_bp)
+        return apply_rate(self._total, rate_bp)
+
+    def to_dict(self):
+        """fixture와 같은 {"items": [...], "total": ...} 형태로 변환한다"""
+        return {
+            "items": [item.to_dict() for item in self],
+            "total": self._total,
+        }
+
+
+def _as_int64(buffer):
+    return np.frombuffer(buffer, dtype=np.int64)
@@ -0,0 +1,277 @@
+"""
+장바구니 파일 가져오기
+===================
+주문 내보내기 파일(CSV 또는 JSONL)을 일정 줄 수씩 읽으면서
+장바구니 id별로 price * qty를 정수로 더한다.
+
+    result = import_carts("orders.csv")
+    for cart in result:                     # 장바구니가 끝나는 대로 하나씩 나온다
+        print(cart.cart_id, cart.total)
+    result.errors                           # [(줄 번호, 원본, 메시지), ...]
+
+한 줄 형식 (CSV는 첫 줄이 헤더):
+    cart_id,name,price,qty
+    {"cart_id": "c1", "name": "사과", "price": 1000, "qty": 3}
+
+price는 정수(최소 화폐 단위)만, qty는 없으면 1이다 (Cart.add와 같은 규칙).
+
+메모리는 파일 크기가 아니라 chunk_size에 비례한다.
+- 한 번에 chunk_size줄만 읽는다
+- 한 덩어리 동안 줄이 하나도 없던 장바구니는 끝난 것으로 보고 결과를 내보낸다
+  그래서 같은 장바구니의 줄은 chunk_size줄 안에서 이어져야 한다.
+  더 멀리 떨어진 줄은 같은 cart_id의 결과로 한 번 더 나온다 (first_line으로 구분)
+- 잘못된 줄은 건너뛰고 개수만 센다. 앞쪽 max_errors개는 줄 번호와 함께 남긴다
+  인코딩이 깨진 줄도 마찬가지다 (파일은 바이너리로 읽고 줄마다 푼다)
+- CSV는 한 줄씩 따로 읽는다. 따옴표가 잘못된 줄은 그 줄만 오류가 되고
+  뒤 줄을 삼키지 않는다. 대신 칸 안의 줄바꿈은 지원하지 않는다
+"""
+
+import codecs
+import csv
+import json
+import os
+from collections import namedtuple
+from itertools import islice
+
+from .cart import _check_price, _check_qty
+from .parsing import INT_PATTERN
+
+
+DEFAULT_CHUNK_SIZE = 10_000
+
+FORMATS = ("csv", "jsonl")
+
+CartTotal = namedtuple("CartTotal", "cart_id total lines first_line")
+CartTotal.__doc__ = "장바구니 하나의 합계 (lines: 줄 수, first_line: 첫 줄 번호)"
+
+CSV_FIELDS = ("cart_id", "price")  # CSV 헤더에 꼭 있어야 하는 열
+
+
+class CartImport:
+    """
+    import_carts 결과
+
+    반복하면 CartTotal이 장바구니가 끝나는 대로 하나씩 나온다. 한 번만 반복할 수 있다.
+    반복이 끝난 뒤 line_count, cart_count, error_count, errors를 본다.
+    """
+
+    __slots__ = ("_rows", "chunk_size", "max_errors", "errors",
+                 "line_count", "cart_count", "error_count", "_started")
+
+    def __init__(self, rows, chunk_size=DEFAULT_CHUNK_SIZE, max_errors=100):
+        if chunk_size < 1:
+            raise ValueError("chunk_size는 1 이상이어야 함")
+        self._rows = rows  # (줄 번호, 원본, (cart_id, 금액) 또는 오류 메시지)
+        self.chunk_size = chunk_size
+        self.max_errors = max_errors
+        self.errors = []
+        self.line_count = 0
+        self.cart_count = 0
+        self.error_count = 0
+        self._started = False
+
+    def __repr__(self):
+        return (f"CartImport(lines={self.line_count}, carts={self.cart_count}, "
+                f"errors={self.error_count})")
+
+    def __iter__(self):
+        if self._started:
+            raise RuntimeError("이미 읽은 결과는 다시 반복할 수 없음")
+        self._started = True
+        return self._totals()
+
+    def _totals(self):
+        # cart_id → [합계, 줄 수, 첫 줄 번호, 마지막으로 본 덩어리 번호]
+        open_carts = {}
+        rows = self._rows
+        chunk_index = 0
+        while chunk := list(islice(rows, self.chunk_size)):
+            for line_no, raw, parsed in chunk:
+                self.line_count += 1
+                if type(parsed) is str:
+                    self._add_error(line_no, raw, parsed)
+                    continue
+                cart_id, amount = parsed
+                cart = open_carts.get(cart_id)
+                if cart is None:
+                    open_carts[cart_id] = [amount, 1, line_no, chunk_index]
+                else:
+                    cart[0] += amount
+                    cart[1] += 1
+                    cart[3] = chunk_index
+            # 이번 덩어리에 줄이 없던 장바구니는 끝났다 (처음 나온 순서대로)
+            finished = [cart_id for cart_id, cart in open_carts.items() if cart[3] < chunk_index]
+            for cart_id in finished:
+                yield self._close(cart_id, open_carts.pop(cart_id))
+            chunk_index += 1
+        for cart_id, cart in open_carts.items():
+            yield self._close(cart_id, cart)
+
+    def _close(self, cart_id, cart):
+        self.cart_count += 1
+        total, lines, first_line, _ = cart
+        return CartTotal(cart_id, total, lines, first_line)
+
+    def _add_error(self, line_no, raw, message):
+        self.error_count += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append((line_no, raw, message))
+
+
+def import_carts(source, format=None, chunk_size=DEFAULT_CHUNK_SIZE, max_errors=100,
+                 encoding="utf-8"):
+    """
+    장바구니 파일을 읽어 장바구니별 합계를 차례로 내보내는 CartImport를 만든다
+
+    source: 파일 경로 또는 열린 텍스트 파일
+    format: "csv" 또는 "jsonl". None이면 파일 이름이 .csv로 끝나는지 보고 정한다
+
+    경로를 주면 반복이 끝날 때 파일을 닫는다.
+    """
+    is_path = isinstance(source, (str, os.PathLike))
+    if format is None:
+        name = os.fspath(source) if is_path else getattr(source, "name", "")
+        format = "csv" if str(name).lower().endswith(".csv") else "jsonl"
+    if format not in FORMATS:
+        raise ValueError(f"format은 {' 또는 '.join(FORMATS)}만 가능")
+    reader = _csv_rows if format == "csv" else _jsonl_rows
+    rows = _opened(source, encoding, reader) if is_path else reader(source, encoding)
+    return CartImport(rows, chunk_size, max_errors)
+
+
+def write_totals(totals, out):
+    """
+    CartTotal을 받는 대로 CSV(cart_id,total,lines,first_line)로 쓴다. 쓴 개수를 반환한다
+
+    out은 경로 또는 열린 텍스트 파일이다.
+    같은 cart_id가 여러 번 나오면(줄이 chunk_size보다 멀리 떨어진 경우) first_line으로 구분한다.
+    """
+    if isinstance(out, (str, os.PathLike)):
+        with open(out, "w", encoding="utf-8", newline="") as f:
+            return write_totals(totals, f)
+    writer = csv.writer(out, lineterminator="\n")
+    writer.writerow(CartTotal._fields)
+    count = 0
+    for cart in totals:
+        writer.writerow(cart)
+        count += 1
+    return count
+
+
+def _opened(path, encoding, reader):
+    # 바이너리로 열고 줄마다 푼다. 잘못된 바이트가 있어도 그 줄만 오류가 된다
+    with open(path, "rb") as f:
+        yield from reader(f, encoding)
+
+
+def _decoded(f, encoding):
+    """
+    (줄 번호, 줄, 오류 메시지 또는 None)
+
+    f가 바이트 줄을 내면 encoding으로 푼다. 못 풀면 줄은 깨진 글자를 대체 문자로 바꾼 것이다.
+    """
+    for line_no, line in enumerate(f, 1):
+        if type(line) is bytes:
+            try:
+                line = line.decode(encoding)
+            except UnicodeDecodeError:
+                name = codecs.lookup(encoding).name.upper()
+                yield line_no, line.decode(encoding, "replace"), f"{name} 아님"
+                continue
+        yield line_no, line, None
+
+
+def _csv_rows(f, encoding):
+    lines = _decoded(f, encoding)
+    first = next(lines, None)
+    if first is None:
+        return
+    if first[2] is not None:
+        yield 1, first[1].rstrip("\r\n"), f"헤더가 {first[2]}"
+        return
+    header = _csv_split(first[1])
+    if type(header) is str:
+        yield 1, first[1].rstrip("\r\n"), f"헤더가 {header}"
+        return
+    columns = {name.strip(): i for i, name in enumerate(header)}
+    missing = [name for name in CSV_FIELDS if name not in columns]
+    if missing:
+        yield 1, ",".join(header), f"헤더에 {', '.join(missing)} 열 없음"
+        return
+    cart_col, price_col = columns["cart_id"], columns["price"]
+    qty_col = columns.get("qty")
+    width = max(cart_col, price_col, -1 if qty_col is None else qty_col) + 1
+
+    for line_no, line, error in lines:
+        if error is not None:
+            yield line_no, line.rstrip("\r\n"), error
+            continue
+        row = _csv_split(line)
+        if type(row) is str:
+            yield line_no, line.rstrip("\r\n"), row
+            continue
+        if not row:
+            continue
+        if len(row) < width:
+            yield line_no, ",".join(row), "열 개수가 모자람"
+            continue
+        qty = row[qty_col] if qty_col is not None else ""
+        yield line_no, ",".join(row), _parse_line(
+            row[cart_col].strip(), _csv_int(row[price_col]), _csv_int(qty) if qty.strip() else 1,
+        )
+
+
+def _csv_split(line):
+    """
+    CSV 한 줄을 칸 목록으로. 따옴표가 잘못됐으면 오류 메시지
+
+    줄마다 따로 읽으므로 닫히지 않은 따옴표가 다음 줄들을 삼키지 않는다.
+    (그래서 칸 안의 줄바꿈은 지원하지 않는다)
+    """
+    line = line.rstrip("\r\n")
+    if '"' not in line:  # 따옴표가 없으면 csv 모듈과 결과가 같다
+        return line.split(",") if line else []
+    try:
+        return next(csv.reader([line], strict=True))
+    except csv.Error as e:
+        return f"CSV 형식이 아님 ({e})"
+
+
+def _csv_int(text):
+    """CSV 칸을 정수로. 정수가 아니면 원래 문자열 (검사에서 타입 오류가 난다)"""
+    if INT_PATTERN.fullmatch(text) is None:
+        return text
+    return int(text)
+
+
+def _jsonl_rows(f, encoding):
+    for line_no, line, error in _decoded(f, encoding):
+        if error is not None:
+            yield line_no, line, error
+            continue
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            yield line_no, line, "JSON 형식이 아님"
+            continue
+        if not isinstance(record, dict):
+            yield line_no, line, "JSON 객체가 아님"
+            continue
+        if "cart_id" not in record or "price" not in record:
+            yield line_no, line, "cart_id, price 필드가 필요함"
+            continue
+        yield line_no, line, _parse_line(record["cart_id"], record["price"], record.get("qty", 1))
+
+
+def _parse_line(cart_id, price, qty):
+    """(cart_id, price * qty) 또는 오류 메시지"""
+    if cart_id == "" or type(cart_id) not in (str, int):
+        return "cart_id가 비었거나 문자열/정수가 아님"
+    try:
+        _check_price(price)
+        _check_qty(qty)
+    except (TypeError, ValueError) as e:
+        return str(e)
+    return cart_id, price * qty
@@ -0,0 +1,257 @@
+"""
+상주 프로세스
+===========
+셸에서 명령을 수천 번 부르면 파이썬을 띄우는 비용이 대부분이다.
+serve는 프로세스 하나를 띄워 두고 Unix 소켓으로 요청을 받는다.
+
+    python main.py serve &                       # 상주 시작
+    python main.py send grade 95 85              # 상주 프로세스에 요청 (없으면 직접 처리)
+
+    # 파이썬을 새로 띄우지 않고 셸에서 바로
+    echo '{"op": "grade", "args": [95, 85]}' | socat - UNIX-CONNECT:$SOCKET
+
+프로토콜: 한 줄에 JSON 하나 (NDJSON). 한 연결에서 여러 요청을 보낼 수 있다.
+    요청  {"op": "grade", "args": [95, "85", 101], "id": 1}
+    응답  {"id": 1, "ok": true, "result": ["A", "B", {"error": "100 초과는 안 됨"}]}
+    요청 자체가 잘못되면 {"ok": false, "error": "..."}
+
+op
+- grade: 점수 → 등급
+- validate: 사용자명 → true/false
+- validate_score: 점수 → true/false
+- parse: 문자열 → 정수 (parse_many와 같은 규칙)
+- ping: "pong"
+
+Client는 상주 프로세스가 없으면 같은 처리를 현재 프로세스에서 한다.
+"""
+
+import json
+import os
+import signal
+import socket
+import socketserver
+import tempfile
+import threading
+
+from .grading import get_grade
+from .parsing import parse_many, validate_score
+from .usernames import validate_usernames
+
+
+SOCKET_ENV = "TESTING_LAB_SOCKET"
+
+
+def default_socket_path():
+    """환경 변수 TESTING_LAB_SOCKET, 없으면 사용자별 임시 경로"""
+    path = os.environ.get(SOCKET_ENV)
+    if path:
+        return path
+    directory = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    return os.path.join(directory, f"testing-lab-{os.getuid()}.sock")
+
+
+# --- 요청 처리 ---
+
+def _grade(args):
+    results = []
+    for value in args:
+        try:
+            results.append(get_grade(validate_score(_to_score(value))))
+        except (ValueError, TypeError, OverflowError) as e:
+            results.append({"error": str(e)})
+    return results
+
+
+def _validate_score(args):
+    results = []
+    for value in args:
+        try:
+            validate_score(_to_score(value))
+        except (ValueError, TypeError, OverflowError):
+            results.append(False)
+        else:
+            results.append(True)
+    return results
+
+
+def _to_score(value):
+    """
+    숫자는 그대로 넘겨서 validate_score가 원래 값을 검사하게 한다
+    (int()로 먼저 자르면 -0.5, 100.7이 범위 안으로 들어온다)
+    """
+    kind = type(value)
+    if kind is int or kind is float:
+        return value
+    if kind is str:
+        return int(value)
+    # JSON의 true/false, null, 배열 등은 점수가 아니다
+    raise TypeError("점수는 숫자여야 함")
+
+
+def _validate(args):
+    if not all(type(name) is str for name in args):
+        raise TypeError("사용자명은 문자열이어야 함")
+    return validate_usernames(args)
+
+
+def _parse(args):
+    column = parse_many(args)
+    results = list(column.values)
+    for row in column.error_rows():
+        results[row] = {"error": column.message(row)}
+    return results
+
+
+OPERATIONS = {
+    "grade": _grade,
+    "validate": _validate,
+    "validate_score": _validate_score,
+    "parse": _parse,
+    "ping": lambda args: "pong",
+}
+
+
+def handle(request):
+    """요청 dict 하나를 처리해서 응답 dict를 반환한다 (예외를 내지 않음)"""
+    if not isinstance(request, dict):
+        return {"ok": False, "error": "요청은 JSON 객체여야 함"}
+    response = {"id": request["id"]} if "id" in request else {}
+    op = request.get("op")
+    operation = OPERATIONS.get(op) if type(op) is str else None
+    if operation is None:
+        response.update(ok=False, error=f"알 수 없는 op: {request.get('op')!r}")
+        return response
+    args = request.get("args", [])
+    if not isinstance(args, list):
+        response.update(ok=False, error="args는 배열이어야 함")
+        return response
+    try:
+        result = operation(args)
+    except (ValueError, TypeError, OverflowError) as e:
+        response.update(ok=False, error=str(e))
+    else:
+        response.update(ok=True, result=result)
+    return response
+
+
+def handle_line(line):
+    """NDJSON 한 줄을 처리해서 응답 한 줄(줄바꿈 포함)을 반환한다"""
+    try:
+        request = json.loads(line)
+    except ValueError:
+        response = {"ok": False, "error": "JSON 형식이 아님"}
+    else:
+        try:
+            response = handle(request)
+        except Exception as e:
+            # 처리 중 예상 못 한 오류로 연결 스레드가 죽지 않게 마지막으로 막는다
+            response = {"ok": False, "error": f"처리 실패: {type(e).__name__}: {e}"}
+    return json.dumps(response, ensure_ascii=False) + "\n"
+
+
+# --- 서버 ---
+
+class _Handler(socketserver.StreamRequestHandler):
+
+    def handle(self):
+        for line in self.rfile:
+            if line.strip():
+                self.wfile.write(handle_line(line).encode("utf-8"))
+                self.wfile.flush()
+
+
+class Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def make_server(path=None):
+    """소켓을 열어 Server를 만든다. 같은 경로에 이미 상주 중이면 RuntimeError"""
+    path = path or default_socket_path()
+    if os.path.exists(path):
+        if _is_alive(path):
+            raise RuntimeError(f"이미 실행 중: {path}")
+        os.unlink(path)  # 비정상 종료로 남은 소켓 파일
+    server = Server(path, _Handler)
+    os.chmod(path, 0o600)
+    return server
+
+
+def serve(path=None, ready=None):
+    """요청을 처리한다. SIGTERM/SIGINT를 받으면 소켓을 지우고 끝낸다"""
+    server = make_server(path)
+    if threading.current_thread() is threading.main_thread():
+        signal.signal(signal.SIGTERM, lambda *_: threading.Thread(target=server.shutdown).start())
+    if ready is not None:
+        ready(server)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        try:
+            os.unlink(server.server_address)
+        except OSError:
+            pass
+
+
+def _is_alive(path):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(path)
+        except OSError:
+            return False
+    return True
+
+
+# --- 클라이언트 ---
+
+class Client:
+    """
+    상주 프로세스에 요청을 보낸다. 연결할 수 없으면 현재 프로세스에서 처리한다
+
+        with Client() as client:
+            client.request("grade", [95, 85])  # {"ok": True, "result": ["A", "B"]}
+            client.remote                      # 상주 프로세스에 연결됐는지
+    """
+
+    def __init__(self, path=None, timeout=5.0):
+        self.path = path or default_socket_path()
+        self._sock = None
+        self._reader = None
+        try:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(timeout)
+            sock.connect(self.path)
+        except OSError:
+            sock.close()
+        else:
+            self._sock = sock
+            self._reader = sock.makefile("rb")
+
+    @property
+    def remote(self):
+        return self._sock is not None
+
+    def request(self, op, args=()):
+        request = {"op": op, "args": list(args)}
+        if self._sock is None:
+            return handle(request)
+        line = json.dumps(request, ensure_ascii=False) + "\n"
+        self._sock.sendall(line.encode("utf-8"))
+        reply = self._reader.readline()
+        if not reply:
+            raise ConnectionError("상주 프로세스가 응답 없이 연결을 끊음")
+        return json.loads(reply)
+
+    def close(self):
+        if self._sock is not None:
+            self._reader.close()
+            self._sock.close()
+            self._sock = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
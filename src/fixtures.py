@@ -0,0 +1,358 @@
+"""
+공유 fixture
+===========
+준비 비용이 큰 fixture를 한 번만 만들고, 테스트마다 격리된 값을 준다.
+
+기본 fixture(function scope)는 테스트마다 새로 만들어서 격리가 보장되지만
+만드는 비용이 크면 전체 시간이 늘어난다. shared_fixture는
+
+- 값은 session(또는 module)마다 한 번만 만든다
+- 테스트에는 다음 중 하나를 준다
+    mode="copy"   : 한 번 pickle해 둔 스냅샷을 풀어서 만든 새 복사본 (수정 가능)
+    mode="frozen" : 읽기 전용 뷰 (수정하면 TypeError). 복사 비용 없음
+
+그래서 한 테스트에서 값을 바꿔도 다른 테스트에 영향이 없다.
+
+    @shared_fixture
+    def big_cart():
+        return build_cart(100_000)       # session 동안 한 번만 실행
+
+    @shared_fixture(mode="frozen")
+    def score_table():
+        return load_scores()
+
+cached_fixture는 한 걸음 더 나가서, 만든 값을 디스크에 저장해 두고
+다음 pytest 실행에서도 다시 만들지 않고 불러온다.
+
+    @cached_fixture
+    def score_corpus():
+        return generate_scores(10_000_000)   # 코드가 바뀔 때만 다시 실행
+"""
+
+import hashlib
+import inspect
+import mmap
+import numbers
+import os
+import pickle
+import struct
+import sys
+import sysconfig
+from types import CodeType, FunctionType, MappingProxyType, ModuleType
+
+import pytest
+
+from .plugins.incremental import MODULE_KEY, file_hashes
+
+
+_CACHE = pytest.StashKey[dict]()
+
+SCOPES = ("session", "module")
+MODES = ("copy", "frozen")
+
+
+def shared_fixture(func=None, *, scope="session", mode="copy", name=None):
+    """
+    func가 만든 값을 scope 동안 한 번만 만들고 테스트마다 격리해서 준다
+
+    func는 인자가 없는 함수여야 한다 (다른 fixture에 의존하지 않음).
+    """
+    if scope not in SCOPES:
+        raise ValueError(f"scope는 {SCOPES} 중 하나여야 함")
+    if mode not in MODES:
+        raise ValueError(f"mode는 {MODES} 중 하나여야 함")
+
+    def decorator(func):
+        def fixture(request):
+            cache = request.config.stash.setdefault(_CACHE, {})
+            module = request.module.__name__ if scope == "module" else None
+            key = (func.__module__, func.__qualname__, module)
+            try:
+                entry = cache[key]
+            except KeyError:
+                entry = cache[key] = _prepare(func(), mode)
+            return pickle.loads(entry) if mode == "copy" else entry
+
+        fixture.__name__ = func.__name__
+        fixture.__doc__ = func.__doc__
+        return pytest.fixture(fixture, name=name or func.__name__)
+
+    return decorator if func is None else decorator(func)
+
+
+def _prepare(value, mode):
+    if mode == "copy":
+        return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    return freeze(value)
+
+
+def freeze(value):
+    """
+    값을 읽기 전용으로 바꾼다
+
+    dict → MappingProxyType, list → tuple, set → frozenset, bytearray → bytes (안쪽까지 전부)
+    None, 숫자, str, bytes, range는 원래 불변이라 그대로 둔다.
+    그 밖의 타입(Cart, array, 사용자 객체 등)은 읽기 전용으로 만들 수 없어서 TypeError.
+    그런 값은 mode="copy"를 쓴다.
+    """
+    if isinstance(value, (dict, MappingProxyType)):
+        return MappingProxyType({k: freeze(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(freeze(v) for v in value)
+    if isinstance(value, bytearray):
+        return bytes(value)
+    if value is None or isinstance(value, (str, bytes, range, numbers.Number)):
+        return value
+    raise TypeError(f"읽기 전용으로 만들 수 없는 타입: {type(value).__name__} (mode=\"copy\"를 쓸 것)")
+
+
+# --- 디스크 캐시 ---
+
+CACHE_DIR_NAME = "fixture-cache"
+
+# 파일 앞부분: 버퍼 개수, 그 다음 (위치, 길이) 쌍들
+_COUNT = struct.Struct("<Q")
+_SPAN = struct.Struct("<QQ")
+
+# numpy 등이 버퍼를 그대로 쓸 수 있게 정렬한다
+_ALIGN = 64
+
+_LIBRARY_PATHS = tuple(
+    os.path.normcase(os.path.realpath(sysconfig.get_paths()[key]))
+    for key in ("stdlib", "platstdlib", "purelib", "platlib")
+)
+
+
+def cached_fixture(func=None, *, scope="session", depends=(), name=None):
+    """
+    func가 만든 값을 디스크에 저장해 두고 다음 실행부터는 불러온다
+
+    캐시 키는 func의 소스 코드와 func가 쓰는 프로젝트 함수/클래스/모듈의
+    소스 해시다. 그중 하나라도 바뀌면 자동으로 다시 만든다.
+    함수가 쓰는 상수(N = 10 같은 숫자/문자열/그 묶음)는 값으로,
+    함수/클래스가 정의된 파일의 최상위 코드는 코드 해시로 함께 반영한다.
+    자동으로 찾지 못하는 의존성(데이터 파일 경로 등)은 depends로 넘긴다.
+
+    저장은 pickle 프로토콜 5를 쓴다. 큰 버퍼(numpy 배열, bytearray 등)는
+    별도 파일에 저장하고 불러올 때 mmap으로 연결하므로 복사 없이 읽는다.
+    mmap은 copy-on-write라서 테스트에서 값을 바꿔도 캐시 파일은 그대로다.
+
+    func는 인자가 없는 함수여야 한다.
+    """
+    def decorator(func):
+        def fixture(request):
+            directory = request.config.rootpath / ".pytest_cache" / CACHE_DIR_NAME
+            return load_or_build(func, directory, depends)
+
+        fixture.__name__ = func.__name__
+        fixture.__doc__ = func.__doc__
+        return pytest.fixture(fixture, scope=scope, name=name or func.__name__)
+
+    return decorator if func is None else decorator(func)
+
+
+def load_or_build(func, directory, depends=()):
+    """캐시가 있으면 불러오고, 없거나 깨졌으면 만들어서 저장한다"""
+    key = fingerprint(func, depends)
+    path = os.path.join(directory, f"{func.__module__}.{func.__qualname__}-{key}")
+    try:
+        return load(path)
+    except FileNotFoundError:
+        pass
+    except (OSError, EOFError, ValueError, struct.error, pickle.UnpicklingError,
+            AttributeError, ImportError):
+        pass  # 깨졌거나 클래스가 바뀐 캐시는 다시 만든다
+
+    value = func()
+    os.makedirs(directory, exist_ok=True)
+    store(path, value)
+    _remove_stale(path)
+    return value
+
+
+def fingerprint(func, depends=()):
+    """func와 의존성의 소스 해시 (16자리)"""
+    digest = hashlib.sha256()
+    digest.update(f"{sys.version_info[:2]}|{pickle.HIGHEST_PROTOCOL}".encode())
+    seen = set()
+    for obj in (func, *depends):
+        _hash_object(obj, digest, seen)
+    return digest.hexdigest()[:16]
+
+
+def _hash_object(obj, digest, seen):
+    if id(obj) in seen:
+        return
+    seen.add(id(obj))
+
+    if isinstance(obj, (str, os.PathLike)):
+        # 경로를 넘기면 파일 내용으로 해시
+        with open(obj, "rb") as f:
+            digest.update(f.read())
+        return
+    if isinstance(obj, ModuleType):
+        path = getattr(obj, "__file__", None)
+        if path:
+            with open(path, "rb") as f:
+                digest.update(f.read())
+        return
+    try:
+        digest.update(inspect.getsource(obj).encode())
+    except (OSError, TypeError):
+        digest.update(repr(obj).encode())
+        return
+
+    if isinstance(obj, FunctionType):
+        _hash_globals(obj, digest, seen)
+    elif isinstance(obj, type):
+        # 메서드가 부르는 함수도 따라간다
+        for attr in vars(obj).values():
+            func = _function_of(attr)
+            if func is not None:
+                _hash_globals(func, digest, seen)
+    if isinstance(obj, (FunctionType, type)):
+        _hash_module_top(obj, digest, seen)
+
+
+def _hash_globals(func, digest, seen):
+    """func가 참조하는 전역 이름 중 프로젝트 코드는 따라가고, 상수는 값으로 해시"""
+    for name in sorted(_global_names(func.__code__)):
+        if name not in func.__globals__:
+            continue  # 내장 함수 또는 속성 이름
+        dep = func.__globals__[name]
+        if _is_project_code(dep):
+            _hash_object(dep, digest, seen)
+        elif _is_plain_data(dep):
+            digest.update(f"{name}={dep!r}".encode())
+
+
+def _function_of(attr):
+    """클래스 속성에서 함수를 꺼낸다 (staticmethod, classmethod, property 포함)"""
+    if isinstance(attr, (staticmethod, classmethod)):
+        attr = attr.__func__
+    elif isinstance(attr, property):
+        attr = attr.fget
+    return attr if isinstance(attr, FunctionType) else None
+
+
+def _is_plain_data(value, depth=0):
+    """repr이 값을 그대로 나타내는 상수인지 (숫자, 문자열과 그 묶음)"""
+    if value is None or isinstance(value, (bool, int, float, complex, str, bytes)):
+        return True
+    if depth >= 3:
+        return False
+    # set은 실행마다 순서(repr)가 달라질 수 있어서 뺀다
+    if isinstance(value, (tuple, list)):
+        return all(_is_plain_data(v, depth + 1) for v in value)
+    if isinstance(value, dict):
+        return all(_is_plain_data(k, depth + 1) and _is_plain_data(v, depth + 1)
+                   for k, v in value.items())
+    return False
+
+
+def _hash_module_top(obj, digest, seen):
+    """obj가 정의된 파일의 최상위 코드 해시 (incremental과 같은 방식. 함수 본문 제외)"""
+    try:
+        path = inspect.getsourcefile(obj)
+    except TypeError:
+        return
+    if path is None or ("module", path) in seen:
+        return
+    seen.add(("module", path))
+    try:
+        with open(path, "rb") as f:
+            code = compile(f.read(), path, "exec")
+    except (OSError, SyntaxError):
+        return
+    digest.update(file_hashes(code)[MODULE_KEY].encode())
+
+
+def _global_names(code):
+    """함수(안쪽 함수, 람다, 컴프리헨션 포함)가 참조하는 전역 이름"""
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            names |= _global_names(const)
+    return names
+
+
+def _is_project_code(obj):
+    """표준 라이브러리/설치 패키지가 아닌, 이 프로젝트의 함수/클래스/모듈인지"""
+    if not isinstance(obj, (FunctionType, type, ModuleType)):
+        return False
+    try:
+        path = inspect.getsourcefile(obj)
+    except TypeError:
+        return False
+    if path is None:
+        return False
+    path = os.path.normcase(os.path.realpath(path))
+    return not path.startswith(_LIBRARY_PATHS)
+
+
+def store(path, value):
+    """
+    값을 path.pkl(본문)과 path.buf(큰 버퍼)로 저장한다
+
+    임시 파일에 쓰고 이름을 바꾸므로 중간에 멈춰도 깨진 캐시가 남지 않는다.
+    """
+    buffers = []
+    payload = pickle.dumps(value, protocol=5, buffer_callback=buffers.append)
+
+    # 병렬 실행 시 여러 프로세스가 같은 캐시를 동시에 만들 수 있다
+    tmp = f".{os.getpid()}.tmp"
+
+    spans = []
+    offset = 0
+    with open(path + ".buf" + tmp, "wb") as f:
+        for buffer in buffers:
+            raw = buffer.raw()
+            padding = -offset % _ALIGN
+            f.write(b"\0" * padding)
+            offset += padding
+            f.write(raw)
+            spans.append((offset, raw.nbytes))
+            offset += raw.nbytes
+
+    with open(path + ".pkl" + tmp, "wb") as f:
+        f.write(_COUNT.pack(len(spans)))
+        for span in spans:
+            f.write(_SPAN.pack(*span))
+        f.write(payload)
+
+    os.replace(path + ".buf" + tmp, path + ".buf")
+    os.replace(path + ".pkl" + tmp, path + ".pkl")
+
+
+def load(path):
+    """store로 저장한 값을 불러온다. 큰 버퍼는 mmap으로 연결한다"""
+    with open(path + ".pkl", "rb") as f:
+        (count,) = _COUNT.unpack(f.read(_COUNT.size))
+        spans = [_SPAN.unpack(f.read(_SPAN.size)) for _ in range(count)]
+        payload = f.read()
+
+    if not spans:
+        return pickle.loads(payload)
+
+    with open(path + ".buf", "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:  # 빈 버퍼만 있는 경우 (mmap 불가)
+            return pickle.loads(payload, buffers=[b""] * count)
+        # ACCESS_COPY: 쓰기는 이 프로세스 메모리에만 반영된다 (파일은 그대로)
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+    view = memoryview(mapped)
+    buffers = [view[offset:offset + length] for offset, length in spans]
+    return pickle.loads(payload, buffers=buffers)
+
+
+def _remove_stale(path):
+    """같은 fixture의 예전 버전 캐시 파일을 지운다"""
+    directory, filename = os.path.split(path)
+    prefix = filename.rsplit("-", 1)[0] + "-"
+    for entry in os.listdir(directory):
+        if entry.startswith(prefix) and not entry.startswith(filename):
+            try:
+                os.remove(os.path.join(directory, entry))
+            except OSError:
+                pass
@@ -0,0 +1,279 @@
+"""
+등급 계산
+========
+점수를 등급으로 변환한다.
+
+- GradeScale: 등급 하한선 표를 한 번 검증/컴파일해서 재사용
+- get_grade: 점수 하나를 기본 등급(A~F) 문자열로 변환
+- grade_many: 점수 여러 개를 한 번에 등급 코드 배열로 변환
+- grade_stream: 점수 텍스트를 한 줄씩 읽으면서 검사 + 등급 + 집계
+"""
+
+import os
+import sys
+from array import array
+from bisect import bisect_right
+from functools import lru_cache, partial
+
+from .parsing import INT_PATTERN
+
+
+class GradeScale:
+    """
+    등급 하한선 표
+
+    bands는 (하한선, 등급) 쌍의 목록이다. 순서는 상관없다.
+    하한선보다 낮은 점수는 floor_label 등급이 된다.
+
+    등급 코드는 labels의 인덱스다 (0 = floor_label, 높을수록 상위 등급).
+    bisect_right(cutoffs, score)가 곧 등급 코드가 된다
+        예) cutoffs=(60, 70, 80, 90): 59 → 0(F), 60 → 1(D), 90 → 4(A)
+
+    0 ~ max_score 사이의 정수 점수는 미리 만든 표에서 바로 찾고,
+    그 외(실수, 범위 밖)는 이진 탐색으로 찾는다.
+    NaN은 어떤 하한선에도 못 미치는 것으로 보고 floor_label 등급(코드 0)이 된다.
+    """
+
+    __slots__ = ("cutoffs", "labels", "max_score", "_code", "_table", "_typecode")
+
+    def __init__(self, bands, floor_label="F", max_score=100):
+        bands = sorted(bands)
+        if not bands:
+            raise ValueError("등급 구간이 비어 있음")
+        cutoffs = tuple(cutoff for cutoff, _ in bands)
+        if len(set(cutoffs)) != len(cutoffs):
+            raise ValueError("하한선 중복 불가")
+        if cutoffs[0] < 0 or cutoffs[-1] > max_score:
+            raise ValueError(f"하한선은 0 ~ {max_score} 사이여야 함")
+
+        self.cutoffs = cutoffs
+        self.labels = (floor_label,) + tuple(label for _, label in bands)
+        self.max_score = max_score
+        self._code = partial(bisect_right, cutoffs)
+        self._table = tuple(self.labels[self._code(s)] for s in range(max_score + 1))
+        self._typecode = "B" if len(self.labels) <= 0xFF else "H"
+
+    def __repr__(self):
+        bands = ", ".join(f"{c}:{l}" for c, l in zip(self.cutoffs, self.labels[1:]))
+        return f"GradeScale({bands}, floor={self.labels[0]!r})"
+
+    def grade(self, score):
+        """점수 하나의 등급을 반환한다"""
+        if type(score) is int and 0 <= score <= self.max_score:
+            return self._table[score]
+        return self.labels[self.code(score)]
+
+    def code(self, score):
+        """점수 하나의 등급 코드를 반환한다"""
+        code = self._code(score)
+        # NaN은 모든 비교가 거짓이라 bisect가 맨 끝(최상위 등급)으로 보낸다
+        if code == len(self.cutoffs) and score != score:
+            return 0
+        return code
+
+    def grade_many(self, scores):
+        """
+        점수 여러 개를 등급 코드 배열로 변환한다
+
+        list, array.array 등 iterable은 array를 반환하고
+        numpy 배열은 numpy 배열을 반환한다.
+        ScoreFile은 조각씩 읽어서 array를 반환한다 (읽은 페이지는 바로 내려놓음).
+        """
+        # ScoreFile, numpy는 시작 시간을 줄이려고 import하지 않는다.
+        # 아직 아무도 import하지 않았다면 scores가 그 타입일 수도 없다
+        score_file = sys.modules.get(f"{__package__}.score_file")
+        if score_file is not None and isinstance(scores, score_file.ScoreFile):
+            codes = array(self._typecode)
+            for _, chunk in scores.chunks():
+                codes.extend(map(self._code, chunk))
+            return codes
+        np = sys.modules.get("numpy")
+        if np is not None and isinstance(scores, np.ndarray):
+            codes = np.searchsorted(self.cutoffs, scores, side="right")
+            if scores.dtype.kind == "f":
+                codes[np.isnan(scores)] = 0
+            return codes.astype(np.uint8 if self._typecode == "B" else np.uint16)
+        if isinstance(scores, array) and scores.typecode not in "fd":
+            return array(self._typecode, map(self._code, scores))  # 정수 배열에는 NaN이 없다
+        if not isinstance(scores, (list, tuple, array, memoryview)):
+            scores = list(scores)  # NaN을 고치려면 값을 한 번 더 봐야 한다
+        codes = array(self._typecode, map(self._code, scores))
+        self._reset_nan(scores, codes)
+        return codes
+
+    def _reset_nan(self, scores, codes):
+        """bisect가 최상위 코드로 보낸 NaN을 코드 0으로 고친다"""
+        top = len(self.cutoffs)
+        if top not in codes:
+            return
+        # NaN이 하나라도 있으면 합도 NaN이다. 합은 C에서 빨리 끝나므로 먼저 본다
+        # (inf와 -inf가 섞여도 NaN이 되지만 그때는 아래 반복이 아무것도 고치지 않을 뿐이다)
+        try:
+            total = sum(scores)
+        except TypeError:  # 더할 수 없는 조합(Decimal + float 등)은 하나씩 본다
+            total = None
+        if total is not None and total == total:
+            return
+        for i, score in enumerate(scores):
+            if score != score:
+                codes[i] = 0
+
+    def decode(self, codes):
+        """등급 코드 배열을 등급 문자열 리스트로 되돌린다"""
+        labels = self.labels
+        return [labels[code] for code in codes]
+
+
+DEFAULT_SCALE = GradeScale([(90, "A"), (80, "B"), (70, "C"), (60, "D")], floor_label="F")
+
+# 기본 등급표의 하한선과 등급 (코드 순서)
+CUTOFFS = DEFAULT_SCALE.cutoffs
+GRADE_LABELS = DEFAULT_SCALE.labels
+
+
+def get_grade(score):
+    """점수에 따른 등급을 반환한다"""
+    return DEFAULT_SCALE.grade(score)
+
+
+def grade_many(scores):
+    """
+    점수 여러 개를 등급 코드 배열로 변환한다
+
+    list, array.array, ScoreFile 등은 array('B')를 반환하고
+    numpy 배열은 uint8 numpy 배열을 반환한다.
+    코드는 GRADE_LABELS의 인덱스다 (0=F ... 4=A).
+    """
+    return DEFAULT_SCALE.grade_many(scores)
+
+
+def decode_grades(codes):
+    """등급 코드 배열을 등급 문자열 리스트로 되돌린다"""
+    return DEFAULT_SCALE.decode(codes)
+
+
+class ScoreReport:
+    """
+    grade_stream 집계 결과
+
+    histogram: 점수별 인원 array('Q') (인덱스 = 점수)
+    errors: 잘못된 줄 샘플 [(줄 번호, 원본, 메시지), ...] (최대 max_errors개)
+    error_counts: 오류 종류별 개수
+    """
+
+    __slots__ = ("scale", "histogram", "errors", "error_counts", "max_errors")
+
+    def __init__(self, scale=DEFAULT_SCALE, max_errors=100):
+        self.scale = scale
+        self.histogram = array("Q", bytes(8 * (scale.max_score + 1)))
+        self.errors = []
+        self.error_counts = dict.fromkeys(ERROR_MESSAGES, 0)
+        self.max_errors = max_errors
+
+    def __repr__(self):
+        return f"ScoreReport(total={self.total}, errors={self.error_count})"
+
+    @property
+    def total(self):
+        """유효한 점수 개수"""
+        return sum(self.histogram)
+
+    @property
+    def error_count(self):
+        return sum(self.error_counts.values())
+
+    def grade_counts(self):
+        """등급별 인원. 점수별 인원을 등급 구간으로 묶어서 계산한다"""
+        counts = dict.fromkeys(self.scale.labels, 0)
+        grade = self.scale.grade
+        for score, count in enumerate(self.histogram):
+            counts[grade(score)] += count
+        return counts
+
+    def add_error(self, line_no, raw, kind):
+        self.error_counts[kind] += 1
+        if len(self.errors) < self.max_errors:
+            message = ERROR_MESSAGES[kind].format(max_score=self.scale.max_score)
+            self.errors.append((line_no, raw, message))
+
+
+# 오류 종류 → 메시지 (validate_score, parse와 같은 메시지)
+ERROR_MESSAGES = {
+    "empty": "빈 문자열 불가",
+    "invalid": "정수가 아님",
+    "negative": "음수는 안 됨",
+    "over_max": "{max_score} 초과는 안 됨",
+}
+
+
+@lru_cache(maxsize=None)
+def _score_lookup(max_score):
+    """
+    자주 나오는 입력 → 점수 표
+
+    "85", "85\n" 처럼 흔한 형태는 표 한 번 조회로 파싱 + 범위 검사가 끝난다.
+    키는 문자열뿐이다. 정수로도 찾으면 True(== 1), 85.0(== 85)이 점수로 통과해 버린다.
+    """
+    lookup = {}
+    for score in range(max_score + 1):
+        text = str(score)
+        lookup[text] = lookup[text + "\n"] = score
+    return lookup
+
+
+def grade_stream(source, scale=DEFAULT_SCALE, max_errors=100):
+    """
+    점수를 한 줄씩 읽으면서 검사, 등급, 집계를 한 번에 처리한다
+
+    source는 파일 경로, 열린 텍스트 파일, 또는 문자열/정수의 iterable이다.
+    전체를 메모리에 올리지 않는다. 메모리는 점수 범위 크기만큼만 쓴다.
+
+        report = grade_stream("scores.txt")
+        report.grade_counts()  # {"F": 3, "D": 5, ..., "A": 2}
+
+    0 ~ scale.max_score 사이의 정수만 유효하다.
+    잘못된 줄은 예외 없이 세기만 하고, 앞쪽 max_errors개는 줄 번호와 함께 남긴다.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, encoding="utf-8") as f:
+            return grade_stream(f, scale, max_errors)
+
+    report = ScoreReport(scale, max_errors)
+    histogram = report.histogram
+    lookup = _score_lookup(scale.max_score)
+    get = lookup.get
+
+    for line_no, raw in enumerate(source, 1):
+        # 문자열이 아니면 조회하지 않는다 (리스트 같은 unhashable 값은 get에서 TypeError)
+        if type(raw) is str:
+            score = get(raw)
+            if score is not None:
+                histogram[score] += 1
+                continue
+        score, kind = _parse_score(raw, scale.max_score)
+        if kind is None:
+            histogram[score] += 1
+        else:
+            report.add_error(line_no, raw, kind)
+
+    return report
+
+
+def _parse_score(raw, max_score):
+    """표에 없는 입력을 처리한다. (점수, None) 또는 (None, 오류 종류)"""
+    if type(raw) is int:
+        score = raw
+    elif type(raw) is not str:
+        return None, "invalid"
+    else:
+        text = raw.strip()
+        if not text:
+            return None, "empty"
+        if INT_PATTERN.fullmatch(text) is None:
+            return None, "invalid"
+        score = int(text)
+    if score < 0:
+        return None, "negative"
+    if score > max_score:
+        return None, "over_max"
+    return score, None
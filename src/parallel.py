@@ -0,0 +1,187 @@
+"""
+병렬 등급 집계
+=============
+점수 배열을 여러 프로세스로 나눠서 집계한다.
+
+- grade_parallel: 점수를 공유 메모리에 한 번 올리고, 워커마다 구간만 넘겨서 집계
+
+워커에는 (공유 메모리 이름, 시작, 끝)만 전달한다. 점수 목록을 pickle하지 않음.
+ScoreFile은 공유 메모리로 복사하지 않고 워커가 같은 파일을 직접 매핑한다.
+부모 프로세스는 워커별 점수 히스토그램을 더해서 ScoreReport를 만든다.
+"""
+
+import multiprocessing
+import os
+from array import array
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+from .grading import DEFAULT_SCALE, ERROR_MESSAGES, ScoreReport
+from .score_file import ScoreFile
+
+try:
+    import numpy as np
+except ImportError:  # numpy는 선택 의존성
+    np = None
+
+
+# 이보다 작은 입력은 프로세스를 띄우는 비용이 더 크다
+# (benchmarks/bench_grade_parallel.py로 측정)
+MIN_PARALLEL_SIZE = 200_000
+
+_INT_TYPECODES = frozenset("bBhHiIlLqQ")
+
+
+def grade_parallel(scores, workers=None, scale=DEFAULT_SCALE, max_errors=100,
+                   executor=None, min_size=MIN_PARALLEL_SIZE):
+    """
+    정수 점수 배열을 여러 프로세스에서 나눠 집계한다
+
+    scores: 정수 list, array.array, numpy 정수 배열, ScoreFile
+    workers: 프로세스 수 (기본값: CPU 개수)
+    executor: 이미 만들어 둔 ProcessPoolExecutor (반복 호출 시 재사용)
+    min_size: 이보다 작으면 현재 프로세스에서 바로 계산한다
+
+    결과는 grade_stream과 같은 ScoreReport다.
+    잘못된 점수의 줄 번호는 배열 인덱스 + 1이다.
+    """
+    if isinstance(scores, ScoreFile):
+        return _grade_file(scores, workers, scale, max_errors, executor, min_size)
+    data, typecode = _as_int_buffer(scores)
+    n = len(data)
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1 or n == 0 or n < min_size:
+        parts = [_count_view(memoryview(data), 0, scale.max_score, max_errors)]
+        return _merge(parts, scale, max_errors)
+
+    nbytes = n * data.itemsize
+    shm = SharedMemory(create=True, size=nbytes)
+    try:
+        shm.buf[:nbytes] = memoryview(data).cast("B")
+        bounds = [(n * i // workers, n * (i + 1) // workers) for i in range(workers)]
+        args = (shm.name, typecode, scale.max_score, max_errors)
+        if executor is None:
+            with new_pool(workers) as pool:
+                parts = _run(pool, args, bounds)
+        else:
+            parts = _run(executor, args, bounds)
+    finally:
+        shm.close()
+        shm.unlink()
+
+    return _merge(parts, scale, max_errors)
+
+
+def _grade_file(scores, workers, scale, max_errors, executor, min_size):
+    n = len(scores)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or n == 0 or n < min_size:
+        parts = [_count_view(chunk, start, scale.max_score, max_errors)
+                 for start, chunk in scores.chunks()]
+        return _merge(parts, scale, max_errors)
+
+    bounds = [(n * i // workers, n * (i + 1) // workers) for i in range(workers)]
+    args = (scores.path, scores.typecode, scores.offset, scale.max_score, max_errors)
+    if executor is None:
+        with new_pool(workers) as pool:
+            parts = _run_file(pool, args, bounds)
+    else:
+        parts = _run_file(executor, args, bounds)
+    return _merge([part for chunk_parts in parts for part in chunk_parts], scale, max_errors)
+
+
+def new_pool(workers=None):
+    """
+    grade_parallel용 프로세스 풀을 만든다
+
+    fork는 스레드가 있는 프로세스에서 위험하므로 forkserver를 쓴다.
+    """
+    context = multiprocessing.get_context("forkserver")
+    return ProcessPoolExecutor(max_workers=workers, mp_context=context)
+
+
+def _as_int_buffer(scores):
+    """입력을 정수 버퍼로 바꾼다. 이미 정수 버퍼면 복사하지 않는다"""
+    if isinstance(scores, array) and scores.typecode in _INT_TYPECODES:
+        return scores, scores.typecode
+    if np is not None and isinstance(scores, np.ndarray):
+        if scores.dtype.kind not in "iu":
+            raise TypeError("정수 점수만 가능")
+        data = memoryview(np.ascontiguousarray(scores))
+        return data, data.format
+    return array("q", scores), "q"
+
+
+def _run(executor, args, bounds):
+    name, typecode, max_score, max_errors = args
+    futures = [
+        executor.submit(_count_chunk, name, typecode, start, stop, max_score, max_errors)
+        for start, stop in bounds
+    ]
+    return [future.result() for future in futures]
+
+
+def _count_chunk(name, typecode, start, stop, max_score, max_errors):
+    """워커: 공유 메모리의 [start, stop) 구간을 집계한다"""
+    shm = SharedMemory(name=name)
+    try:
+        with shm.buf.cast(typecode) as view, view[start:stop] as chunk:
+            return _count_view(chunk, start, max_score, max_errors)
+    finally:
+        shm.close()
+
+
+def _run_file(executor, args, bounds):
+    futures = [executor.submit(_count_file, *args, start, stop) for start, stop in bounds]
+    return [future.result() for future in futures]
+
+
+def _count_file(path, typecode, offset, max_score, max_errors, start, stop):
+    """워커: 점수 파일의 [start, stop) 구간을 조각마다 집계한다"""
+    with ScoreFile(path, typecode, offset) as scores:
+        return [_count_view(chunk, chunk_start, max_score, max_errors)
+                for chunk_start, chunk in scores.chunks(start, stop)]
+
+
+def _count_view(view, offset, max_score, max_errors):
+    """구간 하나의 (히스토그램, 오류 종류별 개수, 오류 샘플)"""
+    histogram = [0] * (max_score + 1)
+    negative = over_max = 0
+    for score, count in Counter(view).items():
+        if 0 <= score <= max_score:
+            histogram[score] = count
+        elif score < 0:
+            negative += count
+        else:
+            over_max += count
+
+    samples = []
+    if negative or over_max:
+        # 오류가 있을 때만 다시 훑어서 위치를 찾는다
+        for i, score in enumerate(view):
+            if not 0 <= score <= max_score:
+                kind = "negative" if score < 0 else "over_max"
+                samples.append((offset + i + 1, score, kind))
+                if len(samples) >= max_errors:
+                    break
+    return histogram, negative, over_max, samples
+
+
+def _merge(parts, scale, max_errors):
+    report = ScoreReport(scale, max_errors)
+    histogram = report.histogram
+    for part_histogram, negative, over_max, samples in parts:
+        for score, count in enumerate(part_histogram):
+            if count:
+                histogram[score] += count
+        report.error_counts["negative"] += negative
+        report.error_counts["over_max"] += over_max
+        for line_no, raw, kind in samples:
+            if len(report.errors) >= max_errors:
+                break
+            message = ERROR_MESSAGES[kind].format(max_score=scale.max_score)
+            report.errors.append((line_no, raw, message))
+    return report
+
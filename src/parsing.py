@@ -0,0 +1,324 @@
+"""
+숫자 파싱
+========
+문자열을 정수로 변환하고 값을 검사한다.
+
+- parse, to_int, validate_score, divide, process: 값 하나를 처리. 잘못된 값이면 예외 발생
+- parse_result, validate_score_result, divide_result, process_result:
+  위와 같은 검사를 하되 예외 대신 (ok, 값 또는 Error)를 반환
+- validate_scores: 점수 여러 개를 한 번에 검사. 예외 대신 bool 목록
+- parse_many: 값 여러 개를 한 번에 처리. 예외 대신 오류 코드를 기록
+
+예외는 만들고 던지는 데 비용이 크다 (메시지 포맷, traceback).
+잘못된 값이 많이 섞인 입력에서는 *_result 쪽을 쓴다.
+
+    ok, value = parse_result(text)
+    if not ok:
+        log(value.code, value.message)   # value는 미리 만들어 둔 Error 객체
+
+두 쪽 모두 아래의 Error 객체에서 메시지를 가져오므로 규칙과 메시지가 같다.
+예외를 내는 함수는 정상 값일 때 튜플을 만들지 않도록 검사를 직접 한다.
+"""
+
+import re
+from array import array
+
+
+def parse(text):
+    """문자열을 정수로 변환한다. 빈 문자열이면 ValueError"""
+    if not text:
+        raise EMPTY_TEXT.exception()
+    return int(text)
+
+
+def to_int(x):
+    """값을 정수로 변환한다. None이면 TypeError"""
+    if x is None:
+        raise TypeError("None은 변환 불가")
+    return int(x)
+
+
+def validate_score(score):
+    """점수가 0 ~ 100 사이인지 검사한다"""
+    if score < 0:
+        raise SCORE_NEGATIVE.exception()
+    if score > 100:
+        raise SCORE_TOO_LARGE.exception()
+    return score
+
+
+def validate_scores(scores):
+    """
+    여러 점수를 검사해서 결과(bool) 리스트를 반환한다
+
+    validate_score가 예외 없이 통과하는 값이면 True.
+    """
+    results = []
+    append = results.append
+    for score in scores:
+        kind = type(score)
+        if kind is int or kind is float:
+            append(not (score < 0 or score > 100))
+        else:
+            try:
+                validate_score(score)
+            except (ValueError, TypeError):
+                append(False)
+            else:
+                append(True)
+    return results
+
+
+def divide(a, b):
+    """a를 b로 나눈다. b가 0이면 ValueError"""
+    if b == 0:
+        raise DIVISION_BY_ZERO.exception()
+    return a / b
+
+
+def process(value):
+    """None이면 TypeError, 음수면 ValueError. 아니면 값을 그대로 반환한다"""
+    if value is None:
+        raise NONE_VALUE.exception()
+    if value < 0:
+        raise NEGATIVE_VALUE.exception()
+    return value
+
+
+# parse_many 오류 코드
+OK = 0
+EMPTY = 1         # 빈 문자열 → ValueError("빈 문자열 불가")
+NONE = 2          # None → TypeError("None은 변환 불가")
+INVALID = 3       # int()가 거부하는 값 → int()와 같은 ValueError/TypeError
+OUT_OF_RANGE = 4  # 정수지만 64비트 범위 밖 → OverflowError
+
+# *_result 함수만 쓰는 오류 코드
+NEGATIVE = 5      # 음수
+TOO_LARGE = 6     # 100 초과 점수
+ZERO_DIVISOR = 7  # 0으로 나눔
+
+ERROR_NAMES = ("OK", "EMPTY", "NONE", "INVALID", "OUT_OF_RANGE",
+               "NEGATIVE", "TOO_LARGE", "ZERO_DIVISOR")
+
+INT64_MIN = -(1 << 63)
+INT64_MAX = (1 << 63) - 1
+
+# int()가 받아들이는 10진 정수 문자열 (앞뒤 공백, 부호, 숫자 사이 밑줄)
+# \s, \d는 유니코드 공백/숫자까지 포함하므로 int()와 같은 범위다
+INT_PATTERN = re.compile(r"\s*[+-]?\d+(?:_\d+)*\s*")
+
+# 이보다 긴 문자열은 int()의 자릿수 제한에 걸릴 수 있어서 정규식 경로를 타지 않는다
+_MAX_FAST_LEN = 64
+
+
+class ParsedColumn:
+    """
+    parse_many 결과
+
+    values: 변환된 정수 array('q'). 오류 행은 0
+    errors: 오류 코드 array('B'). 0이면 정상
+
+    오류 메시지는 필요할 때(message, exception 호출 시)만 만든다.
+    그래서 원본 값은 오류 행의 것만 보관한다.
+    """
+
+    __slots__ = ("values", "errors", "_failed")
+
+    def __init__(self, values, errors, failed):
+        self.values = values
+        self.errors = errors
+        self._failed = failed  # 행 번호 → 원본 값 (오류 행만)
+
+    def __len__(self):
+        return len(self.values)
+
+    def __repr__(self):
+        return f"ParsedColumn({len(self.values)} rows, {len(self._failed)} errors)"
+
+    @property
+    def error_count(self):
+        return len(self._failed)
+
+    def error_rows(self):
+        """오류가 난 행 번호 목록 (오름차순)"""
+        return sorted(self._failed)
+
+    def exception(self, row):
+        """
+        해당 행을 parse/to_int로 처리했을 때 발생했을 예외를 반환한다
+
+        정상 행이면 None.
+        """
+        code = self.errors[row]
+        if code == OK:
+            return None
+        if code == EMPTY:
+            return ValueError("빈 문자열 불가")
+        if code == NONE:
+            return TypeError("None은 변환 불가")
+        raw = self._failed[row]
+        if code == OUT_OF_RANGE:
+            return OverflowError(f"64비트 정수 범위 초과: {raw!r}")
+        try:
+            int(raw)
+        except (ValueError, TypeError, OverflowError) as e:
+            return e
+        raise AssertionError(f"{row}번 행은 변환 가능한 값: {raw!r}")
+
+    def message(self, row):
+        """해당 행의 오류 메시지. 정상 행이면 None"""
+        error = self.exception(row)
+        return None if error is None else str(error)
+
+
+def parse_many(values):
+    """
+    값 여러 개를 정수로 변환한다. 잘못된 값이 있어도 예외를 내지 않는다
+
+    규칙은 parse + to_int와 같다.
+        None → NONE, 빈 문자열 → EMPTY, int()가 거부하면 INVALID
+    단, parse는 0 같은 거짓 값도 "빈 문자열 불가"로 거부하지만
+    여기서는 빈 문자열만 EMPTY다 (정수 0은 정상 값).
+    int()가 OverflowError를 내는 값(float inf)도 INVALID다.
+
+    대부분의 값은 정규식으로 먼저 걸러서 try/except 없이 처리한다.
+    """
+    out = array("q")
+    errors = array("B")
+    failed = {}
+    match = INT_PATTERN.fullmatch
+    append_value = out.append
+    append_error = errors.append
+
+    for row, value in enumerate(values):
+        kind = type(value)
+        if kind is str and len(value) <= _MAX_FAST_LEN:
+            if not value:
+                code = EMPTY
+            elif match(value) is None:
+                code = INVALID
+            else:
+                code = _store(int(value), append_value)
+        elif kind is int:
+            code = _store(value, append_value)
+        elif value is None:
+            code = NONE
+        else:
+            # 아주 긴 문자열, bytes, float 등 드문 경우만 예외 처리로 넘긴다
+            try:
+                code = _store(int(value), append_value)
+            except (ValueError, TypeError, OverflowError):
+                code = INVALID
+
+        if code:
+            append_value(0)
+            failed[row] = value
+        append_error(code)
+
+    return ParsedColumn(out, errors, failed)
+
+
+def _store(number, append_value):
+    if INT64_MIN <= number <= INT64_MAX:
+        append_value(number)
+        return OK
+    return OUT_OF_RANGE
+
+
+class Error:
+    """
+    *_result 함수의 오류 값
+
+    모듈을 불러올 때 한 번만 만들어 두고 계속 같은 객체를 반환한다.
+    그래서 오류가 나도 할당이 없다. 예외가 필요하면 exception()으로 만든다.
+
+    INVALID(int()가 거부한 값)는 메시지가 값마다 달라서 message가 None이다.
+    exception(원본 값)을 부르면 int()가 냈을 예외를 그대로 돌려준다.
+    """
+
+    __slots__ = ("code", "error_type", "message")
+
+    def __init__(self, code, error_type, message):
+        self.code = code
+        self.error_type = error_type
+        self.message = message
+
+    def __repr__(self):
+        return f"<Error {ERROR_NAMES[self.code]}: {self.message!r}>"
+
+    def exception(self, raw=None):
+        """예외를 내는 함수가 던졌을 예외 객체"""
+        if self.message is not None:
+            return self.error_type(self.message)
+        try:
+            int(raw)
+        except (ValueError, TypeError, OverflowError) as e:
+            return e
+        raise AssertionError(f"변환 가능한 값: {raw!r}")
+
+
+EMPTY_TEXT = Error(EMPTY, ValueError, "빈 문자열 불가")
+NOT_AN_INT = Error(INVALID, ValueError, None)
+SCORE_NEGATIVE = Error(NEGATIVE, ValueError, "음수는 안 됨")
+SCORE_TOO_LARGE = Error(TOO_LARGE, ValueError, "100 초과는 안 됨")
+DIVISION_BY_ZERO = Error(ZERO_DIVISOR, ValueError, "0으로 나눌 수 없습니다")
+NONE_VALUE = Error(NONE, TypeError, "None 안 됨")
+NEGATIVE_VALUE = Error(NEGATIVE, ValueError, "음수 안 됨")
+
+# 실패 결과도 미리 만들어 둔다 (튜플도 할당하지 않음)
+_EMPTY_TEXT = (False, EMPTY_TEXT)
+_NOT_AN_INT = (False, NOT_AN_INT)
+_SCORE_NEGATIVE = (False, SCORE_NEGATIVE)
+_SCORE_TOO_LARGE = (False, SCORE_TOO_LARGE)
+_DIVISION_BY_ZERO = (False, DIVISION_BY_ZERO)
+_NONE_VALUE = (False, NONE_VALUE)
+_NEGATIVE_VALUE = (False, NEGATIVE_VALUE)
+
+
+def parse_result(text):
+    """
+    parse의 예외 없는 버전. (True, 정수) 또는 (False, EMPTY_TEXT | NOT_AN_INT)
+
+    문자열은 isdecimal/정규식으로 먼저 걸러서 try/except 없이 처리한다.
+    """
+    if not text:
+        return _EMPTY_TEXT
+    if type(text) is str and len(text) <= _MAX_FAST_LEN:
+        # isdecimal은 int()가 받는 숫자(유니코드 Nd)와 범위가 같다
+        if text.isdecimal() or INT_PATTERN.fullmatch(text) is not None:
+            return True, int(text)
+        return _NOT_AN_INT
+    try:
+        return True, int(text)
+    except (ValueError, TypeError, OverflowError):
+        return _NOT_AN_INT
+
+
+def validate_score_result(score):
+    """
+    validate_score의 예외 없는 버전.
+    (True, 점수) 또는 (False, SCORE_NEGATIVE | SCORE_TOO_LARGE)
+
+    비교할 수 없는 타입이면 TypeError는 그대로 발생한다.
+    """
+    if score < 0:
+        return _SCORE_NEGATIVE
+    if score > 100:
+        return _SCORE_TOO_LARGE
+    return True, score
+
+
+def divide_result(a, b):
+    """divide의 예외 없는 버전. (True, 몫) 또는 (False, DIVISION_BY_ZERO)"""
+    if b == 0:
+        return _DIVISION_BY_ZERO
+    return True, a / b
+
+
+def process_result(value):
+    """process의 예외 없는 버전. (True, 값) 또는 (False, NONE_VALUE | NEGATIVE_VALUE)"""
+    if value is None:
+        return _NONE_VALUE
+    if value < 0:
+        return _NEGATIVE_VALUE
+    return True, value
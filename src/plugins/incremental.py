@@ -0,0 +1,288 @@
+"""
+변경 기반 테스트 선택
+==================
+지난 실행 이후 바뀐 코드에 의존하는 테스트만 다시 실행한다.
+
+    pytest --incremental
+
+- 테스트마다 실행 중에 불린 프로젝트 함수(fixture 포함)를 sys.monitoring으로 기록한다
+- 함수마다 내용 해시를 같이 저장한다 (.pytest_cache/v/incremental/deps)
+- 다음 실행에서 의존 함수의 해시가 하나라도 바뀐 테스트만 실행한다
+  · 새 테스트, 지난번에 실패한 테스트는 항상 실행
+  · 해시는 줄 번호를 빼고 계산한다 → 위쪽에 줄을 추가해도 다시 실행하지 않음
+  · 모듈 최상위 코드(상수, import)가 바뀌면 그 파일의 함수를 쓰는 테스트 전부 실행
+
+기록은 직렬 실행에서만 한다 (--workers의 워커는 캐시를 쓰지 않음).
+테스트가 띄운 자식 프로세스 안에서 실행된 코드는 기록되지 않는다.
+파이썬 3.12 이상 필요.
+"""
+
+import hashlib
+import os
+import sys
+from types import CodeType
+
+import pytest
+
+
+DEPS_KEY = "incremental/deps"
+
+MODULE_KEY = "<module>"
+
+# 함수 본문(지역 변수를 빠른 슬롯에 두는 코드). 모듈/클래스 본문에는 없다
+_CO_OPTIMIZED = 0x0001
+
+_LIBRARY_MARKERS = (os.sep + "site-packages" + os.sep, os.sep + "dist-packages" + os.sep)
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("incremental", "변경 기반 테스트 선택")
+    group.addoption(
+        "--incremental", action="store_true",
+        help="지난 실행 이후 의존 코드가 바뀐 테스트만 실행",
+    )
+
+
+def pytest_configure(config):
+    if not config.getoption("incremental"):
+        return
+    if not hasattr(sys, "monitoring"):
+        raise pytest.UsageError("--incremental은 파이썬 3.12 이상 필요")
+    if getattr(config, "cache", None) is None:
+        return  # 캐시가 없으면 (병렬 워커 등) 선택도 기록도 하지 않음
+    config.pluginmanager.register(Incremental(config), "incremental")
+
+
+class Incremental:
+
+    def __init__(self, config):
+        self.config = config
+        self.root = str(config.rootpath)
+        self.deps = config.cache.get(DEPS_KEY, {})
+        self.hashes = {}       # 파일 경로 → {qualname: 해시}
+        self.fixture_deps = {}  # id(fixturedef) → 코드 객체 집합
+        self.selected = None
+        self.skipped = 0
+        self._project = {}     # co_filename → 프로젝트 파일이면 상대 경로, 아니면 None
+        self._stack = []       # 기록 중인 코드 객체 집합 (테스트, 그 안의 fixture)
+        self._failed = set()
+        self._tool = _claim_tool_id()
+        if self._tool is not None:
+            monitoring = sys.monitoring
+            monitoring.register_callback(self._tool, monitoring.events.PY_START, self._on_start)
+
+    # --- 해시 ---
+
+    def current_hashes(self, relpath):
+        try:
+            return self.hashes[relpath]
+        except KeyError:
+            pass
+        try:
+            with open(os.path.join(self.root, relpath), "rb") as f:
+                code = compile(f.read(), relpath, "exec", dont_inherit=True)
+        except (OSError, SyntaxError, ValueError):
+            hashes = {}
+        else:
+            hashes = file_hashes(code)
+        self.hashes[relpath] = hashes
+        return hashes
+
+    def is_changed(self, nodeid):
+        recorded = self.deps.get(nodeid)
+        if recorded is None:
+            return True
+        for key, digest in recorded.items():
+            relpath, qualname = key.split("::", 1)
+            if self.current_hashes(relpath).get(qualname) != digest:
+                return True
+        return False
+
+    # --- 선택 ---
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(self, config, items):
+        selected, deselected = [], []
+        for item in items:
+            (selected if self.is_changed(item.nodeid) else deselected).append(item)
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+        self.selected = len(selected)
+        self.skipped = len(deselected)
+
+    def pytest_report_collectionfinish(self, config, start_path, items):
+        if self.selected is not None:
+            return f"incremental: 변경된 테스트 {self.selected}개 실행, {self.skipped}개 건너뜀"
+        return None
+
+    # --- 기록 ---
+
+    def _relpath(self, filename):
+        try:
+            return self._project[filename]
+        except KeyError:
+            pass
+        relpath = None
+        path = os.path.abspath(filename)
+        if (os.path.isfile(path) and path.startswith(self.root + os.sep)
+                and not any(marker in path for marker in _LIBRARY_MARKERS)):
+            relpath = os.path.relpath(path, self.root)
+        self._project[filename] = relpath
+        return relpath
+
+    def _on_start(self, code, offset):
+        if self._stack and self._relpath(code.co_filename) is not None:
+            self._stack[-1].add(code)
+        # 같은 테스트 안에서는 한 번만 알면 된다. 다음 테스트 시작 때 restart_events
+        return sys.monitoring.DISABLE
+
+    def _record(self, codes):
+        self._stack.append(codes)
+        sys.monitoring.restart_events()
+        sys.monitoring.set_events(self._tool, sys.monitoring.events.PY_START)
+
+    def _stop(self):
+        self._stack.pop()
+        if not self._stack:
+            sys.monitoring.set_events(self._tool, 0)
+
+    @pytest.hookimpl(wrapper=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        if self._tool is None:
+            return (yield)
+        codes = set()
+        self._record(codes)
+        try:
+            return (yield)
+        finally:
+            self._stop()
+            self._store(item, codes)
+
+    @pytest.hookimpl(wrapper=True)
+    def pytest_fixture_setup(self, fixturedef, request):
+        # session fixture는 처음 쓰는 테스트에서만 만들어지므로 따로 기록해 두고
+        # 그 fixture를 쓰는 모든 테스트의 의존성에 합친다
+        if self._tool is None or not self._stack:
+            return (yield)
+        codes = self.fixture_deps.setdefault(id(fixturedef), set())
+        self._record(codes)
+        try:
+            return (yield)
+        finally:
+            self._stop()
+
+    def pytest_runtest_logreport(self, report):
+        if report.failed:
+            self._failed.add(report.nodeid)
+
+    def _store(self, item, codes):
+        if item.nodeid in self._failed:
+            self.deps.pop(item.nodeid, None)
+            return
+        info = getattr(item, "_fixtureinfo", None)
+        if info is not None:
+            for name in item.fixturenames:
+                for fixturedef in info.name2fixturedefs.get(name, ()):
+                    codes |= self.fixture_deps.get(id(fixturedef), set())
+
+        recorded = {}
+        for code in codes:
+            relpath = self._relpath(code.co_filename)
+            hashes = self.current_hashes(relpath)
+            for qualname in (code.co_qualname, *_enclosing(code.co_qualname), MODULE_KEY):
+                if qualname in hashes:
+                    recorded[f"{relpath}::{qualname}"] = hashes[qualname]
+        self.deps[item.nodeid] = recorded
+
+    def pytest_sessionfinish(self, session):
+        self.config.cache.set(DEPS_KEY, self.deps)
+
+    def pytest_unconfigure(self, config):
+        if self._tool is not None:
+            sys.monitoring.register_callback(self._tool, sys.monitoring.events.PY_START, None)
+            sys.monitoring.set_events(self._tool, 0)
+            sys.monitoring.free_tool_id(self._tool)
+            self._tool = None
+
+
+def _enclosing(qualname):
+    """
+    메서드를 감싼 클래스 본문 이름 ("A.B.f" → "A", "A.B")
+
+    클래스 본문은 import 때만 실행되므로 기록되지 않는다.
+    클래스 속성(__slots__, 상수 등)이 바뀐 것도 알아채려고 같이 의존성에 넣는다.
+    """
+    parts = qualname.split(".")
+    return [".".join(parts[:i]) for i in range(1, len(parts)) if "<locals>" not in parts[:i]]
+
+
+def _claim_tool_id():
+    """비어 있는 sys.monitoring 도구 번호를 잡는다 (coverage 등과 겹치지 않게)"""
+    for tool in range(6):
+        if sys.monitoring.get_tool(tool) is None:
+            sys.monitoring.use_tool_id(tool, "pytest-incremental")
+            return tool
+    return None
+
+
+def file_hashes(module_code):
+    """
+    파일 안 함수별 내용 해시 {qualname: 해시}
+
+    MODULE_KEY는 모듈 최상위 코드의 해시다. 함수/클래스 본문은 이름만 반영하므로
+    함수 하나를 고쳐도 MODULE_KEY는 바뀌지 않는다.
+    """
+    hashes = {}
+    _walk(module_code, hashes)
+    hashes[MODULE_KEY] = _digest(module_code)
+    return hashes
+
+
+def _walk(code, hashes):
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            digest = _digest(const)
+            # 같은 이름(예: 같은 자리의 람다 여러 개)은 합쳐서 하나로
+            previous = hashes.get(const.co_qualname)
+            hashes[const.co_qualname] = digest if previous is None else _combine(previous, digest)
+            _walk(const, hashes)
+
+
+def _digest(code):
+    """줄 번호를 뺀 코드 해시 (16자리)"""
+    h = hashlib.sha256()
+    _feed(code, h)
+    return h.hexdigest()[:16]
+
+
+def _feed(code, h):
+    h.update(code.co_code)
+    h.update(repr((code.co_names, code.co_varnames, code.co_freevars, code.co_cellvars,
+                   code.co_argcount, code.co_kwonlyargcount, code.co_flags)).encode())
+    body = code.co_flags & _CO_OPTIMIZED
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            if body:
+                _feed(const, h)  # 함수 안의 함수/람다는 바깥 함수 동작의 일부
+            else:
+                h.update(f"<code {const.co_qualname}>".encode())
+        else:
+            h.update(_const_repr(const).encode())
+
+
+def _const_repr(const):
+    """
+    상수의 repr. frozenset은 원소 순서가 해시 시드에 따라 달라지므로 정렬해서 만든다
+
+    `x in {"a", "b"}` 같은 집합 리터럴은 frozenset 상수가 된다.
+    """
+    if type(const) is frozenset:
+        return f"frozenset({{{', '.join(sorted(map(_const_repr, const)))}}})"
+    if type(const) is tuple:
+        return f"({', '.join(map(_const_repr, const))},)"
+    return repr(const)
+
+
+def _combine(*digests):
+    return hashlib.sha256("|".join(digests).encode()).hexdigest()[:16]
@@ -0,0 +1,267 @@
+"""
+지연 parametrize 플러그인
+=======================
+케이스 표가 아주 클 때, 수집 시점에 표 전체를 메모리에 올리지 않는다.
+
+    from src.plugins.lazy_params import lazy_parametrize
+
+    @lazy_parametrize("score, expected", "data/grade_cases.jsonl", ids="id")
+    def test_grade(score, expected):
+        assert get_grade(score) == expected
+
+    @lazy_parametrize("score", lambda: range(100_000))
+    def test_many(score):
+        ...
+
+source 종류
+- .jsonl 파일: 한 줄에 객체({"score": 95, "expected": "A", "id": "수"}) 또는 배열 하나
+- .csv 파일: 첫 줄은 헤더. 값은 문자열이므로 converters={"score": int}로 변환
+- iterable 또는 iterable을 반환하는 함수: 튜플, 값, pytest.param(..., id=...) 모두 가능
+  → 수집하면서 임시 파일로 흘려보낸다
+
+수집 시에는 행마다 파일 위치(8바이트)만 기억하고, 실제 값은
+그 테스트가 실행되기 직전에 해당 행만 읽는다.
+"""
+
+import csv
+import json
+import os
+import pickle
+import tempfile
+from array import array
+
+import pytest
+from _pytest.mark.structures import ParameterSet
+
+
+MARKER = "lazy_parametrize"
+
+# 출처 → LazyTable (같은 파일을 여러 테스트가 쓰면 한 번만 훑는다)
+_TABLES = {}
+_SPILL_DIR = None
+
+
+def lazy_parametrize(argnames, source, ids=None, converters=None):
+    """
+    source의 행으로 테스트를 parametrize 한다 (값은 실행 직전에 읽음)
+
+    argnames: "a, b" 또는 ["a", "b"]
+    ids: 파일 source에서 테스트 이름으로 쓸 필드 이름
+    converters: CSV 필드별 변환 함수 {"score": int}
+    """
+    return getattr(pytest.mark, MARKER)(
+        argnames, source, ids=ids, converters=converters or {},
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        f"{MARKER}(argnames, source, ids=None, converters=None): "
+        "파일/제너레이터로 지연 parametrize",
+    )
+
+
+def pytest_unconfigure(config):
+    global _SPILL_DIR
+    for table in _TABLES.values():
+        table.close()
+    _TABLES.clear()
+    if _SPILL_DIR is not None:
+        _SPILL_DIR.cleanup()
+        _SPILL_DIR = None
+
+
+def pytest_generate_tests(metafunc):
+    for marker in metafunc.definition.iter_markers(MARKER):
+        argnames, source = marker.args
+        names = _split_argnames(argnames)
+        table = _get_table(source, names, marker.kwargs, metafunc.definition.path.parent)
+        metafunc.parametrize(names, table.param_sets())
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_pyfunc_call(pyfuncitem):
+    """테스트 실행 직전에 지연 값을 실제 값으로 바꾼다"""
+    funcargs = pyfuncitem.funcargs
+    for name, value in funcargs.items():
+        if type(value) is LazyCell:
+            funcargs[name] = value.resolve()
+
+
+def _split_argnames(argnames):
+    if isinstance(argnames, str):
+        return [name.strip() for name in argnames.split(",") if name.strip()]
+    return list(argnames)
+
+
+def _get_table(source, names, options, base_dir):
+    ids = options.get("ids")
+    converters = options.get("converters") or {}
+    if isinstance(source, (str, os.PathLike)):
+        path = os.path.join(base_dir, source)
+        # 같은 파일이라도 변환 함수가 다르면 다른 표다 (이름만 같고 함수가 다를 수 있다)
+        key = (os.path.realpath(path), tuple(names), ids, tuple(sorted(converters.items())))
+        table = _TABLES.get(key)
+        if table is None:
+            table = _TABLES[key] = _scan_file(path, names, ids, converters)
+        return table
+
+    # 제너레이터는 다시 읽을 수 없으므로 임시 파일에 흘려보낸다
+    key = (id(source), tuple(names))
+    table = _TABLES.get(key)
+    if table is None:
+        rows = source() if callable(source) else source
+        table = _TABLES[key] = _spill(rows, names)
+    return table
+
+
+class LazyCell:
+    """표의 index번째 행, field번째 값. 실행 직전까지 읽지 않는다"""
+
+    __slots__ = ("table", "index", "field")
+
+    def __init__(self, table, index, field):
+        self.table = table
+        self.index = index
+        self.field = field
+
+    def __repr__(self):
+        return f"<{self.table.path}:{self.index}[{self.field}]>"
+
+    def resolve(self):
+        return self.table.row(self.index)[self.field]
+
+
+class LazyTable:
+    """
+    행 위치만 가진 표
+
+    offsets: 행마다 파일 안의 시작 위치 array('Q')
+    ids: 행마다 테스트 ID (None이면 값으로 만든 기본 ID)
+    """
+
+    def __init__(self, path, names, kind, converters=None, header=None):
+        self.path = path
+        self.names = names
+        self.kind = kind  # "jsonl", "csv", "pickle"
+        self.converters = converters or {}
+        self.header = header
+        self.offsets = array("Q")
+        self.ids = []
+        self.marks = {}  # 행 번호 → marks (있는 행만)
+        self._file = None
+        self._last = (None, None)
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def param_sets(self):
+        """행마다 LazyCell만 담은 ParameterSet 목록"""
+        cells = range(len(self.names))
+        return [
+            ParameterSet([LazyCell(self, index, field) for field in cells],
+                         self.marks.get(index, ()), self.ids[index])
+            for index in range(len(self.offsets))
+        ]
+
+    def row(self, index):
+        last_index, last_row = self._last
+        if index == last_index:
+            return last_row
+        if self._file is None:
+            self._file = open(self.path, "rb")
+        self._file.seek(self.offsets[index])
+        if self.kind == "pickle":
+            row = pickle.load(self._file)
+        else:
+            row = self._decode(self._file.readline().decode("utf-8"))
+        self._last = (index, row)
+        return row
+
+    def _decode(self, line):
+        if self.kind == "jsonl":
+            return _pick(json.loads(line), self.names, self.path)
+        record = dict(zip(self.header, next(csv.reader([line]))))
+        for name, convert in self.converters.items():
+            record[name] = convert(record[name])
+        return _pick(record, self.names, self.path)
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def _pick(record, names, path):
+    if isinstance(record, dict):
+        try:
+            return tuple(record[name] for name in names)
+        except KeyError as e:
+            raise KeyError(f"{path}: {e.args[0]} 필드 없음") from None
+    if len(record) != len(names):
+        raise ValueError(f"{path}: 값 {len(record)}개, 이름 {len(names)}개")
+    return tuple(record)
+
+
+def _scan_file(path, names, ids, converters):
+    """파일을 한 번 훑어서 행 위치와 ID만 기록한다"""
+    kind = "csv" if path.endswith(".csv") else "jsonl"
+    with open(path, "rb") as f:
+        header = None
+        if kind == "csv":
+            header = next(csv.reader([f.readline().decode("utf-8-sig")]))
+        table = LazyTable(path, names, kind, converters, header)
+        offset = f.tell()
+        for raw in f:
+            if raw.strip():
+                table.offsets.append(offset)
+                table.ids.append(_row_id(table, raw.decode("utf-8"), ids))
+            offset += len(raw)
+    return table
+
+
+def _row_id(table, line, ids):
+    if table.kind == "jsonl":
+        record = json.loads(line)
+    else:
+        record = dict(zip(table.header, next(csv.reader([line]))))
+    if ids is not None and isinstance(record, dict) and record.get(ids) is not None:
+        return str(record[ids])
+    return _default_id(_pick(record, table.names, table.path), table.names, len(table.ids))
+
+
+def _spill(rows, names):
+    global _SPILL_DIR
+    if _SPILL_DIR is None:
+        _SPILL_DIR = tempfile.TemporaryDirectory(prefix="pytest-lazy-params-")
+    fd, path = tempfile.mkstemp(suffix=".pickle", dir=_SPILL_DIR.name)
+    table = LazyTable(path, names, "pickle")
+    with os.fdopen(fd, "wb") as f:
+        for index, row in enumerate(rows):
+            row_id = None
+            if isinstance(row, ParameterSet):
+                values, marks, row_id = row
+                if marks:
+                    table.marks[index] = marks
+            elif len(names) == 1:
+                values = (row,)
+            else:
+                values = tuple(row)
+            if len(values) != len(names):
+                raise ValueError(f"{index}번 행: 값 {len(values)}개, 이름 {len(names)}개")
+            table.offsets.append(f.tell())
+            pickle.dump(tuple(values), f, protocol=pickle.HIGHEST_PROTOCOL)
+            table.ids.append(row_id if row_id is not None else _default_id(values, names, index))
+    return table
+
+
+_SCALAR_TYPES = (int, float, str, bool, type(None))
+
+
+def _default_id(values, names, index):
+    """pytest 기본 ID와 같은 규칙: 단순 값은 그대로, 나머지는 이름+번호"""
+    parts = []
+    for name, value in zip(names, values):
+        parts.append(str(value) if isinstance(value, _SCALAR_TYPES) else f"{name}{index}")
+    return "-".join(parts)
@@ -0,0 +1,259 @@
+"""
+병렬 실행 플러그인
+================
+수집한 테스트를 여러 프로세스에 나눠서 실행하고 결과를 하나의 리포트로 합친다.
+
+    pytest --workers 4
+
+- 지난 실행의 테스트별 소요 시간(.pytest_cache)을 보고 워커마다 시간이 비슷하게 나눈다
+- 워커는 `python -m pytest`를 자식 프로세스로 실행한다
+- 워커의 결과(TestReport)를 부모가 받아서 그대로 리포트에 반영한다
+  → 실패 출력, -v, 종료 코드가 직렬 실행과 같다
+- 결과에 영향을 주는 옵션은 워커에 그대로 넘긴다
+  (--tb, --capture, -l, -W, -o, --strict*, --runxfail, -p)
+  그 밖의 옵션(-x, -k 등)은 부모에서 처리하거나 워커에는 적용되지 않는다
+- 워커가 결과 없이 끝나면 워커의 출력(수집 오류 등)을 실패 내용에 붙인다
+- @pytest.mark.serial이 붙은 테스트는 다른 워커가 모두 끝난 뒤 워커 하나에서 따로 실행한다
+  (시간 측정처럼 다른 테스트와 CPU를 나눠 쓰면 안 되는 테스트)
+"""
+
+import heapq
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import pytest
+from _pytest.reports import TestReport
+
+
+DURATIONS_KEY = "parallel/durations"
+
+# 소요 시간 기록이 없는 테스트의 예상 시간 (초)
+DEFAULT_DURATION = 0.01
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("parallel", "병렬 실행")
+    group.addoption(
+        "--workers", type=int, default=0, metavar="N",
+        help="N개 프로세스로 나눠서 실행 (0 또는 1이면 직렬)",
+    )
+    group.addoption("--parallel-ids", metavar="PATH", help="(워커 전용) 실행할 테스트 ID 목록")
+    group.addoption("--parallel-out", metavar="PATH", help="(워커 전용) 결과를 기록할 파일")
+
+
+def partition(nodeids, durations, workers):
+    """
+    테스트를 workers개 묶음으로 나눈다
+
+    오래 걸리는 테스트부터 현재 가장 한가한 묶음에 넣는다 (LPT 스케줄링).
+    묶음 안의 순서는 원래 수집 순서를 따른다.
+    """
+    order = {nodeid: i for i, nodeid in enumerate(nodeids)}
+    known = [durations[n] for n in nodeids if n in durations]
+    default = sum(known) / len(known) if known else DEFAULT_DURATION
+    cost = {n: durations.get(n, default) for n in nodeids}
+
+    heap = [(0.0, i) for i in range(workers)]
+    buckets = [[] for _ in range(workers)]
+    for nodeid in sorted(nodeids, key=lambda n: (-cost[n], order[n])):
+        load, i = heapq.heappop(heap)
+        buckets[i].append(nodeid)
+        heapq.heappush(heap, (load + cost[nodeid], i))
+    return [sorted(bucket, key=order.__getitem__) for bucket in buckets if bucket]
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    """워커: 부모가 배정한 테스트만 남긴다"""
+    path = config.getoption("parallel_ids")
+    if not path:
+        return
+    with open(path, encoding="utf-8") as f:
+        wanted = set(json.load(f))
+    selected = [item for item in items if item.nodeid in wanted]
+    deselected = [item for item in items if item.nodeid not in wanted]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+    items[:] = selected
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtestloop(session):
+    """부모: 테스트를 나눠서 워커를 실행하고 결과를 합친다"""
+    config = session.config
+    workers = config.getoption("workers")
+    if workers <= 1 or config.getoption("parallel_out") or config.option.collectonly:
+        return None
+    if session.testsfailed and not config.option.continue_on_collection_errors:
+        raise session.Interrupted(f"수집 중 오류 {session.testsfailed}개")
+
+    items = {item.nodeid: item for item in session.items}
+    serial, parallel = [], []
+    for nodeid, item in items.items():
+        (serial if item.get_closest_marker("serial") else parallel).append(nodeid)
+    cache = getattr(config, "cache", None)
+    durations = cache.get(DURATIONS_KEY, {}) if cache else {}
+    buckets = partition(parallel, durations, workers)
+
+    with tempfile.TemporaryDirectory(prefix="pytest-parallel-") as tmp:
+        measured = {}
+        stopped = _run_workers(session, items, buckets, tmp, measured)
+        if serial and not stopped:
+            _run_workers(session, items, [serial], tmp, measured, first_index=len(buckets))
+
+    if cache:
+        durations.update(measured)
+        cache.set(DURATIONS_KEY, durations)
+    return True
+
+
+def _run_workers(session, items, buckets, tmp, measured, first_index=0):
+    """묶음마다 워커를 동시에 실행하고 결과를 반영한다. 중간에 멈춰야 하면 True"""
+    config = session.config
+    procs = [
+        _start_worker(config, bucket, tmp, first_index + i) for i, bucket in enumerate(buckets)
+    ]
+    for (proc, out_path, log_path), bucket in zip(procs, buckets):
+        proc.wait()
+        seen = _replay(config, out_path, measured)
+        missing = [nodeid for nodeid in bucket if nodeid not in seen]
+        if missing:
+            output = _tail(log_path)
+            for nodeid in missing:
+                _report_crash(config, items[nodeid], proc.returncode, output)
+        if session.shouldstop or session.shouldfail:
+            return True
+    return False
+
+
+def _start_worker(config, nodeids, tmp, index):
+    ids_path = os.path.join(tmp, f"ids-{index}.json")
+    out_path = os.path.join(tmp, f"out-{index}.jsonl")
+    log_path = os.path.join(tmp, f"log-{index}.txt")
+    with open(ids_path, "w", encoding="utf-8") as f:
+        json.dump(nodeids, f, ensure_ascii=False)
+
+    # 배정된 테스트가 있는 파일만 수집한다
+    paths = list(dict.fromkeys(nodeid.split("::", 1)[0] for nodeid in nodeids))
+    args = [
+        sys.executable, "-m", "pytest", *paths,
+        "--parallel-ids", ids_path, "--parallel-out", out_path,
+        "-p", "no:cacheprovider", "-q", "--rootdir", str(config.rootpath),
+    ]
+    if config.inipath:
+        args += ["-c", str(config.inipath)]
+    # conftest.py에서 이미 등록했어도 같은 모듈은 한 번만 등록된다
+    args += ["-p", __name__, *_passthrough_args(config)]
+
+    # 출력은 워커가 결과 없이 끝났을 때만 읽는다
+    with open(log_path, "wb") as log:
+        proc = subprocess.Popen(
+            args, cwd=config.rootpath, stdout=log, stderr=subprocess.STDOUT,
+        )
+    return proc, out_path, log_path
+
+
+def _passthrough_args(config):
+    """결과에 영향을 주는 옵션만 워커에 넘긴다"""
+    option = config.option
+    args = []
+    if option.tbstyle != "auto":
+        args.append(f"--tb={option.tbstyle}")
+    if option.capture != "fd":
+        args.append(f"--capture={option.capture}")
+    if option.showlocals:
+        args.append("-l")
+    for warning in option.pythonwarnings or ():
+        args.append(f"-W{warning}")
+    for override in option.override_ini or ():
+        args += ["-o", override]
+    for flag in ("strict", "strict_config", "strict_markers", "runxfail"):
+        if getattr(option, flag, None):
+            args.append("--" + flag.replace("_", "-"))
+    for plugin in option.plugins or ():
+        args += ["-p", plugin]
+    return args
+
+
+def _tail(path, limit=4000):
+    """워커 출력의 끝부분 (limit 글자까지)"""
+    try:
+        with open(path, "rb") as f:
+            text = f.read().decode("utf-8", "replace")
+    except OSError:
+        return ""
+    return text if len(text) <= limit else "...\n" + text[-limit:]
+
+
+# 워커로 실행 중일 때의 config (부모에서는 None)
+_worker_config = None
+
+
+def pytest_configure(config):
+    global _worker_config
+    config.addinivalue_line(
+        "markers", "serial: --workers로 실행할 때 다른 테스트와 겹치지 않게 마지막에 따로 실행",
+    )
+    if config.getoption("parallel_out"):
+        _worker_config = config
+
+
+def pytest_unconfigure(config):
+    global _worker_config
+    if _worker_config is config:
+        _worker_config = None
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_runtest_logreport(report):
+    """워커: 결과를 한 줄씩 JSON으로 기록한다"""
+    config = _worker_config
+    if config is None:
+        return
+    data = config.hook.pytest_report_to_serializable(config=config, report=report)
+    with open(config.getoption("parallel_out"), "a", encoding="utf-8") as f:
+        f.write(json.dumps(data, ensure_ascii=False) + "\n")
+
+
+def _replay(config, out_path, measured):
+    """워커 결과를 부모 리포트에 반영한다. 결과가 있는 테스트 ID 집합을 반환"""
+    seen = set()
+    if not os.path.exists(out_path):
+        return seen
+    hook = config.hook
+    with open(out_path, encoding="utf-8") as f:
+        for line in f:
+            data = json.loads(line)
+            report = hook.pytest_report_from_serializable(config=config, data=data)
+            if report.nodeid not in seen:
+                seen.add(report.nodeid)
+                hook.pytest_runtest_logstart(nodeid=report.nodeid, location=report.location)
+            hook.pytest_runtest_logreport(report=report)
+            measured[report.nodeid] = measured.get(report.nodeid, 0.0) + report.duration
+            if report.when == "teardown":
+                hook.pytest_runtest_logfinish(nodeid=report.nodeid, location=report.location)
+    return seen
+
+
+def _report_crash(config, item, returncode, output=""):
+    """결과 없이 끝난 테스트는 실패로 기록한다 (워커가 비정상 종료한 경우)"""
+    hook = config.hook
+    hook.pytest_runtest_logstart(nodeid=item.nodeid, location=item.location)
+    report = TestReport(
+        nodeid=item.nodeid,
+        location=item.location,
+        keywords={},
+        outcome="failed",
+        longrepr=f"워커 프로세스가 결과 없이 종료됨 (종료 코드 {returncode})"
+                 + (f"\n\n워커 출력:\n{output}" if output.strip() else ""),
+        when="call",
+        duration=0.0,
+        start=time.time(),
+        stop=time.time(),
+    )
+    hook.pytest_runtest_logreport(report=report)
+    hook.pytest_runtest_logfinish(nodeid=item.nodeid, location=item.location)
@@ -0,0 +1,293 @@
+"""
+테스트 시간 프로파일러
+===================
+테스트 실행 시간이 어디에 쓰이는지 단계별로 잰다.
+
+    pytest --profile                         # 요약을 터미널에 출력
+    pytest --profile-report profile.json     # 정렬된 전체 결과를 JSON으로 저장
+    pytest --profile-trace trace.json        # Chrome trace (chrome://tracing, Perfetto)
+    pytest --profile --profile-memory        # tracemalloc 최대 메모리도 기록
+
+기록하는 것
+- 단계별 시간: 수집, 테스트마다 setup / call / teardown
+- fixture별 만들기(setup)와 정리(teardown) 시간, 횟수, scope
+  → 여러 번 만들어지면서 비싼 fixture가 scope를 넓힐 후보
+- 시간은 벽시계(wall)와 CPU 시간 둘 다
+- --profile-memory: 구간마다 tracemalloc 최대 사용량 증가분
+
+fixture 시간에는 그 fixture가 의존하는 다른 fixture 시간이 들어가지 않는다.
+--workers와 함께 쓰면 부모 프로세스(수집)만 측정된다.
+"""
+
+import json
+import os
+import time
+import tracemalloc
+from functools import partial
+
+import pytest
+
+
+DEFAULT_TOP = 10
+
+PHASES = ("collection", "setup", "call", "teardown")
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("profiler", "테스트 시간 프로파일")
+    group.addoption("--profile", action="store_true", help="단계/fixture별 시간을 재서 요약 출력")
+    group.addoption("--profile-report", metavar="PATH", help="정렬된 결과를 JSON으로 저장")
+    group.addoption("--profile-trace", metavar="PATH", help="Chrome trace-event JSON으로 저장")
+    group.addoption("--profile-memory", action="store_true", help="tracemalloc 최대 메모리도 기록")
+    group.addoption("--profile-top", type=int, default=DEFAULT_TOP, metavar="N",
+                    help=f"요약에 보여줄 항목 수 (기본 {DEFAULT_TOP})")
+
+
+def pytest_configure(config):
+    option = config.option
+    if option.profile or option.profile_report or option.profile_trace or option.profile_memory:
+        config.pluginmanager.register(Profiler(config), "profiler")
+
+
+class _Stat:
+    """같은 이름 구간의 누적값"""
+
+    __slots__ = ("count", "wall", "cpu", "max_wall", "memory")
+
+    def __init__(self):
+        self.count = 0
+        self.wall = 0
+        self.cpu = 0
+        self.max_wall = 0
+        self.memory = None
+
+    def add(self, wall, cpu, memory):
+        self.count += 1
+        self.wall += wall
+        self.cpu += cpu
+        self.max_wall = max(self.max_wall, wall)
+        if memory is not None:
+            self.memory = memory if self.memory is None else max(self.memory, memory)
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "wall_ms": self.wall / 1e6,
+            "cpu_ms": self.cpu / 1e6,
+            "max_wall_ms": self.max_wall / 1e6,
+            "memory_peak_bytes": self.memory,
+        }
+
+
+class Profiler:
+    """
+    구간 시간을 재서 모으는 플러그인 객체
+
+    구간은 중첩된다 (setup 안에 fixture들). 메모리 최대값은
+    tracemalloc이 하나뿐이라서, 안쪽 구간이 끝나면 그 최대값을 바깥 구간에 합친다.
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self.memory = config.option.profile_memory
+        self.phases = {phase: _Stat() for phase in PHASES}
+        self.tests = {}  # nodeid → {phase: _Stat}
+        self.fixture_setup = {}  # (이름, scope) → _Stat
+        self.fixture_teardown = {}
+        self.events = []  # (이름, 분류, 시작 ns, 길이 ns, cpu ns, 메모리, 추가 정보)
+        self._stack = []
+        self._teardown_start = {}
+        self._origin = time.perf_counter_ns()
+        self._started_tracemalloc = False
+
+    # --- 구간 측정 ---
+
+    def _begin(self):
+        memory = None
+        if self.memory:
+            current, peak = tracemalloc.get_traced_memory()
+            if self._stack:
+                parent = self._stack[-1]
+                parent[3] = max(parent[3], peak)
+            tracemalloc.reset_peak()
+            memory = current
+        # [시작 wall, 시작 cpu, 시작 메모리, 구간 안 최대 메모리]
+        self._stack.append([time.perf_counter_ns(), time.process_time_ns(), memory, memory])
+
+    def _end(self, name, category, args=None):
+        wall_end = time.perf_counter_ns()
+        cpu_end = time.process_time_ns()
+        start, cpu_start, memory_start, peak = self._stack.pop()
+        memory = None
+        if self.memory:
+            peak = max(peak, tracemalloc.get_traced_memory()[1])
+            memory = peak - memory_start
+            if self._stack:
+                parent = self._stack[-1]
+                parent[3] = max(parent[3], peak)
+        wall, cpu = wall_end - start, cpu_end - cpu_start
+        self.events.append((name, category, start, wall, cpu, memory, args))
+        return wall, cpu, memory
+
+    # --- hooks ---
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_sessionstart(self, session):
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+
+    @pytest.hookimpl(wrapper=True)
+    def pytest_collection(self, session):
+        self._begin()
+        try:
+            return (yield)
+        finally:
+            self.phases["collection"].add(*self._end("collection", "collection"))
+
+    @pytest.hookimpl(wrapper=True)
+    def pytest_runtest_setup(self, item):
+        return (yield from self._phase(item, "setup"))
+
+    @pytest.hookimpl(wrapper=True)
+    def pytest_runtest_call(self, item):
+        return (yield from self._phase(item, "call"))
+
+    @pytest.hookimpl(wrapper=True)
+    def pytest_runtest_teardown(self, item, nextitem):
+        return (yield from self._phase(item, "teardown"))
+
+    def _phase(self, item, phase):
+        self._begin()
+        try:
+            return (yield)
+        finally:
+            measured = self._end(f"{item.nodeid} [{phase}]", phase, {"nodeid": item.nodeid})
+            self.phases[phase].add(*measured)
+            self.tests.setdefault(item.nodeid, {}).setdefault(phase, _Stat()).add(*measured)
+
+    @pytest.hookimpl(wrapper=True)
+    def pytest_fixture_setup(self, fixturedef, request):
+        if _is_direct_param(fixturedef):
+            return (yield)
+        self._begin()
+        try:
+            return (yield)
+        finally:
+            key = (fixturedef.argname, fixturedef.scope)
+            measured = self._end(fixturedef.argname, "fixture setup", {"scope": fixturedef.scope})
+            self.fixture_setup.setdefault(key, _Stat()).add(*measured)
+            # 나중에 등록한 finalizer가 먼저 실행된다
+            # → fixture의 정리 코드보다 먼저 불려서 정리 시작 시각이 된다
+            fixturedef.addfinalizer(partial(self._teardown_begin, fixturedef))
+
+    def _teardown_begin(self, fixturedef):
+        self._teardown_start[id(fixturedef)] = len(self._stack)
+        self._begin()
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_fixture_post_finalizer(self, fixturedef, request):
+        depth = self._teardown_start.pop(id(fixturedef), None)
+        if depth is None or len(self._stack) != depth + 1:
+            return
+        key = (fixturedef.argname, fixturedef.scope)
+        measured = self._end(fixturedef.argname, "fixture teardown", {"scope": fixturedef.scope})
+        self.fixture_teardown.setdefault(key, _Stat()).add(*measured)
+
+    def pytest_sessionfinish(self, session):
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+        option = self.config.option
+        if option.profile_report:
+            _write_json(option.profile_report, self.report())
+        if option.profile_trace:
+            _write_json(option.profile_trace, self.trace())
+
+    def pytest_terminal_summary(self, terminalreporter):
+        write = terminalreporter.write_line
+        terminalreporter.write_sep("=", "테스트 시간 프로파일")
+        write(f"{'단계':<12}{'횟수':>8}{'wall(ms)':>12}{'cpu(ms)':>12}")
+        for phase, stat in self.phases.items():
+            write(f"{phase:<12}{stat.count:>8}{stat.wall / 1e6:>12.1f}{stat.cpu / 1e6:>12.1f}")
+
+        top = self.config.option.profile_top
+        report = self.report()
+        if report["fixtures"]:
+            write("")
+            write(f"fixture setup 시간 상위 {top}개 (여러 번 만들면 scope 확대 후보)")
+            for entry in report["fixtures"][:top]:
+                memory = entry["setup"]["memory_peak_bytes"]
+                memory = f"  mem={memory / 1024:.1f}KB" if memory is not None else ""
+                write(
+                    f"  {entry['setup']['wall_ms']:>9.1f}ms  {entry['setup']['count']:>5}회  "
+                    f"{entry['name']} ({entry['scope']}){memory}"
+                )
+        if report["tests"]:
+            write("")
+            write(f"오래 걸린 테스트 상위 {top}개")
+            for entry in report["tests"][:top]:
+                phases = "  ".join(
+                    f"{phase}={entry[phase]['wall_ms']:.1f}" for phase in PHASES if phase in entry
+                )
+                write(f"  {entry['wall_ms']:>9.1f}ms  {entry['nodeid']}  ({phases})")
+
+    # --- 결과 ---
+
+    def report(self):
+        """정렬된 결과 (시간이 긴 순서)"""
+        fixtures = []
+        for key, setup in self.fixture_setup.items():
+            name, scope = key
+            teardown = self.fixture_teardown.get(key)
+            fixtures.append({
+                "name": name,
+                "scope": scope,
+                "setup": setup.to_dict(),
+                "teardown": teardown.to_dict() if teardown else None,
+            })
+        fixtures.sort(key=lambda entry: -entry["setup"]["wall_ms"])
+
+        tests = []
+        for nodeid, stats in self.tests.items():
+            entry = {"nodeid": nodeid, "wall_ms": sum(s.wall for s in stats.values()) / 1e6}
+            entry.update((phase, stat.to_dict()) for phase, stat in stats.items())
+            tests.append(entry)
+        tests.sort(key=lambda entry: -entry["wall_ms"])
+
+        return {
+            "phases": {phase: stat.to_dict() for phase, stat in self.phases.items()},
+            "fixtures": fixtures,
+            "tests": tests,
+        }
+
+    def trace(self):
+        """Chrome trace-event 형식 (완료 이벤트 "X", 단위 μs)"""
+        pid = os.getpid()
+        events = []
+        for name, category, start, wall, cpu, memory, args in self.events:
+            args = dict(args or (), cpu_ms=cpu / 1e6)
+            if memory is not None:
+                args["memory_peak_bytes"] = memory
+            events.append({
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": (start - self._origin) / 1e3,
+                "dur": wall / 1e3,
+                "pid": pid,
+                "tid": 1,
+                "args": args,
+            })
+        events.sort(key=lambda event: event["ts"])
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def _is_direct_param(fixturedef):
+    """parametrize 인자를 위해 pytest가 만든 가짜 fixture인지"""
+    return getattr(fixturedef.func, "__name__", "") == "get_direct_param_fixture_func"
+
+
+def _write_json(path, data):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=1)
@@ -0,0 +1,206 @@
+"""
+점수 파일
+========
+int16/int32 점수가 연달아 들어 있는 바이너리 파일을 mmap으로 읽는다.
+
+    with ScoreFile("scores.bin", "h") as scores:
+        scores.view[0]                    # 복사 없는 memoryview (int16)
+        grade_many(scores)                # 등급 코드 array
+        grade_parallel(scores)            # 워커가 파일을 직접 매핑해서 집계
+        validate_range(scores)            # 범위 밖 점수 개수와 위치
+
+파일 내용은 메모리로 복사하지 않는다. chunks()로 구간을 차례로 읽으면
+다 읽은 페이지를 바로 내려놓기 때문에(madvise DONTNEED) 수 GB 파일도
+RSS는 구간 하나 크기 정도만 늘어난다. 페이지는 OS 페이지 캐시에 남는다.
+
+바이트 순서는 이 기계의 순서를 따른다 (x86, ARM은 리틀 엔디언).
+고정 폭 텍스트 파일은 convert_fixed_width로 한 번 바꿔서 쓴다.
+"""
+
+import mmap
+import os
+from array import array
+from collections import namedtuple
+
+
+# typecode → 한 점수의 바이트 수
+TYPECODES = {"h": 2, "i": 4}
+
+# chunks()가 한 번에 넘기는 크기 (페이지 크기의 배수)
+DEFAULT_CHUNK_BYTES = 8 << 20
+
+RangeCheck = namedtuple("RangeCheck", "checked invalid samples")
+RangeCheck.__doc__ = "validate_range 결과. samples는 앞쪽 [(줄 번호, 점수), ...]"
+
+
+class ScoreFile:
+    """
+    점수 바이너리 파일의 읽기 전용 매핑
+
+    path: 파일 경로
+    typecode: "h"(int16) 또는 "i"(int32)
+    offset: 앞쪽 헤더 바이트 수 (건너뜀)
+    chunk_bytes: chunks()의 기본 구간 크기
+
+    view는 파일 전체를 typecode로 본 memoryview다. 인덱스로 바로 읽어도 되지만
+    전체를 훑을 때는 chunks()를 써야 RSS가 파일 크기만큼 늘지 않는다.
+    """
+
+    __slots__ = ("path", "typecode", "offset", "chunk_bytes", "view", "_file", "_mmap")
+
+    def __init__(self, path, typecode="h", offset=0, chunk_bytes=DEFAULT_CHUNK_BYTES):
+        if typecode not in TYPECODES:
+            raise ValueError("typecode는 'h'(int16) 또는 'i'(int32)만 가능")
+        if chunk_bytes < mmap.PAGESIZE or chunk_bytes % mmap.PAGESIZE:
+            raise ValueError(f"chunk_bytes는 페이지 크기({mmap.PAGESIZE})의 배수여야 함")
+        self.path = os.fspath(path)
+        self.typecode = typecode
+        self.offset = offset
+        self.chunk_bytes = chunk_bytes
+
+        self._file = open(self.path, "rb")
+        try:
+            size = os.fstat(self._file.fileno()).st_size
+            if not 0 <= offset <= size:
+                raise ValueError(f"offset이 파일 크기({size}) 밖임: {offset}")
+            if (size - offset) % TYPECODES[typecode]:
+                raise ValueError(f"점수 영역이 {TYPECODES[typecode]}바이트 단위가 아님")
+            if size:
+                self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+                if hasattr(self._mmap, "madvise"):
+                    self._mmap.madvise(mmap.MADV_SEQUENTIAL)  # 미리 읽기를 크게
+                data = memoryview(self._mmap)[offset:]
+            else:
+                self._mmap = None  # 빈 파일은 mmap할 수 없다
+                data = memoryview(b"")
+            self.view = data.cast(typecode)
+            data.release()
+        except BaseException:
+            self._file.close()
+            raise
+
+    def __repr__(self):
+        return f"ScoreFile({self.path!r}, {self.typecode!r}, {len(self)} scores)"
+
+    def __len__(self):
+        return len(self.view)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """매핑을 닫는다. chunks()에서 받은 구간을 아직 잡고 있으면 BufferError"""
+        self.view.release()
+        if self._mmap is not None:
+            self._mmap.close()
+        self._file.close()
+
+    def chunks(self, start=0, stop=None, chunk_bytes=None):
+        """
+        [start, stop) 구간을 (시작 인덱스, memoryview) 조각으로 나눠 넘긴다
+
+        다음 조각으로 넘어갈 때 앞 조각은 release되고, 다 읽은 페이지는 내려놓는다.
+        조각을 다음 반복 이후까지 들고 있으면 안 된다 (필요하면 복사해 둔다).
+        """
+        stop = len(self) if stop is None else min(stop, len(self))
+        itemsize = TYPECODES[self.typecode]
+        step = max(1, (chunk_bytes or self.chunk_bytes) // itemsize)
+        released = (self.offset + start * itemsize) // mmap.PAGESIZE * mmap.PAGESIZE
+        for i in range(start, stop, step):
+            j = min(i + step, stop)
+            with self.view[i:j] as chunk:
+                yield i, chunk
+            # 끝 페이지는 다음 조각과 겹칠 수 있어서 남겨 둔다
+            end = (self.offset + j * itemsize) // mmap.PAGESIZE * mmap.PAGESIZE
+            released = self._drop_pages(released, end)
+        self._drop_pages(released, self.offset + stop * itemsize)
+
+    def _drop_pages(self, start, end):
+        """다 읽은 [start, end) 페이지를 이 프로세스의 RSS에서 뺀다"""
+        if end > start and self._mmap is not None and hasattr(self._mmap, "madvise"):
+            self._mmap.madvise(mmap.MADV_DONTNEED, start, min(end, len(self._mmap)) - start)
+        return max(start, end)
+
+    def numpy(self):
+        """파일 전체를 복사 없이 numpy 배열로 본다 (numpy 필요)"""
+        try:
+            import numpy as np  # 선택 의존성이고 import가 느려서 여기서 불러온다
+        except ImportError:
+            raise ImportError("numpy가 설치되어 있지 않음") from None
+        return np.frombuffer(self.view, dtype=np.int16 if self.typecode == "h" else np.int32)
+
+
+def write_scores(path, scores, typecode="h"):
+    """점수 iterable을 ScoreFile 형식으로 저장한다. 저장한 개수를 반환한다"""
+    if typecode not in TYPECODES:
+        raise ValueError("typecode는 'h'(int16) 또는 'i'(int32)만 가능")
+    count = 0
+    buffer = array(typecode)
+    with open(path, "wb") as f:
+        for score in scores:
+            buffer.append(score)
+            if len(buffer) >= 1 << 16:
+                count += len(buffer)
+                buffer.tofile(f)
+                del buffer[:]
+        count += len(buffer)
+        buffer.tofile(f)
+    return count
+
+
+def convert_fixed_width(source, dest, width, typecode="h"):
+    """
+    고정 폭 텍스트 점수 파일을 ScoreFile 형식으로 바꾼다
+
+    한 줄이 줄바꿈을 포함해 정확히 width바이트여야 한다 (예: " 85\\n"이면 width=4).
+    한 번에 일정 크기씩만 읽는다. 잘못된 줄이 있으면 줄 번호를 붙여 ValueError.
+    변환한 개수를 반환한다.
+    """
+    if typecode not in TYPECODES:
+        raise ValueError("typecode는 'h'(int16) 또는 'i'(int32)만 가능")
+    records_per_read = max(1, DEFAULT_CHUNK_BYTES // width)
+    count = 0
+    with open(source, "rb") as src, open(dest, "wb") as out:
+        while block := src.read(records_per_read * width):
+            scores = array(typecode)
+            for i in range(0, len(block), width):
+                record = block[i:i + width]
+                if len(record) != width or record[-1] != 0x0A:  # 줄바꿈으로 끝나야 함
+                    raise ValueError(f"{count + i // width + 1}번 줄: 길이가 {width}바이트가 아님")
+                try:
+                    scores.append(int(record))
+                except (ValueError, OverflowError) as e:
+                    problem = "범위 밖" if isinstance(e, OverflowError) else "점수가 아님"
+                    raise ValueError(f"{count + i // width + 1}번 줄: {problem} {record!r}") from None
+            scores.tofile(out)
+            count += len(scores)
+    return count
+
+
+def validate_range(scores, max_score=100, max_errors=100):
+    """
+    점수가 0 ~ max_score 사이인지 검사한다
+
+    scores는 ScoreFile 또는 정수 버퍼/iterable이다.
+    조각마다 min/max부터 보고, 범위 밖 값이 있는 조각만 다시 훑는다.
+    """
+    if isinstance(scores, ScoreFile):
+        chunks = scores.chunks()
+    else:
+        chunks = [(0, scores if isinstance(scores, (array, memoryview)) else list(scores))]
+
+    checked = invalid = 0
+    samples = []
+    for start, chunk in chunks:
+        checked += len(chunk)
+        if not chunk or (min(chunk) >= 0 and max(chunk) <= max_score):
+            continue
+        for i, score in enumerate(chunk):
+            if not 0 <= score <= max_score:
+                invalid += 1
+                if len(samples) < max_errors:
+                    samples.append((start + i + 1, score))
+    return RangeCheck(checked, invalid, samples)
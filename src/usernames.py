@@ -0,0 +1,54 @@
+"""
+사용자명 검사
+============
+사용자명이 유효한지 검사한다 (3~10자, 영문숫자만).
+
+- is_valid_username: 사용자명 하나 검사
+- validate_usernames: 여러 사용자명을 한 번에 검사
+- iter_username_file: 파일을 한 줄씩 읽으면서 검사 (메모리에 전부 올리지 않음)
+"""
+
+import re
+
+
+# [^\W_] = \w 에서 밑줄만 뺀 것 = str.isalnum()과 같은 문자 집합 (유니코드 포함)
+# 길이 검사까지 패턴 하나로 처리한다
+USERNAME_PATTERN = re.compile(r"[^\W_]{3,10}")
+
+_match = USERNAME_PATTERN.fullmatch
+
+
+def is_valid_username(username):
+    """사용자명이 유효한지 검사한다 (3~10자, 영문숫자만)"""
+    if not username:
+        return False
+    if not 3 <= len(username) <= 10:
+        return False
+    return username.isalnum()
+
+
+def validate_usernames(usernames):
+    """여러 사용자명을 검사해서 결과(bool) 리스트를 반환한다"""
+    match = _match
+    return [bool(name) and match(name) is not None for name in usernames]
+
+
+def iter_username_file(source, encoding="utf-8"):
+    """
+    한 줄에 사용자명 하나씩 있는 파일을 검사한다
+
+    source는 파일 경로 또는 열린 텍스트 파일이다.
+    (줄 번호, 사용자명, 유효 여부)를 한 줄씩 yield 한다. 줄 번호는 1부터.
+    """
+    if hasattr(source, "readline"):
+        yield from _iter_lines(source)
+        return
+    with open(source, encoding=encoding, newline="") as f:
+        yield from _iter_lines(f)
+
+
+def _iter_lines(f):
+    match = _match
+    for line_no, line in enumerate(f, 1):
+        name = line.rstrip("\r\n")
+        yield line_no, name, bool(name) and match(name) is not None
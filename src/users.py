@@ -0,0 +1,314 @@
+"""
+사용자 저장소
+===========
+user_data fixture와 같은 모양({"id", "name", "email", "active"})의 사용자를
+수백만 명 메모리에 올려 두고 id/email로 찾는다.
+
+사용자마다 dict를 만들지 않고 ColumnarCart처럼 열 단위로 저장한다.
+
+    ids        = array('q', [1, 2])             # id
+    names      = ["홍길동", "김철수"]              # 같은 이름은 같은 str 객체 (intern)
+    locals     = ["hong", "kim"]                # 이메일 @ 앞부분
+    domain_ids = array('I', [0, 0])             # 이메일 도메인 → domains 표의 번호
+    domains    = ["example.com"]                # 도메인은 한 번만 저장
+    active     = bytearray(...)                 # 활성 여부 1비트씩
+
+id/email 색인은 dict 대신 행 번호만 담은 array('q') 해시 표(열린 주소법)다.
+키 객체를 따로 만들지 않아서 색인 비용은 사용자 하나당 칸 몇 개(8바이트씩)뿐이다.
+조회는 O(1). 꺼낼 때만 User 객체를 만든다.
+"""
+
+import json
+import os
+import sys
+from array import array
+
+
+_EMPTY = -1
+
+# 피보나치 해싱: 연속된 id도 표 전체에 고르게 흩어진다
+_GOLDEN = 0x9E3779B97F4A7C15
+_MASK64 = (1 << 64) - 1
+
+_MIN_BITS = 4
+
+# ids 열(array('q'))에 들어가는 범위
+_ID_MIN, _ID_MAX = -(1 << 63), (1 << 63) - 1
+
+
+class User:
+    """저장소에서 꺼낸 사용자 한 명 (읽기 전용 사본)"""
+
+    __slots__ = ("id", "name", "email", "active")
+
+    def __init__(self, id, name, email, active):
+        self.id = id
+        self.name = name
+        self.email = email
+        self.active = active
+
+    def __repr__(self):
+        return f"User({self.id}, {self.name!r}, {self.email!r}, active={self.active})"
+
+    def __eq__(self, other):
+        if not isinstance(other, User):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def to_dict(self):
+        return {"id": self.id, "name": self.name, "email": self.email, "active": self.active}
+
+
+def _split_email(email):
+    local, at, domain = email.rpartition("@")
+    if not at or not local or not domain:
+        raise ValueError(f"이메일 형식이 아님: {email!r}")
+    return local, domain
+
+
+class _RowTable:
+    """
+    행 번호만 담는 해시 표 (열린 주소법, 선형 탐사)
+
+    키 비교는 저장소의 열을 보고 한다. 그래서 키 객체를 보관하지 않는다.
+    채운 비율이 절반을 넘으면 두 배로 늘린다.
+    """
+
+    __slots__ = ("slots", "bits", "used")
+
+    def __init__(self, capacity=0):
+        bits = _MIN_BITS
+        while (1 << bits) < capacity * 2:
+            bits += 1
+        self.bits = bits
+        self.slots = array("q", [_EMPTY]) * (1 << bits)
+        self.used = 0
+
+    def start(self, key_hash):
+        """탐사를 시작할 칸. 찾기는 저장소가 직접 한다 (열을 보고 키 비교)"""
+        return ((key_hash * _GOLDEN) & _MASK64) >> (64 - self.bits)
+
+    def insert(self, key_hash, row):
+        """중복 검사는 호출하는 쪽에서 한다"""
+        if (self.used + 1) * 2 > len(self.slots):
+            raise OverflowError  # 호출하는 쪽에서 rebuild
+        slots = self.slots
+        mask = len(slots) - 1
+        i = self.start(key_hash)
+        while slots[i] != _EMPTY:
+            i = (i + 1) & mask
+        slots[i] = row
+        self.used += 1
+
+
+class UserStore:
+    """
+    열 단위 사용자 저장소
+
+        store = UserStore.load_jsonl("users.jsonl")
+        store[1]                         # User(1, '홍길동', 'hong@example.com', active=True)
+        store.by_email("hong@example.com")
+        store.memory_per_record()        # 사용자 한 명당 바이트
+
+    id와 email은 각각 중복될 수 없다.
+    """
+
+    __slots__ = ("ids", "names", "locals", "domain_ids", "domains", "active",
+                 "_domain_index", "_names", "_id_table", "_email_table")
+
+    def __init__(self, capacity=0):
+        self.ids = array("q")
+        self.names = []
+        self.locals = []
+        self.domain_ids = array("I")
+        self.domains = []
+        self.active = bytearray()
+        self._domain_index = {}  # 도메인 → 번호
+        self._names = {}         # 이름 → 같은 str 객체 (intern 표)
+        self._id_table = _RowTable(capacity)
+        self._email_table = _RowTable(capacity)
+
+    @classmethod
+    def from_records(cls, records):
+        """{"id", "name", "email", "active"} 딕셔너리 목록으로 만든다"""
+        store = cls()
+        for record in records:
+            store.add(record["id"], record["name"], record["email"], record.get("active", True))
+        return store
+
+    @classmethod
+    def load_jsonl(cls, source, encoding="utf-8"):
+        """
+        한 줄에 사용자 하나(JSON 객체)씩 있는 파일을 읽는다
+
+        source는 파일 경로 또는 열린 텍스트 파일이다.
+        잘못된 줄이 있으면 줄 번호를 붙여 ValueError.
+        """
+        if isinstance(source, (str, os.PathLike)):
+            with open(source, encoding=encoding) as f:
+                return cls.load_jsonl(f)
+        store = cls()
+        add = store.add
+        for line_no, line in enumerate(source, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                add(record["id"], record["name"], record["email"], record.get("active", True))
+            except (ValueError, KeyError, TypeError) as e:
+                message = f"{e.args[0]} 필드 없음" if isinstance(e, KeyError) else str(e)
+                raise ValueError(f"{line_no}번 줄: {message}") from None
+        return store
+
+    def __repr__(self):
+        return f"UserStore({len(self.ids)} users, {len(self.domains)} domains)"
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __contains__(self, user_id):
+        return self._find_id(user_id) != _EMPTY
+
+    def __iter__(self):
+        return map(self._user, range(len(self.ids)))
+
+    def __getitem__(self, user_id):
+        row = self._find_id(user_id)
+        if row == _EMPTY:
+            raise KeyError(user_id)
+        return self._user(row)
+
+    def get(self, user_id, default=None):
+        row = self._find_id(user_id)
+        return default if row == _EMPTY else self._user(row)
+
+    def by_email(self, email, default=None):
+        row = self._find_email(email)
+        return default if row == _EMPTY else self._user(row)
+
+    def email(self, row):
+        return f"{self.locals[row]}@{self.domains[self.domain_ids[row]]}"
+
+    def is_active(self, row):
+        return bool(self.active[row >> 3] & (1 << (row & 7)))
+
+    def _user(self, row):
+        return User(self.ids[row], self.names[row], self.email(row), self.is_active(row))
+
+    # --- 색인 ---
+
+    def _find_id(self, user_id):
+        if type(user_id) is not int:
+            return _EMPTY
+        table = self._id_table
+        slots, ids = table.slots, self.ids
+        mask = len(slots) - 1
+        i = table.start(hash(user_id))
+        while True:
+            row = slots[i]
+            if row == _EMPTY or ids[row] == user_id:
+                return row
+            i = (i + 1) & mask
+
+    def _find_email(self, email):
+        try:
+            local, domain = _split_email(email)
+        except (ValueError, AttributeError):
+            return _EMPTY
+        domain_id = self._domain_index.get(domain)
+        if domain_id is None:
+            return _EMPTY
+        table = self._email_table
+        slots, locals_, domain_ids = table.slots, self.locals, self.domain_ids
+        mask = len(slots) - 1
+        i = table.start(hash(email))
+        while True:
+            row = slots[i]
+            if row == _EMPTY or (domain_ids[row] == domain_id and locals_[row] == local):
+                return row
+            i = (i + 1) & mask
+
+    def _rebuild(self):
+        """표를 두 배로 늘려서 다시 채운다"""
+        size = len(self.ids)
+        self._id_table = id_table = _RowTable(size * 2)
+        self._email_table = email_table = _RowTable(size * 2)
+        for row, user_id in enumerate(self.ids):
+            id_table.insert(hash(user_id), row)
+            email_table.insert(hash(self.email(row)), row)
+
+    # --- 변경 ---
+
+    def add(self, user_id, name, email, active=True):
+        """사용자를 추가한다. id나 email이 이미 있으면 ValueError"""
+        if type(user_id) is not int:
+            raise TypeError("id는 정수여야 함")
+        if not _ID_MIN <= user_id <= _ID_MAX:
+            raise ValueError(f"id가 64비트 정수 범위를 넘음: {user_id}")
+        if type(name) is not str:
+            raise TypeError("name은 문자열이어야 함")
+        if type(email) is not str:
+            raise TypeError("email은 문자열이어야 함")
+        local, domain = _split_email(email)
+        if self._find_id(user_id) != _EMPTY:
+            raise ValueError(f"id 중복: {user_id}")
+        if self._find_email(email) != _EMPTY:
+            raise ValueError(f"email 중복: {email}")
+
+        domain_id = self._domain_index.get(domain)
+        if domain_id is None:
+            domain_id = self._domain_index[domain] = len(self.domains)
+            self.domains.append(domain)
+        name = self._names.setdefault(name, name)
+
+        row = len(self.ids)
+        self.ids.append(user_id)
+        self.names.append(name)
+        self.locals.append(local)
+        self.domain_ids.append(domain_id)
+        if row & 7 == 0:
+            self.active.append(0)
+        if active:
+            self.active[row >> 3] |= 1 << (row & 7)
+
+        try:
+            self._id_table.insert(hash(user_id), row)
+            self._email_table.insert(hash(email), row)
+        except OverflowError:
+            self._rebuild()
+
+    def set_active(self, user_id, active):
+        row = self._find_id(user_id)
+        if row == _EMPTY:
+            raise KeyError(user_id)
+        if active:
+            self.active[row >> 3] |= 1 << (row & 7)
+        else:
+            self.active[row >> 3] &= ~(1 << (row & 7)) & 0xFF
+
+    def active_count(self):
+        return int.from_bytes(self.active, "little").bit_count()
+
+    # --- 메모리 ---
+
+    def memory_usage(self):
+        """
+        저장소가 차지하는 바이트 (sys.getsizeof 합)
+
+        열, 색인 표, 문자열을 모두 센다. 같은 str 객체(intern된 이름, 도메인)는 한 번만.
+        """
+        total = sum(sys.getsizeof(column) for column in (
+            self.ids, self.names, self.locals, self.domain_ids, self.domains, self.active,
+            self._domain_index, self._names, self._id_table.slots, self._email_table.slots,
+        ))
+        seen = set()
+        for strings in (self.names, self.locals, self.domains):
+            for text in strings:
+                if id(text) not in seen:
+                    seen.add(id(text))
+                    total += sys.getsizeof(text)
+        return total
+
+    def memory_per_record(self):
+        """사용자 한 명당 바이트 (memory_usage / 사용자 수)"""
+        return self.memory_usage() / len(self.ids) if self.ids else 0.0
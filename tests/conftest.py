@@ -0,0 +1,72 @@
+"""
+여러 테스트 파일에서 공유하는 fixture
+
+shared_*: session 동안 한 번만 만들고 테스트마다 복사본을 준다
+frozen_*: session 동안 한 번만 만들고 읽기 전용 뷰를 준다
+run_pytest: 플러그인 테스트용으로 pytest를 하위 프로세스로 실행
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from src.cart import Cart
+from src.fixtures import shared_fixture
+
+
+@shared_fixture
+def shared_sample_list():
+    """sample_list와 같은 리스트 (테스트마다 복사본)"""
+    return [1, 2, 3, 4, 5]
+
+
+@shared_fixture
+def shared_user_data():
+    """user_data와 같은 사용자 데이터 (테스트마다 복사본)"""
+    return {
+        "id": 1,
+        "name": "홍길동",
+        "email": "hong@example.com",
+        "active": True,
+    }
+
+
+@shared_fixture
+def shared_cart():
+    """cart_with_items와 같은 상품이 담긴 Cart (테스트마다 복사본)"""
+    return Cart.from_items([
+        {"name": "사과", "price": 1000, "qty": 3},
+        {"name": "바나나", "price": 500, "qty": 5},
+    ])
+
+
+@shared_fixture(mode="frozen")
+def frozen_numbers():
+    """numbers와 같은 숫자 (읽기 전용 tuple)"""
+    return [10, 20, 30]
+
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture
+def run_pytest():
+    """
+    cwd에서 `python -m pytest *args`를 하위 프로세스로 실행하는 함수
+
+        result = run_pytest(tmp_path, "-q", "--workers", "2", plugin="src.plugins.parallel")
+        result.returncode, result.stdout
+
+    저장소 루트와 cwd를 PYTHONPATH에 넣는다 (src.*와 cwd의 모듈을 import 할 수 있게).
+    """
+    def run(cwd, *args, plugin=None):
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join([str(ROOT), str(cwd)]))
+        plugin_args = ["-p", plugin] if plugin else []
+        return subprocess.run(
+            [sys.executable, "-m", "pytest", *plugin_args, *args],
+            cwd=cwd, env=env, capture_output=True, text=True,
+        )
+    return run
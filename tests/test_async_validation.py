@@ -0,0 +1,140 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.async_validation import (
+    MicroBatcher,
+    ValidationService,
+    avalidate_scores,
+    avalidate_usernames,
+)
+from src.parsing import validate_scores
+from src.usernames import validate_usernames
+
+NAMES = ["abc", "user123", "", "ab", "abcdefghijk", "user@name", "홍길동", "abcdefghij"]
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+class TestApi:
+
+    def test_usernames_match_sync(self):
+        assert run(avalidate_usernames(NAMES)) == validate_usernames(NAMES)
+
+    def test_scores_match_sync(self):
+        scores = [-1, 0, 100, 101, 50.5]
+        assert run(avalidate_scores(scores)) == validate_scores(scores)
+
+    def test_empty(self):
+        assert run(avalidate_usernames([])) == []
+
+    def test_accepts_iterables(self):
+        assert run(avalidate_scores(range(99, 102))) == [True, True, False]
+
+
+class TestMicroBatching:
+
+    def test_concurrent_callers_share_one_batch(self):
+        async def main():
+            service = ValidationService(window=0.01)
+            batches = [[f"user{i}", "a" * (i % 12)] for i in range(100)]
+            results = await asyncio.gather(
+                *(avalidate_usernames(names, service=service) for names in batches)
+            )
+            return service.usernames, batches, results
+
+        batcher, batches, results = run(main())
+        assert results == [validate_usernames(names) for names in batches]
+        assert (batcher.calls, batcher.batches) == (100, 1)
+
+    def test_max_batch_flushes_early(self):
+        async def main():
+            batcher = MicroBatcher(validate_scores, window=10, max_batch=4)
+            start = time.perf_counter()
+            results = await asyncio.gather(batcher.submit([1, 2]), batcher.submit([3, 400]))
+            return results, time.perf_counter() - start, batcher.batches
+
+        results, elapsed, batches = run(main())
+        assert results == [[True, True], [True, False]]
+        assert elapsed < 1  # window(10초)를 기다리지 않음
+        assert batches == 1
+
+    def test_bad_caller_does_not_fail_others(self):
+        async def main():
+            service = ValidationService(window=0.01)
+            return await asyncio.gather(
+                avalidate_usernames(["abc"], service=service),
+                avalidate_usernames([123], service=service),
+                return_exceptions=True,
+            )
+
+        good, bad = run(main())
+        assert good == [True]
+        assert isinstance(bad, TypeError)
+
+    def test_cancelled_caller_is_skipped(self):
+        async def main():
+            batcher = MicroBatcher(validate_scores, window=0.01)
+            cancelled = asyncio.ensure_future(batcher.submit([1]))
+            kept = asyncio.ensure_future(batcher.submit([200]))
+            await asyncio.sleep(0)
+            cancelled.cancel()
+            return await kept
+
+        assert run(main()) == [False]
+
+    @pytest.mark.parametrize("options", [
+        pytest.param({"window": -1}, id="window"),
+        pytest.param({"max_batch": 0}, id="max_batch"),
+        pytest.param({"concurrency": 0}, id="concurrency"),
+    ])
+    def test_invalid_options(self, options):
+        with pytest.raises(ValueError):
+            MicroBatcher(validate_scores, **options)
+
+
+class TestOffload:
+
+    def test_large_batch_runs_in_executor_in_chunks(self):
+        calls = []
+
+        def traced(items):
+            calls.append(len(items))
+            return validate_scores(items)
+
+        async def main():
+            with ThreadPoolExecutor(2) as executor:
+                batcher = MicroBatcher(traced, window=0, offload_threshold=1000, executor=executor)
+                return await batcher.submit(range(-500, 2000))
+
+        result = run(main())
+        assert result == validate_scores(range(-500, 2000))
+        assert sorted(calls) == [500, 1000, 1000]
+
+    def test_loop_stays_responsive(self):
+        names = NAMES * 50_000  # 40만 개
+
+        async def main():
+            lags = []
+
+            async def heartbeat():
+                while True:
+                    before = time.perf_counter()
+                    await asyncio.sleep(0.001)
+                    lags.append(time.perf_counter() - before)
+
+            service = ValidationService(offload_threshold=10_000)
+            beat = asyncio.ensure_future(heartbeat())
+            await asyncio.sleep(0.01)
+            result = await avalidate_usernames(names, service=service)
+            beat.cancel()
+            return result, max(lags)
+
+        result, max_lag = run(main())
+        assert result == validate_usernames(names)
+        # 스레드 풀에서 검사하는 동안에도 루프가 돌아야 한다 (GIL 전환 간격 정도의 지연)
+        assert max_lag < 0.1
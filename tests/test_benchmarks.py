@@ -0,0 +1,36 @@
+import pytest
+
+from benchmarks.suite import CASES, compare, measure, run_suite
+
+
+def result(case, n, ns_per_op):
+    return {"case": case, "n": n, "ns_per_op": ns_per_op}
+
+
+class TestSuite:
+
+    @pytest.mark.parametrize("name", sorted(CASES))
+    def test_every_case_runs(self, name):
+        measured = measure(name, 100)
+        assert measured["case"] == name
+        assert measured["ns_per_op"] > 0
+        assert measured["peak_rss_bytes"] > 0
+
+    def test_isolated_run(self):
+        report = run_suite(["add"], [10], report=lambda line: None)
+        assert [r["case"] for r in report["results"]] == ["add"]
+
+
+class TestCompare:
+
+    def test_detects_regression(self):
+        baseline = {"results": [result("add", 1000, 100.0), result("parse", 1000, 100.0)]}
+        current = {"results": [result("add", 1000, 130.0), result("parse", 1000, 120.0)]}
+        regressions = compare(current, baseline, tolerance=0.25)
+        assert len(regressions) == 1
+        assert regressions[0].startswith("add n=1,000")
+
+    def test_ignores_new_cases(self):
+        baseline = {"results": [result("add", 1000, 100.0)]}
+        current = {"results": [result("add", 10, 1000.0), result("parse", 1000, 1000.0)]}
+        assert compare(current, baseline) == []
@@ -0,0 +1,104 @@
+import math
+
+import pytest
+
+from src.boundary import (
+    INT32_MAX,
+    INT32_MIN,
+    Boundary,
+    Raised,
+    boundary_points,
+    find_boundaries,
+    sweep,
+)
+from src.grading import CUTOFFS, GRADE_LABELS, decode_grades, get_grade, grade_many
+from src.parsing import validate_score
+
+
+def _ok(value):
+    return "ok"
+
+
+def _grade_batch(points):
+    return decode_grades(grade_many(points))
+
+
+class TestFindBoundaries:
+
+    def test_grade_cutoffs(self):
+        boundaries = find_boundaries(get_grade, 0, 100)
+        assert [b.value for b in boundaries] == list(CUTOFFS)
+        assert boundaries[0] == Boundary(60, "F", "D")
+        assert [b.above for b in boundaries] == list(GRADE_LABELS[1:])
+
+    def test_validate_score_raises_are_bands(self):
+        low, high = find_boundaries(validate_score, INT32_MIN, INT32_MAX, key=_ok)
+        assert low == Boundary(0, Raised(ValueError, "음수는 안 됨"), "ok")
+        assert high == Boundary(101, "ok", Raised(ValueError, "100 초과는 안 됨"))
+
+    def test_constant_function(self):
+        assert find_boundaries(abs, 5, 10**9, key=_ok) == []
+
+    def test_float_domain(self):
+        boundaries = find_boundaries(get_grade, 0.0, 100.0, domain="float")
+        assert [b.value for b in boundaries] == [60.0, 70.0, 80.0, 90.0]
+
+    def test_float_sign_change(self):
+        (boundary,) = find_boundaries(lambda x: x > 0.1, -math.inf, math.inf, domain="float")
+        assert boundary.value == math.nextafter(0.1, math.inf)
+
+    @pytest.mark.parametrize("lo, hi, domain, match", [
+        pytest.param(10, 0, "int", "lo가 hi보다", id="역순"),
+        pytest.param(0, 1, "decimal", "domain", id="도메인"),
+        pytest.param(math.nan, 1.0, "float", "NaN", id="nan"),
+    ])
+    def test_invalid_arguments(self, lo, hi, domain, match):
+        with pytest.raises(ValueError, match=match):
+            find_boundaries(get_grade, lo, hi, domain)
+
+    def test_narrow_band_between_probes_needs_more_probes(self):
+        def spike(x):
+            return x == 501
+
+        assert find_boundaries(spike, 0, 1000) == []
+        assert [b.value for b in find_boundaries(spike, 0, 1000, probes=1001)] == [501, 502]
+
+
+class TestBoundaryPoints:
+
+    def test_points_around_each_boundary(self):
+        points = boundary_points(find_boundaries(get_grade, 0, 100), 0, 100)
+        assert points.typecode == "q"
+        assert list(points) == [0, 59, 60, 61, 69, 70, 71, 79, 80, 81, 89, 90, 91, 100]
+
+    def test_float_neighbours(self):
+        boundaries = [Boundary(60.0, "F", "D")]
+        points = boundary_points(boundaries, 0.0, 100.0, domain="float")
+        assert points.typecode == "d"
+        assert list(points) == [0.0, math.nextafter(60.0, 0), 60.0, math.nextafter(60.0, 100), 100.0]
+
+    def test_clipped_to_range(self):
+        assert list(boundary_points([Boundary(0, "a", "b")], 0, 5)) == [0, 1, 5]
+
+
+class TestSweep:
+
+    def test_batch_matches_scalar(self):
+        result = sweep(get_grade, 0, 100, batch=_grade_batch)
+        assert result.mismatches == []
+        assert result.outcomes == [get_grade(p) for p in result.points]
+
+    def test_reports_batch_mismatch(self):
+        result = sweep(get_grade, 0, 100, batch=lambda points: ["F"] * len(points))
+        assert (100, "A", "F") in result.mismatches
+
+    def test_int32_domain_is_fast(self):
+        result = sweep(validate_score, INT32_MIN, INT32_MAX, key=_ok)
+        assert list(result.points) == [INT32_MIN, -1, 0, 1, 100, 101, 102, INT32_MAX]
+        # 2개 경계 × 32비트 이진 탐색 정도만 호출
+        assert result.calls < 2 * 32 + 32
+
+    def test_float_domain_calls_are_bounded(self):
+        result = sweep(get_grade, -math.inf, math.inf, domain="float")
+        assert [b.value for b in result.boundaries] == [60.0, 70.0, 80.0, 90.0]
+        assert result.calls < 4 * 64 + 32
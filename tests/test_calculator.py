@@ -0,0 +1,175 @@
+from array import array
+from decimal import Decimal
+from fractions import Fraction
+
+import pytest
+
+from src.calculator import (
+    CacheStats,
+    Calculator,
+    add,
+    add_many,
+    default_calculator,
+    multiply,
+    multiply_many,
+)
+
+
+@pytest.fixture
+def calculator():
+    return default_calculator()
+
+
+@pytest.fixture
+def counting_calculator():
+    """실제 호출 횟수를 세는 연산이 등록된 계산기"""
+    calls = []
+    calc = Calculator()
+
+    @calc.operation("price", cache_size=2)
+    def price(sku, qty):
+        calls.append((sku, qty))
+        return len(sku) * 100 * qty
+
+    return calc, calls
+
+
+class TestCalculator:
+
+    def test_same_usage_as_fixture(self, calculator):
+        assert calculator["add"](2, 3) == 5
+        assert calculator["multiply"](4, 5) == 20
+
+    def test_uncached_has_no_stats(self, calculator):
+        assert calculator.stats("add") is None
+        assert calculator.stats() == {}
+
+    def test_duplicate_name(self, calculator):
+        with pytest.raises(ValueError, match="이미 등록"):
+            calculator.register("add", lambda a, b: 0)
+
+    @pytest.mark.parametrize("size", [0, -1, 1.5])
+    def test_invalid_cache_size(self, size):
+        with pytest.raises(ValueError, match="캐시 크기"):
+            Calculator().register("op", abs, cache_size=size)
+
+    def test_unknown_operation(self, calculator):
+        with pytest.raises(KeyError):
+            calculator["divide"]
+        with pytest.raises(KeyError):
+            calculator.stats("divide")
+
+
+class TestCache:
+
+    def test_repeated_args_hit_cache(self, counting_calculator):
+        calc, calls = counting_calculator
+        assert calc["price"]("abc", 2) == 600
+        assert calc["price"]("abc", 2) == 600
+        assert calls == [("abc", 2)]
+        assert calc.stats("price") == CacheStats(hits=1, misses=1, evictions=0, size=1, maxsize=2)
+
+    def test_lru_eviction(self, counting_calculator):
+        calc, calls = counting_calculator
+        price = calc["price"]
+        price("a", 1)
+        price("b", 1)
+        price("a", 1)  # a가 최근 사용 → b가 가장 오래됨
+        price("c", 1)  # b 제거
+        price("a", 1)  # 적중
+        price("b", 1)  # 다시 계산
+        assert calls == [("a", 1), ("b", 1), ("c", 1), ("b", 1)]
+        stats = calc.stats("price")
+        assert (stats.hits, stats.misses, stats.evictions, stats.size) == (2, 4, 2, 2)
+
+    def test_failed_calls_are_not_evictions(self):
+        calc = Calculator()
+        calc.register("inverse", lambda x: 1 / x, cache_size=10)
+        for _ in range(5):
+            with pytest.raises(ZeroDivisionError):
+                calc["inverse"](0)
+        calc["inverse"](2)
+        assert calc.stats("inverse") == CacheStats(hits=0, misses=6, evictions=0, size=1,
+                                                   maxsize=10)
+
+    def test_evictions_survive_clear(self, counting_calculator):
+        calc, _ = counting_calculator
+        for sku in "abc":
+            calc["price"](sku, 1)
+        calc.clear_cache("price")
+        calc["price"]("a", 1)
+        assert calc.stats("price").evictions == 1
+
+    def test_clear_cache_keeps_counters(self, counting_calculator):
+        calc, calls = counting_calculator
+        calc["price"]("a", 1)
+        calc["price"]("a", 1)
+        calc.clear_cache("price")
+        calc["price"]("a", 1)
+        assert len(calls) == 2
+        assert calc.stats("price") == CacheStats(hits=1, misses=2, evictions=0, size=1, maxsize=2)
+
+    def test_clear_all(self):
+        calc = default_calculator(cache_size=8)
+        calc["add"](1, 2)
+        calc["multiply"](1, 2)
+        calc.clear_cache()
+        assert {name: s.size for name, s in calc.stats().items()} == {"add": 0, "multiply": 0}
+
+
+# test_multiple_params + test_with_failure_message 케이스
+ADD_CASES = [
+    (1, 2, 3),
+    (0, 0, 0),
+    (-1, 1, 0),
+    (100, 200, 300),
+    (10, 20, 30),
+    (-5, 5, 0),
+]
+
+
+class TestElementwise:
+
+    def test_add_many_matches_scalar(self):
+        a = [case[0] for case in ADD_CASES]
+        b = [case[1] for case in ADD_CASES]
+        result = add_many(a, b)
+        assert list(result) == [case[2] for case in ADD_CASES]
+        assert list(result) == [add(x, y) for x, y in zip(a, b)]
+        assert result.typecode == "q"
+
+    def test_multiply_many_matches_scalar(self):
+        a = [case[0] for case in ADD_CASES]
+        b = [case[1] for case in ADD_CASES]
+        assert list(multiply_many(a, b)) == [multiply(x, y) for x, y in zip(a, b)]
+
+    def test_array_inputs(self):
+        result = add_many(array("i", [1, 2]), array("d", [0.5, 0.25]))
+        assert result.typecode == "d"
+        assert list(result) == [1.5, 2.25]
+
+    def test_float_list(self):
+        assert list(add_many([0.1, 1], [0.2, 2])) == [0.1 + 0.2, 3]
+
+    def test_big_ints_stay_exact(self):
+        big = 1 << 70
+        assert add_many([big], [1]) == [big + 1]
+        assert multiply_many(array("q", [1 << 62]), array("q", [4])) == [1 << 64]
+
+    @pytest.mark.parametrize("a, b", [
+        pytest.param([Decimal("0.1"), 1], [Decimal("0.2"), 2], id="Decimal"),
+        pytest.param([Fraction(1, 3), 0.5], [Fraction(1, 3), 1], id="Fraction"),
+    ])
+    def test_exact_types_stay_exact(self, a, b):
+        result = add_many(a, b)
+        assert result == [x + y for x, y in zip(a, b)]
+        assert type(result[0]) is type(a[0])
+
+    def test_length_mismatch(self):
+        with pytest.raises(ValueError, match="길이"):
+            add_many([1, 2], [1])
+
+    def test_numpy_inputs(self):
+        np = pytest.importorskip("numpy")
+        result = multiply_many(np.array([1, 2, 3]), [4, 5, 6])
+        assert result.tolist() == [4, 10, 18]
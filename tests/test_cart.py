@@ -0,0 +1,212 @@
+from decimal import Decimal
+
+import pytest
+
+from src.cart import Cart, ColumnarCart, LineItem, apply_rate, to_cents
+
+
+@pytest.fixture(params=[Cart, ColumnarCart])
+def shopping_cart(request):
+    """Cart와 ColumnarCart 모두 같은 테스트를 통과해야 한다"""
+    return request.param()
+
+
+@pytest.fixture
+def cart_with_items(shopping_cart):
+    shopping_cart.add("사과", 1000, 3)
+    shopping_cart.add("바나나", 500, 5)
+    return shopping_cart
+
+
+class TestCart:
+
+    def test_empty_cart(self, shopping_cart):
+        assert shopping_cart.items == []
+        assert shopping_cart.total == 0
+
+    def test_cart_total(self, cart_with_items):
+        assert len(cart_with_items) == 2
+        assert cart_with_items.total == 5500
+
+    def test_same_shape_as_fixture(self, cart_with_items):
+        assert cart_with_items.to_dict() == {
+            "items": [
+                {"name": "사과", "price": 1000, "qty": 3},
+                {"name": "바나나", "price": 500, "qty": 5},
+            ],
+            "total": 5500,
+        }
+
+    def test_add_existing_item_increases_qty(self, cart_with_items):
+        cart_with_items.add("사과", 1000, 2)
+        assert cart_with_items["사과"].qty == 5
+        assert cart_with_items.total == 7500
+
+    def test_add_existing_item_with_different_price(self, cart_with_items):
+        with pytest.raises(ValueError, match="단가"):
+            cart_with_items.add("사과", 900)
+        assert cart_with_items.total == 5500
+
+    def test_remove(self, cart_with_items):
+        cart_with_items.remove("사과")
+        assert "사과" not in cart_with_items
+        assert cart_with_items.total == 2500
+
+    def test_remove_missing(self, cart_with_items):
+        with pytest.raises(KeyError):
+            cart_with_items.remove("포도")
+
+    def test_update_qty(self, cart_with_items):
+        cart_with_items.update_qty("바나나", 1)
+        assert cart_with_items.total == 3500
+        cart_with_items.update_qty("바나나", 0)
+        assert "바나나" not in cart_with_items
+        assert cart_with_items.total == 3000
+
+    @pytest.mark.parametrize("price, qty, error", [
+        pytest.param(10.5, 1, TypeError, id="float_price"),
+        pytest.param(-1, 1, ValueError, id="negative_price"),
+        pytest.param(100, -1, ValueError, id="negative_qty"),
+    ])
+    def test_invalid_line(self, shopping_cart, price, qty, error):
+        with pytest.raises(error):
+            shopping_cart.add("사과", price, qty)
+        assert shopping_cart.total == 0
+
+    def test_incremental_total_matches_recomputation(self, shopping_cart):
+        cart = shopping_cart
+        for i in range(1000):
+            cart.add(f"item{i}", i, 1 + i % 7)
+        for i in range(0, 1000, 3):
+            cart.update_qty(f"item{i}", i % 5)
+        for i in range(1, 1000, 11):
+            if f"item{i}" in cart:
+                cart.remove(f"item{i}")
+        assert cart.total == sum(item.subtotal for item in cart)
+
+    @pytest.mark.parametrize("cart_class", [Cart, ColumnarCart])
+    def test_from_items(self, cart_class):
+        cart = cart_class.from_items([
+            {"name": "사과", "price": 1000, "qty": 3},
+            {"name": "바나나", "price": 500, "qty": 5},
+        ])
+        assert cart.items == [LineItem("사과", 1000, 3), LineItem("바나나", 500, 5)]
+        assert cart.total == 5500
+
+    def test_line_item_has_no_dict(self):
+        assert not hasattr(LineItem("사과", 1000, 1), "__dict__")
+
+
+class TestColumnarCart:
+
+    def test_remove_moves_last_row(self, cart_with_items):
+        cart = ColumnarCart.from_items(item.to_dict() for item in cart_with_items)
+        cart.add("포도", 2000, 1)
+        cart.remove("사과")
+        assert cart.names == ["포도", "바나나"]
+        assert cart["포도"] == LineItem("포도", 2000, 1)
+        cart.update_qty("포도", 2)
+        assert cart.total == 2500 + 4000
+
+    def test_from_columns(self):
+        cart = ColumnarCart.from_columns(["사과", "바나나"], [1000, 500], [3, 5])
+        assert cart.total == 5500
+        assert list(cart.subtotals()) == [3000, 2500]
+
+    @pytest.mark.parametrize("names, prices, qtys, message", [
+        pytest.param(["a", "b"], [1], [1, 1], "길이", id="length"),
+        pytest.param(["a", "a"], [1, 1], [1, 1], "중복", id="duplicate"),
+        pytest.param(["a"], [-1], [1], "가격", id="negative_price"),
+        pytest.param(["a"], [1], [-1], "수량", id="negative_qty"),
+    ])
+    def test_from_columns_invalid(self, names, prices, qtys, message):
+        with pytest.raises(ValueError, match=message):
+            ColumnarCart.from_columns(names, prices, qtys)
+
+    def test_bulk_total_matches_incremental(self):
+        n = 100_000
+        cart = ColumnarCart.from_columns(
+            (f"sku{i}" for i in range(n)),
+            (i % 997 * 10 for i in range(n)),
+            (1 + i % 13 for i in range(n)),
+        )
+        assert cart.total == sum(i % 997 * 10 * (1 + i % 13) for i in range(n))
+        assert cart.recompute_total() == cart.total
+
+    def test_apply_discount(self):
+        cart = ColumnarCart.from_columns(["사과", "바나나"], [1000, 555], [3, 2])
+        cart.apply_discount(1000)  # 10%
+        assert list(cart.prices) == [900, 500]  # 499.5 → 500
+        assert cart.total == 900 * 3 + 500 * 2
+
+    def test_apply_discount_matches_apply_rate(self):
+        prices = [i * 7919 for i in range(1000)] + [2**62]
+        cart = ColumnarCart.from_columns((f"sku{i}" for i in range(len(prices))), prices,
+                                         [1] * len(prices))
+        cart.apply_discount(1234)
+        assert list(cart.prices) == [apply_rate(p, 10000 - 1234) for p in prices]
+
+    @pytest.mark.parametrize("price, qty", [
+        pytest.param(1, 2**63, id="qty"),
+        pytest.param(2**63, 1, id="price"),
+    ])
+    def test_add_overflow_keeps_columns_aligned(self, price, qty):
+        cart = ColumnarCart.from_columns(["a"], [10], [1])
+        with pytest.raises(OverflowError):
+            cart.add("b", price, qty)
+        assert (len(cart.names), len(cart.prices), len(cart.qtys)) == (1, 1, 1)
+        assert cart.total == 10
+
+    def test_update_qty_overflow_keeps_total(self):
+        cart = ColumnarCart.from_columns(["a"], [10], [1])
+        with pytest.raises(OverflowError):
+            cart.update_qty("a", 2**63)
+        assert cart.total == cart.recompute_total() == 10
+
+    def test_totals_past_int64_are_exact(self):
+        """소계는 int64 안이지만 합계는 넘는 경우. numpy 경로에서도 값이 돌아가지 않는다"""
+        n = 16
+        cart = ColumnarCart.from_columns((f"sku{i}" for i in range(n)), [2**40] * n, [2**20] * n)
+        assert list(cart.subtotals()) == [2**60] * n
+        assert cart.total == cart.recompute_total() == 2**64
+
+    def test_subtotal_past_int64_raises(self):
+        cart = ColumnarCart.from_columns(["a"], [2**62], [4])
+        with pytest.raises(OverflowError):
+            cart.subtotals()
+
+    def test_tax(self, cart_with_items):
+        cart = ColumnarCart.from_items(item.to_dict() for item in cart_with_items)
+        assert cart.tax(1000) == 550
+
+    @pytest.mark.parametrize("rate, error", [
+        pytest.param(-1, ValueError, id="negative"),
+        pytest.param(10001, ValueError, id="over_100_percent"),
+        pytest.param(0.1, TypeError, id="float"),
+    ])
+    def test_invalid_rate(self, rate, error):
+        with pytest.raises(error):
+            ColumnarCart().tax(rate)
+
+    @pytest.mark.parametrize("amount, rate, expected", [
+        (1000, 1000, 100),
+        (5, 1000, 1),    # 0.5 → 1
+        (4, 1000, 0),    # 0.4 → 0
+        (1234, 0, 0),
+        (1234, 10000, 1234),
+    ])
+    def test_apply_rate(self, amount, rate, expected):
+        assert apply_rate(amount, rate) == expected
+
+
+class TestToCents:
+
+    @pytest.mark.parametrize("amount, expected", [
+        ("10.99", 1099),
+        (Decimal("0.5"), 50),
+        (0.1, 10),
+        (3, 300),
+        ("0.005", 1),
+    ])
+    def test_to_cents(self, amount, expected):
+        assert to_cents(amount) == expected
@@ -0,0 +1,178 @@
+import io
+import json
+import tracemalloc
+
+import pytest
+
+from src.cart import Cart
+from src.cart_import import CartTotal, import_carts, write_totals
+
+
+def order_lines(carts, items_per_cart):
+    """장바구니마다 items_per_cart줄씩 이어진 주문 (dict 목록)"""
+    return [
+        {"cart_id": f"c{c}", "name": f"상품{i}", "price": 1000 + i, "qty": 1 + (c + i) % 3}
+        for c in range(carts)
+        for i in range(items_per_cart)
+    ]
+
+
+def as_csv(records):
+    lines = ["cart_id,name,price,qty"]
+    lines += [f"{r['cart_id']},{r['name']},{r['price']},{r['qty']}" for r in records]
+    return "\n".join(lines) + "\n"
+
+
+def as_jsonl(records):
+    return "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in records)
+
+
+def expected_totals(records):
+    carts = {}
+    for r in records:
+        carts.setdefault(r["cart_id"], []).append(r)
+    return {cart_id: Cart.from_items(items).total for cart_id, items in carts.items()}
+
+
+class TestImportCarts:
+
+    @pytest.mark.parametrize("format, render", [
+        pytest.param("csv", as_csv, id="csv"),
+        pytest.param("jsonl", as_jsonl, id="jsonl"),
+    ])
+    def test_totals_match_cart(self, format, render):
+        records = order_lines(carts=50, items_per_cart=7)
+        result = import_carts(io.StringIO(render(records)), format=format, chunk_size=16)
+        totals = list(result)
+        assert {t.cart_id: t.total for t in totals} == expected_totals(records)
+        assert [t.cart_id for t in totals] == [f"c{c}" for c in range(50)]
+        assert all(t.lines == 7 for t in totals)
+        assert (result.line_count, result.cart_count, result.error_count) == (350, 50, 0)
+
+    def test_emits_before_reading_everything(self):
+        def lines():
+            yield "cart_id,price,qty\n"
+            for i in range(100):
+                yield f"c{i},100,1\n"
+            raise AssertionError("끝까지 읽기 전에 결과가 나와야 함")
+
+        totals = iter(import_carts(lines(), format="csv", chunk_size=10))
+        assert next(totals) == CartTotal("c0", 100, 1, 2)
+
+    def test_interleaved_within_chunk(self):
+        text = "cart_id,price,qty\na,100,1\nb,200,1\na,100,2\nb,200,3\n"
+        totals = list(import_carts(io.StringIO(text), format="csv", chunk_size=2))
+        assert totals == [CartTotal("a", 300, 2, 2), CartTotal("b", 800, 2, 3)]
+
+    def test_format_from_file_name(self, tmp_path):
+        path = tmp_path / "orders.csv"
+        path.write_text("cart_id,price\nx,5\n", encoding="utf-8")
+        assert list(import_carts(path)) == [CartTotal("x", 5, 1, 2)]
+
+    def test_iterate_once(self):
+        result = import_carts(io.StringIO(""), format="jsonl")
+        assert list(result) == []
+        with pytest.raises(RuntimeError, match="다시 반복"):
+            list(result)
+
+
+class TestErrors:
+
+    @pytest.mark.parametrize("line, message", [
+        pytest.param("a,abc,1", "가격은 정수", id="가격_문자"),
+        pytest.param("a,10.5,1", "가격은 정수", id="가격_소수"),
+        pytest.param("a,-1,1", "가격은 음수 불가", id="가격_음수"),
+        pytest.param("a,100,-2", "수량은 음수 불가", id="수량_음수"),
+        pytest.param(",100,1", "cart_id", id="id_없음"),
+        pytest.param("a", "열 개수", id="열_부족"),
+        pytest.param('a,"bad,100,1', "CSV 형식", id="따옴표_안_닫힘"),
+        pytest.param('a,"1"00,1', "CSV 형식", id="따옴표_뒤_문자"),
+    ])
+    def test_csv_errors_have_line_numbers(self, line, message):
+        text = f"cart_id,price,qty\na,100,1\n{line}\na,100,1\n"
+        result = import_carts(io.StringIO(text), format="csv")
+        assert list(result) == [CartTotal("a", 200, 2, 2)]
+        assert result.error_count == 1
+        line_no, raw, error = result.errors[0]
+        assert line_no == 3
+        assert message in error
+
+    @pytest.mark.parametrize("line, message", [
+        pytest.param("{oops", "JSON 형식", id="json"),
+        pytest.param("[1, 2]", "JSON 객체", id="객체_아님"),
+        pytest.param('{"cart_id": "a"}', "price 필드", id="필드_없음"),
+        pytest.param('{"cart_id": "a", "price": true}', "가격은 정수", id="bool"),
+    ])
+    def test_jsonl_errors_have_line_numbers(self, line, message):
+        text = '{"cart_id": "a", "price": 1}\n\n' + line + "\n"
+        result = import_carts(io.StringIO(text), format="jsonl")
+        assert list(result) == [CartTotal("a", 1, 1, 1)]
+        assert result.errors[0][0] == 3
+        assert message in result.errors[0][2]
+
+    def test_stray_quote_does_not_swallow_following_lines(self):
+        text = 'cart_id,price,qty\nc1,"bad,100,1\nc2,100,1\nc2,"5",2\nc3,7,1\n'
+        result = import_carts(io.StringIO(text), format="csv")
+        assert list(result) == [CartTotal("c2", 110, 2, 3), CartTotal("c3", 7, 1, 5)]
+        assert result.errors == [(2, 'c1,"bad,100,1', "CSV 형식이 아님 (unexpected end of data)")]
+
+    @pytest.mark.parametrize("name, data", [
+        pytest.param("orders.csv", b"cart_id,name,price,qty\nc1,a,100,1\n"
+                     b"c1,\xff\xfe,100,1\nc1,b,300,1\n", id="csv"),
+        pytest.param("orders.jsonl", b'{"cart_id": "c1", "price": 100}\n\n'
+                     b'{"cart_id": "c1", "name": "\xff", "price": 100}\n'
+                     b'{"cart_id": "c1", "price": 300}\n', id="jsonl"),
+    ])
+    def test_bad_bytes_fail_only_their_line(self, tmp_path, name, data):
+        path = tmp_path / name
+        path.write_bytes(data)
+        result = import_carts(path)
+        assert list(result) == [CartTotal("c1", 400, 2, 2 if name.endswith(".csv") else 1)]
+        assert [(e[0], e[2]) for e in result.errors] == [(3, "UTF-8 아님")]
+
+    def test_missing_header_column(self):
+        result = import_carts(io.StringIO("id,price\n1,100\n"), format="csv")
+        assert list(result) == []
+        assert result.errors == [(1, "id,price", "헤더에 cart_id 열 없음")]
+
+    def test_error_samples_are_capped(self):
+        text = "cart_id,price\n" + "a,x\n" * 50
+        result = import_carts(io.StringIO(text), format="csv", max_errors=3)
+        list(result)
+        assert result.error_count == 50
+        assert [e[0] for e in result.errors] == [2, 3, 4]
+
+
+class TestOutput:
+
+    def test_write_totals(self, tmp_path):
+        source = io.StringIO(as_jsonl(order_lines(carts=3, items_per_cart=2)))
+        out = tmp_path / "totals.csv"
+        assert write_totals(import_carts(source, format="jsonl"), out) == 3
+        lines = out.read_text(encoding="utf-8").splitlines()
+        assert lines[0] == "cart_id,total,lines,first_line"
+        assert lines[1].startswith("c0,")
+        assert lines[1].endswith(",2,1")
+
+    def test_write_totals_keeps_split_carts_apart(self):
+        text = "cart_id,price\na,1\nb,1\nb,1\na,2\n"
+        out = io.StringIO()
+        assert write_totals(import_carts(io.StringIO(text), format="csv", chunk_size=1), out) == 3
+        assert out.getvalue().splitlines()[1:] == ["a,1,1,2", "b,2,2,3", "a,2,1,5"]
+
+
+def test_memory_bounded_by_chunk_size(tmp_path):
+    """파일이 4배 커져도 최대 메모리는 거의 같아야 한다"""
+    def peak(carts):
+        path = tmp_path / f"orders_{carts}.csv"
+        path.write_text(as_csv(order_lines(carts=carts, items_per_cart=5)), encoding="utf-8")
+        tracemalloc.start()
+        try:
+            for _ in import_carts(path, chunk_size=500):
+                pass
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    small, large = peak(2_000), peak(8_000)
+    assert large < small * 1.5
@@ -0,0 +1,155 @@
+import json
+import os
+import socket
+import threading
+
+import pytest
+
+from main import main
+from src.daemon import Client, handle, handle_line, make_server, serve
+
+
+@pytest.fixture
+def socket_path(tmp_path):
+    return str(tmp_path / "lab.sock")
+
+
+@pytest.fixture
+def daemon(socket_path):
+    """별도 스레드에서 상주 서버를 띄운다"""
+    started = threading.Event()
+    servers = []
+
+    def ready(server):
+        servers.append(server)
+        started.set()
+
+    thread = threading.Thread(target=serve, args=(socket_path, ready), daemon=True)
+    thread.start()
+    assert started.wait(5)
+    yield socket_path
+    servers[0].shutdown()
+    thread.join(5)
+
+
+class TestHandle:
+
+    @pytest.mark.parametrize("request_, result", [
+        pytest.param({"op": "grade", "args": [95, "85", 59]}, ["A", "B", "F"], id="grade"),
+        pytest.param({"op": "validate", "args": ["abc", "ab", "user@x"]}, [True, False, False],
+                     id="validate"),
+        pytest.param({"op": "validate_score", "args": [0, 100, 101, -1]}, [True, True, False, False],
+                     id="validate_score"),
+        pytest.param({"op": "ping"}, "pong", id="ping"),
+    ])
+    def test_operations(self, request_, result):
+        assert handle(request_) == {"ok": True, "result": result}
+
+    def test_item_errors_do_not_fail_request(self):
+        response = handle({"op": "grade", "args": [95, 101, "abc", True], "id": 7})
+        assert response["id"] == 7
+        assert response["result"][0] == "A"
+        assert response["result"][1] == {"error": "100 초과는 안 됨"}
+        assert "error" in response["result"][2]
+        assert "error" in response["result"][3]
+
+    def test_parse_matches_parse_many(self):
+        response = handle({"op": "parse", "args": ["10", " -3 ", "", None, "x"]})
+        assert response["result"][:2] == [10, -3]
+        assert response["result"][2] == {"error": "빈 문자열 불가"}
+        assert response["result"][3] == {"error": "None은 변환 불가"}
+
+    @pytest.mark.parametrize("request_, message", [
+        pytest.param({"op": "delete"}, "알 수 없는 op", id="op"),
+        pytest.param({"op": "grade", "args": 95}, "배열", id="args"),
+        pytest.param({"op": "validate", "args": [1]}, "문자열", id="type"),
+        pytest.param([1, 2], "객체", id="not_object"),
+    ])
+    def test_bad_requests(self, request_, message):
+        response = handle(request_)
+        assert response["ok"] is False
+        assert message in response["error"]
+
+    @pytest.mark.parametrize("request_, result", [
+        pytest.param({"op": "grade", "args": [-0.5, 100.7, 85.5]},
+                     [{"error": "음수는 안 됨"}, {"error": "100 초과는 안 됨"}, "B"], id="grade_float"),
+        pytest.param({"op": "validate_score", "args": [-0.5, 100.7, None]}, [False, False, False],
+                     id="validate_score_float"),
+    ])
+    def test_floats_are_validated_before_conversion(self, request_, result):
+        assert handle(request_)["result"] == result
+
+    @pytest.mark.parametrize("line", [
+        pytest.param('{"op": "grade", "args": [1e400]}', id="grade_inf"),
+        pytest.param('{"op": "validate_score", "args": [1e400]}', id="score_inf"),
+        pytest.param('{"op": "parse", "args": [1e400]}', id="parse_inf"),
+        pytest.param('{"op": [1]}', id="op_list"),
+    ])
+    def test_never_raises(self, line):
+        response = json.loads(handle_line(line))
+        assert response["ok"] is False or all(
+            isinstance(item, dict) or item is False for item in response["result"]
+        )
+
+    def test_handle_line_bad_json(self):
+        assert json.loads(handle_line("{oops")) == {"ok": False, "error": "JSON 형식이 아님"}
+
+
+class TestServer:
+
+    def test_many_requests_on_one_connection(self, daemon):
+        with Client(daemon) as client:
+            assert client.remote
+            for score in range(0, 101, 10):
+                assert client.request("grade", [score])["result"] == [
+                    handle({"op": "grade", "args": [score]})["result"][0]
+                ]
+
+    def test_raw_ndjson(self, daemon):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(daemon)
+            sock.sendall(b'{"op": "ping", "id": 1}\n{"op": "grade", "args": [90]}\n')
+            reader = sock.makefile("rb")
+            assert json.loads(reader.readline()) == {"id": 1, "ok": True, "result": "pong"}
+            assert json.loads(reader.readline())["result"] == ["A"]
+
+    def test_already_running(self, daemon):
+        with pytest.raises(RuntimeError, match="이미 실행 중"):
+            make_server(daemon)
+
+    def test_stale_socket_is_replaced(self, socket_path):
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(socket_path)
+        stale.close()  # 파일만 남고 듣는 프로세스 없음
+        server = make_server(socket_path)
+        server.server_close()
+        assert os.stat(socket_path).st_mode & 0o777 == 0o600
+
+
+class TestClientFallback:
+
+    def test_in_process_when_no_daemon(self, socket_path):
+        with Client(socket_path) as client:
+            assert not client.remote
+            assert client.request("grade", [95]) == {"ok": True, "result": ["A"]}
+
+    def test_send_command(self, daemon, capsys):
+        assert main(["send", "grade", "95", "101", "--socket", daemon]) == 1
+        captured = capsys.readouterr()
+        assert captured.out.split() == ["A"]
+        assert "101: 100 초과는 안 됨" in captured.err
+
+    def test_send_without_daemon(self, socket_path, capsys):
+        assert main(["send", "validate", "abc", "a", "--socket", socket_path]) == 1
+        assert capsys.readouterr().out.split() == ["true", "false"]
+
+    @pytest.mark.parametrize("op, args, expected", [
+        pytest.param("validate", ["abc"], 0, id="validate_유효"),
+        pytest.param("validate", ["ab"], 1, id="validate_무효"),
+        pytest.param("validate_score", ["50"], 0, id="점수_유효"),
+        pytest.param("validate_score", ["120"], 1, id="점수_무효"),
+    ])
+    def test_send_exit_code_matches_in_process(self, daemon, op, args, expected):
+        in_process = ["validate", *args] if op == "validate" else ["validate", "--score", *args]
+        assert main(in_process) == expected
+        assert main(["send", op, *args, "--socket", daemon]) == expected
@@ -0,0 +1,178 @@
+import importlib.util
+import os
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+from src.fixtures import fingerprint, load, load_or_build, store
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def import_file(path, name):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module  # 보통 import처럼 (inspect가 클래스 소스를 찾을 수 있게)
+    spec.loader.exec_module(module)
+    return module
+
+
+def write_builder(path, helper_body="return 1", build_body="return helper() + 1"):
+    path.write_text(textwrap.dedent(f"""
+        def helper():
+            {helper_body}
+
+        def build():
+            {build_body}
+    """), encoding="utf-8")
+
+
+class TestFingerprint:
+
+    def test_same_source_same_key(self, tmp_path):
+        write_builder(tmp_path / "a.py")
+        write_builder(tmp_path / "b.py")
+        a = import_file(tmp_path / "a.py", "fixture_src_a")
+        b = import_file(tmp_path / "b.py", "fixture_src_b")
+        assert fingerprint(a.build) == fingerprint(b.build)
+
+    def test_fixture_source_change(self, tmp_path):
+        write_builder(tmp_path / "a.py")
+        write_builder(tmp_path / "b.py", build_body="return helper() + 2")
+        a = import_file(tmp_path / "a.py", "fixture_src_c")
+        b = import_file(tmp_path / "b.py", "fixture_src_d")
+        assert fingerprint(a.build) != fingerprint(b.build)
+
+    def test_dependency_source_change(self, tmp_path):
+        write_builder(tmp_path / "a.py")
+        write_builder(tmp_path / "b.py", helper_body="return 2")
+        a = import_file(tmp_path / "a.py", "fixture_src_e")
+        b = import_file(tmp_path / "b.py", "fixture_src_f")
+        assert fingerprint(a.build) != fingerprint(b.build)
+
+    @pytest.mark.parametrize("before, after", [
+        pytest.param("N = 10\n\ndef build():\n    return list(range(N))\n",
+                     "N = 20\n\ndef build():\n    return list(range(N))\n", id="상수"),
+        pytest.param("def helper():\n    return 1\n\nclass Builder:\n"
+                     "    def make(self):\n        return helper()\n\n"
+                     "def build():\n    return Builder().make()\n",
+                     "def helper():\n    return 2\n\nclass Builder:\n"
+                     "    def make(self):\n        return helper()\n\n"
+                     "def build():\n    return Builder().make()\n", id="메서드가_부르는_함수"),
+    ])
+    def test_indirect_change(self, tmp_path, before, after):
+        (tmp_path / "a.py").write_text(before, encoding="utf-8")
+        (tmp_path / "b.py").write_text(after, encoding="utf-8")
+        a = import_file(tmp_path / "a.py", f"fixture_src_h{id(before)}")
+        b = import_file(tmp_path / "b.py", f"fixture_src_i{id(after)}")
+        assert fingerprint(a.build) != fingerprint(b.build)
+
+    def test_imported_constant(self, tmp_path):
+        """다른 모듈에서 가져온 상수는 값으로 반영한다"""
+        (tmp_path / "a.py").write_text("def build():\n    return SIZE\n", encoding="utf-8")
+        module = import_file(tmp_path / "a.py", "fixture_src_j")
+        module.SIZE = 10
+        before = fingerprint(module.build)
+        module.SIZE = 20
+        assert fingerprint(module.build) != before
+
+    def test_same_key_under_any_hash_seed(self, tmp_path):
+        """집합 리터럴이 있는 모듈도 프로세스마다 같은 키여야 캐시가 맞는다"""
+        (tmp_path / "builder.py").write_text(textwrap.dedent("""
+            NAMES = sorted({"alpha", "beta", "gamma"})
+
+            def build():
+                return [name for name in NAMES if name in {"alpha", "gamma"}]
+        """), encoding="utf-8")
+        script = "from builder import build\nfrom src.fixtures import fingerprint\nprint(fingerprint(build))"
+
+        def key(seed):
+            env = dict(os.environ, PYTHONPATH=os.pathsep.join([str(ROOT), str(tmp_path)]),
+                       PYTHONHASHSEED=str(seed))
+            return subprocess.run(
+                [sys.executable, "-c", script], env=env, capture_output=True, text=True, check=True,
+            ).stdout
+
+        assert key(1) == key(2) == key(3)
+
+    def test_explicit_file_dependency(self, tmp_path):
+        write_builder(tmp_path / "a.py")
+        a = import_file(tmp_path / "a.py", "fixture_src_g")
+        data = tmp_path / "data.csv"
+        data.write_text("1\n")
+        before = fingerprint(a.build, depends=[data])
+        data.write_text("2\n")
+        assert fingerprint(a.build, depends=[data]) != before
+
+
+class TestStoreLoad:
+
+    def test_roundtrip(self, tmp_path):
+        value = {"items": [1, 2, 3], "blob": bytearray(b"x" * 1000), "empty": bytearray()}
+        store(str(tmp_path / "v"), value)
+        assert load(str(tmp_path / "v")) == value
+
+    def test_plain_values_have_no_buffers(self, tmp_path):
+        store(str(tmp_path / "v"), [1, "a", None])
+        assert load(str(tmp_path / "v")) == [1, "a", None]
+        assert os.path.getsize(tmp_path / "v.buf") == 0
+
+    def test_numpy_buffers_are_mapped(self, tmp_path):
+        np = pytest.importorskip("numpy")
+        store(str(tmp_path / "v"), np.arange(1000))
+        loaded = load(str(tmp_path / "v"))
+        assert loaded.sum() == sum(range(1000))
+        assert not loaded.flags.owndata
+        loaded[0] = 99  # copy-on-write: 파일은 그대로
+        assert load(str(tmp_path / "v"))[0] == 0
+
+    def test_corrupt_cache_is_rebuilt(self, tmp_path):
+        calls = []
+
+        def build():
+            calls.append(1)
+            return [1, 2]
+
+        assert load_or_build(build, tmp_path) == [1, 2]
+        for entry in tmp_path.iterdir():
+            if entry.suffix == ".pkl":
+                entry.write_bytes(b"broken")
+        assert load_or_build(build, tmp_path) == [1, 2]
+        assert len(calls) == 2
+        assert load_or_build(build, tmp_path) == [1, 2]
+        assert len(calls) == 2
+
+
+class TestCachedFixture:
+
+    def test_reused_across_runs_until_source_changes(self, tmp_path, run_pytest):
+        test_file = tmp_path / "test_cached.py"
+        source = textwrap.dedent("""
+            from pathlib import Path
+
+            from src.fixtures import cached_fixture
+
+            @cached_fixture
+            def corpus():
+                with open(Path(__file__).parent / "builds.log", "a") as f:
+                    f.write("built\\n")
+                return list(range(VERSION))
+
+            def test_corpus(corpus):
+                assert len(corpus) == VERSION
+        """)
+        test_file.write_text(source.replace("VERSION", "10"), encoding="utf-8")
+        builds = tmp_path / "builds.log"
+
+        assert run_pytest(tmp_path, "-q", "-p", "no:cacheprovider").returncode == 0
+        assert run_pytest(tmp_path, "-q", "-p", "no:cacheprovider").returncode == 0
+        assert builds.read_text().count("built") == 1
+
+        test_file.write_text(source.replace("VERSION", "20"), encoding="utf-8")
+        assert run_pytest(tmp_path, "-q", "-p", "no:cacheprovider").returncode == 0
+        assert builds.read_text().count("built") == 2
+        cache_files = list((tmp_path / ".pytest_cache" / "fixture-cache").iterdir())
+        assert len(cache_files) == 2  # 예전 버전은 지워짐 (.pkl + .buf)
@@ -0,0 +1,87 @@
+from array import array
+
+import pytest
+
+from src.cart import Cart
+from src.fixtures import freeze, shared_fixture
+
+
+BUILDS = []
+
+
+@shared_fixture
+def expensive_data():
+    BUILDS.append("session")
+    return {"count": 0, "items": [1, 2, 3]}
+
+
+@shared_fixture(scope="module", mode="frozen")
+def expensive_frozen():
+    BUILDS.append("module")
+    return {"items": [1, 2, {"nested": [3]}]}
+
+
+class TestSharedCopy:
+    """test_dont_modify_shared_assumption / test_fixture_is_fresh와 같은 격리 보장"""
+
+    def test_modify(self, expensive_data):
+        expensive_data["count"] += 1
+        expensive_data["items"].append(4)
+        assert expensive_data["count"] == 1
+
+    def test_still_fresh(self, expensive_data):
+        assert expensive_data == {"count": 0, "items": [1, 2, 3]}
+
+    def test_built_once(self, expensive_data):
+        assert BUILDS.count("session") == 1
+
+    def test_conftest_fixtures(self, shared_sample_list, shared_user_data, shared_cart):
+        shared_sample_list.append(6)
+        shared_cart.add("포도", 2000)
+        assert shared_user_data["active"] is True
+
+    def test_conftest_fixtures_still_fresh(self, shared_sample_list, shared_cart):
+        assert shared_sample_list == [1, 2, 3, 4, 5]
+        assert shared_cart.total == 5500
+        assert "포도" not in shared_cart
+
+
+class TestSharedFrozen:
+
+    def test_cannot_modify(self, expensive_frozen):
+        with pytest.raises(TypeError):
+            expensive_frozen["items"] = []
+        with pytest.raises(AttributeError):
+            expensive_frozen["items"].append(4)
+        with pytest.raises(TypeError):
+            expensive_frozen["items"][2]["nested"] = ()
+
+    def test_same_object_every_test(self, expensive_frozen, frozen_numbers):
+        assert expensive_frozen["items"][2]["nested"] == (3,)
+        assert frozen_numbers == (10, 20, 30)
+        assert BUILDS.count("module") == 1
+
+
+class TestOptions:
+
+    def test_invalid_scope(self):
+        with pytest.raises(ValueError, match="scope"):
+            shared_fixture(scope="class")
+
+    def test_invalid_mode(self):
+        with pytest.raises(ValueError, match="mode"):
+            shared_fixture(mode="cow")
+
+    def test_freeze(self):
+        frozen = freeze({"a": [1, {2, 3}], "b": (4,)})
+        assert frozen == {"a": (1, frozenset({2, 3})), "b": (4,)}
+        assert freeze(bytearray(b"ab")) == b"ab"
+
+    @pytest.mark.parametrize("value", [
+        pytest.param(Cart(), id="Cart"),
+        pytest.param(array("q", [1]), id="array"),
+        pytest.param({"nested": [object()]}, id="안쪽_객체"),
+    ])
+    def test_freeze_rejects_mutable_objects(self, value):
+        with pytest.raises(TypeError, match="mode=\"copy\""):
+            freeze(value)
@@ -0,0 +1,211 @@
+import math
+from array import array
+
+import pytest
+
+from src.grading import (
+    DEFAULT_SCALE,
+    GRADE_LABELS,
+    GradeScale,
+    decode_grades,
+    get_grade,
+    grade_many,
+    grade_stream,
+)
+from src.parsing import validate_score
+
+
+# test_boundary_values와 같은 경계값
+BOUNDARY_CASES = [
+    (100, "A"),
+    (90, "A"),
+    (89, "B"),
+    (80, "B"),
+    (79, "C"),
+    (70, "C"),
+    (69, "D"),
+    (60, "D"),
+    (59, "F"),
+    (0, "F"),
+    (math.nan, "F"),  # 예전 if/elif 체인처럼 어느 하한선에도 못 미친다
+]
+
+
+class TestGetGrade:
+
+    @pytest.mark.parametrize("score, expected", BOUNDARY_CASES)
+    def test_boundary_values(self, score, expected):
+        assert get_grade(score) == expected
+
+
+class TestGradeMany:
+
+    def test_matches_get_grade_on_boundaries(self):
+        scores = [score for score, _ in BOUNDARY_CASES]
+        codes = grade_many(scores)
+        assert decode_grades(codes) == [expected for _, expected in BOUNDARY_CASES]
+
+    def test_returns_compact_array(self):
+        codes = grade_many([95, 55])
+        assert isinstance(codes, array)
+        assert codes.typecode == "B"
+        assert list(codes) == [GRADE_LABELS.index("A"), GRADE_LABELS.index("F")]
+
+    def test_accepts_array_input(self):
+        scores = array("h", range(0, 101))
+        assert decode_grades(grade_many(scores)) == [get_grade(s) for s in scores]
+
+    def test_float_scores(self):
+        scores = [89.5, 89.9999, 90.0, 59.99]
+        assert decode_grades(grade_many(scores)) == [get_grade(s) for s in scores]
+
+    @pytest.mark.parametrize("scores", [
+        pytest.param([95, math.nan, 91.5], id="list"),
+        pytest.param(array("d", [95, math.nan, 91.5]), id="array"),
+        pytest.param(iter([95, math.nan, 91.5]), id="iterator"),
+    ])
+    def test_nan_is_floor_grade(self, scores):
+        assert decode_grades(grade_many(scores)) == ["A", "F", "A"]
+
+    def test_numpy_nan(self):
+        np = pytest.importorskip("numpy")
+        codes = grade_many(np.array([95.0, np.nan, 59.0]))
+        assert decode_grades(codes) == ["A", "F", "F"]
+
+    def test_empty_input(self):
+        assert len(grade_many([])) == 0
+
+    def test_numpy_input(self):
+        np = pytest.importorskip("numpy")
+        scores = np.arange(0, 101)
+        codes = grade_many(scores)
+        assert codes.dtype == np.uint8
+        assert decode_grades(codes) == [get_grade(int(s)) for s in scores]
+
+
+PLUS_MINUS = GradeScale(
+    [(97, "A+"), (93, "A"), (90, "A-"), (87, "B+"), (83, "B"), (80, "B-"), (60, "D")],
+    floor_label="F",
+)
+
+
+class TestGradeScale:
+
+    @pytest.mark.parametrize("score, expected", [
+        (100, "A+"),
+        (97, "A+"),
+        (96, "A"),
+        (90, "A-"),
+        (89, "B+"),
+        (80, "B-"),
+        (79, "D"),
+        (59, "F"),
+    ])
+    def test_custom_bands(self, score, expected):
+        assert PLUS_MINUS.grade(score) == expected
+
+    def test_bands_order_does_not_matter(self):
+        shuffled = GradeScale([(60, "D"), (90, "A"), (70, "C"), (80, "B")])
+        assert shuffled.cutoffs == DEFAULT_SCALE.cutoffs
+        assert shuffled.labels == DEFAULT_SCALE.labels
+
+    def test_table_and_bisect_agree(self):
+        """정수 표 조회와 이진 탐색 결과가 같아야 한다"""
+        for score in range(0, 101):
+            assert PLUS_MINUS.grade(score) == PLUS_MINUS.labels[PLUS_MINUS.code(score)]
+            assert PLUS_MINUS.grade(score) == PLUS_MINUS.grade(float(score))
+
+    def test_out_of_table_range(self):
+        assert DEFAULT_SCALE.grade(-5) == "F"
+        assert DEFAULT_SCALE.grade(150) == "A"
+
+    def test_grade_many_with_custom_scale(self):
+        scores = list(range(0, 101))
+        codes = PLUS_MINUS.grade_many(scores)
+        assert PLUS_MINUS.decode(codes) == [PLUS_MINUS.grade(s) for s in scores]
+
+    def test_many_bands_use_wider_codes(self):
+        scale = GradeScale([(i / 4, str(i)) for i in range(1, 400)])
+        assert scale.grade_many([0, 99.9]).typecode == "H"
+
+    @pytest.mark.parametrize("bands, message", [
+        pytest.param([], "비어", id="empty"),
+        pytest.param([(90, "A"), (90, "B")], "중복", id="duplicate"),
+        pytest.param([(-1, "A")], "사이", id="negative"),
+        pytest.param([(101, "A")], "사이", id="over_max"),
+    ])
+    def test_invalid_bands(self, bands, message):
+        with pytest.raises(ValueError, match=message):
+            GradeScale(bands)
+
+
+class TestGradeStream:
+
+    def test_counts_and_histogram(self):
+        report = grade_stream(["95", "85\n", "85", " 72 ", "60", "0", 100])
+        assert report.total == 7
+        assert report.grade_counts() == {"F": 1, "D": 1, "C": 1, "B": 2, "A": 2}
+        assert report.histogram[85] == 2
+        assert report.error_count == 0
+
+    def test_matches_validate_score_and_get_grade(self):
+        """validate_score → get_grade 두 단계와 같은 결과"""
+        raw = [str(s) for s in range(-20, 130, 3)]
+        expected = {label: 0 for label in GRADE_LABELS}
+        rejected = 0
+        for text in raw:
+            try:
+                score = validate_score(int(text))
+            except ValueError:
+                rejected += 1
+                continue
+            expected[get_grade(score)] += 1
+
+        report = grade_stream(raw)
+        assert report.grade_counts() == expected
+        assert report.error_count == rejected
+
+    def test_errors_have_line_numbers(self):
+        report = grade_stream(["50", "", "abc", "-1", "101", "77"])
+        assert report.total == 2
+        assert report.errors == [
+            (2, "", "빈 문자열 불가"),
+            (3, "abc", "정수가 아님"),
+            (4, "-1", "음수는 안 됨"),
+            (5, "101", "100 초과는 안 됨"),
+        ]
+        assert report.error_counts == {"empty": 1, "invalid": 1, "negative": 1, "over_max": 1}
+
+    @pytest.mark.parametrize("raw", [
+        pytest.param(True, id="bool"),
+        pytest.param(85.0, id="float"),
+        pytest.param([1], id="list"),
+        pytest.param(None, id="None"),
+    ])
+    def test_non_str_non_int_is_invalid(self, raw):
+        report = grade_stream(["90", raw, 85])
+        assert report.total == 2
+        assert report.error_counts["invalid"] == report.error_count == 1
+        assert report.errors[0][:2] == (2, raw)
+
+    def test_error_samples_are_bounded(self):
+        report = grade_stream(["x"] * 1000, max_errors=10)
+        assert report.error_count == 1000
+        assert len(report.errors) == 10
+
+    def test_reads_file(self, tmp_path):
+        path = tmp_path / "scores.txt"
+        path.write_text("90\n89\n\nabc\n59\n", encoding="utf-8")
+        report = grade_stream(path)
+        assert report.grade_counts() == {"F": 1, "D": 0, "C": 0, "B": 1, "A": 1}
+        assert [line_no for line_no, _, _ in report.errors] == [3, 4]
+
+    def test_reads_generator_lazily(self):
+        report = grade_stream(str(i % 101) for i in range(100_000))
+        assert report.total == 100_000
+        assert sum(report.grade_counts().values()) == 100_000
+
+    def test_custom_scale(self):
+        report = grade_stream(["97", "91", "50"], scale=PLUS_MINUS)
+        assert report.grade_counts()["A+"] == 1
+        assert report.grade_counts()["A-"] == 1
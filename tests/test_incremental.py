@@ -0,0 +1,146 @@
+import os
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+from src.plugins.incremental import MODULE_KEY, file_hashes
+
+ROOT = Path(__file__).resolve().parent.parent
+
+LIB = textwrap.dedent("""
+    LIMIT = 10
+
+
+    def is_short(name):
+        return len(name) <= LIMIT
+
+
+    def double(n):
+        return n * 2
+
+
+    def make_items():
+        return [1, 2, 3]
+""")
+
+TESTS = textwrap.dedent("""
+    import pytest
+
+    import lib
+
+
+    @pytest.fixture(scope="session")
+    def items():
+        return lib.make_items()
+
+
+    def test_short():
+        assert lib.is_short("abc")
+
+
+    def test_double():
+        assert lib.double(2) == 4
+
+
+    def test_items(items):
+        assert len(items) == 3
+
+
+    def test_items_again(items):
+        assert items[0] == 1
+""")
+
+
+@pytest.fixture
+def run_incremental(run_pytest):
+    """--incremental을 켜고 pytest를 실행하는 함수"""
+    def run(cwd, *args):
+        return run_pytest(cwd, "--incremental", "-q", *args, plugin="src.plugins.incremental")
+    return run
+
+
+@pytest.fixture
+def project(tmp_path, run_incremental):
+    (tmp_path / "lib.py").write_text(LIB, encoding="utf-8")
+    (tmp_path / "test_lib.py").write_text(TESTS, encoding="utf-8")
+    (tmp_path / "pytest.ini").write_text("[pytest]\n", encoding="utf-8")
+    first = run_incremental(tmp_path)
+    assert "4 passed" in first.stdout, first.stdout
+    return tmp_path
+
+
+def edit(path, old, new):
+    path.write_text(path.read_text(encoding="utf-8").replace(old, new), encoding="utf-8")
+
+
+class TestIncrementalRun:
+
+    def test_nothing_changed(self, project, run_incremental):
+        result = run_incremental(project)
+        assert "4 deselected" in result.stdout
+
+    def test_changed_function_selects_its_tests(self, project, run_incremental):
+        edit(project / "lib.py", "return n * 2", "return n + n")
+        result = run_incremental(project, "-rA")
+        assert "PASSED test_lib.py::test_double" in result.stdout
+        assert "1 passed, 3 deselected" in result.stdout
+
+    def test_session_fixture_dependency(self, project, run_incremental):
+        edit(project / "lib.py", "[1, 2, 3]", "[1, 2, 3, 4]")
+        result = run_incremental(project, "-rA")
+        assert "FAILED test_lib.py::test_items " in result.stdout
+        assert "PASSED test_lib.py::test_items_again" in result.stdout
+        assert "1 failed, 1 passed, 2 deselected" in result.stdout
+
+    def test_module_constant_selects_whole_file(self, project, run_incremental):
+        edit(project / "lib.py", "LIMIT = 10", "LIMIT = 2")
+        result = run_incremental(project)
+        assert "1 failed, 3 passed" in result.stdout
+
+    def test_failed_test_runs_again(self, project, run_incremental):
+        edit(project / "lib.py", "return n * 2", "return n * 3")
+        assert "1 failed" in run_incremental(project).stdout
+        assert "1 failed, 3 deselected" in run_incremental(project).stdout
+
+    def test_line_shift_is_not_a_change(self, project, run_incremental):
+        edit(project / "lib.py", "LIMIT = 10\n", "LIMIT = 10\n\n\n# 설명 추가\n")
+        assert "4 deselected" in run_incremental(project).stdout
+
+
+class TestFileHashes:
+
+    def test_function_change_keeps_module_hash(self):
+        before = file_hashes(compile(LIB, "lib.py", "exec"))
+        after = file_hashes(compile(LIB.replace("n * 2", "n * 3"), "lib.py", "exec"))
+        assert before["double"] != after["double"]
+        assert before["is_short"] == after["is_short"]
+        assert before[MODULE_KEY] == after[MODULE_KEY]
+
+    def test_nested_function_is_part_of_outer(self):
+        source = "def outer():\n    def inner():\n        return {}\n    return inner\n"
+        before = file_hashes(compile(source.format(1), "m.py", "exec"))
+        after = file_hashes(compile(source.format(2), "m.py", "exec"))
+        assert before["outer"] != after["outer"]
+        assert before["outer.<locals>.inner"] != after["outer.<locals>.inner"]
+
+    def test_set_literals_hash_the_same_under_any_hash_seed(self):
+        """집합 리터럴(frozenset 상수)의 원소 순서는 해시 시드마다 다르다"""
+        source = ("def f(x):\n    return x in {'alpha', 'beta', 'gamma'}\n"
+                  "NAMES = sorted({'alpha', 'beta', 'gamma', ('x', frozenset({'y', 'z'}))})\n")
+        script = (
+            "import sys\n"
+            "from src.plugins.incremental import file_hashes\n"
+            "print(sorted(file_hashes(compile(sys.argv[1], 'm.py', 'exec')).items()))\n"
+        )
+
+        def hashes(seed):
+            env = dict(os.environ, PYTHONPATH=str(ROOT), PYTHONHASHSEED=str(seed))
+            return subprocess.run(
+                [sys.executable, "-c", script, source],
+                env=env, capture_output=True, text=True, check=True,
+            ).stdout
+
+        assert hashes(1) == hashes(2) == hashes(3)
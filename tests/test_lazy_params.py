@@ -0,0 +1,94 @@
+import json
+
+import pytest
+
+from src.grading import get_grade
+from src.parsing import validate_score
+from src.plugins.lazy_params import LazyCell, _TABLES, _scan_file, _spill, lazy_parametrize
+
+
+def _is_even(n):
+    return n % 2 == 0
+
+
+def _even_cases():
+    for n in range(1000):
+        yield n, n % 2 == 0
+
+
+class TestLazyParametrize:
+
+    @lazy_parametrize("score, expected", "data/grade_cases.jsonl", ids="id")
+    def test_jsonl_with_ids(self, score, expected):
+        assert get_grade(score) == expected
+
+    @lazy_parametrize("score, expected", "data/boundary_cases.csv", converters={"score": int})
+    def test_csv_boundary_values(self, score, expected):
+        assert get_grade(score) == expected
+
+    @lazy_parametrize("score, expected", "data/boundary_cases.csv", converters={"score": float})
+    def test_csv_same_file_other_converter(self, score, expected):
+        assert type(score) is float
+        assert get_grade(score) == expected
+
+    @lazy_parametrize("n, expected", _even_cases)
+    def test_generator_function(self, n, expected):
+        assert _is_even(n) is expected
+
+    @lazy_parametrize("score", [
+        pytest.param(95, id="수"),
+        pytest.param(-1, id="음수", marks=pytest.mark.xfail(raises=ValueError, strict=True)),
+    ])
+    def test_param_ids_and_marks(self, score):
+        validate_score(score)
+
+    def test_collected_ids(self, request):
+        # 병렬 실행 시 session.items에는 일부만 있으므로 클래스를 다시 수집한다
+        names = {item.name for item in request.node.parent.collect()}
+        for grade_id in ("수", "우", "미", "양", "가"):
+            assert f"test_jsonl_with_ids[{grade_id}]" in names
+        assert "test_csv_boundary_values[90-A]" in names
+        assert "test_generator_function[999-False]" in names
+
+
+class TestLazyTable:
+
+    def test_scan_keeps_only_offsets(self, tmp_path):
+        path = tmp_path / "cases.jsonl"
+        path.write_text("".join(
+            json.dumps({"score": i, "expected": get_grade(i)}) + "\n" for i in range(101)
+        ), encoding="utf-8")
+        table = _scan_file(str(path), ["score", "expected"], None, {})
+        assert len(table) == 101
+        assert table.offsets.typecode == "Q"
+        assert table.ids[90] == "90-A"
+        assert table.row(89) == (89, "B")
+
+    def test_cells_resolve_lazily(self, tmp_path):
+        table = _spill(iter([(1, "a"), (2, "b")]), ["n", "s"])
+        try:
+            first, second = (list(p.values) for p in table.param_sets())
+            assert all(type(cell) is LazyCell for cell in first)
+            assert [cell.resolve() for cell in second] == [2, "b"]
+            assert table.ids == ["1-a", "2-b"]
+        finally:
+            table.close()
+
+    def test_non_scalar_default_id(self):
+        table = _spill([[1, 2]], ["values"])
+        table.close()
+        assert table.ids == ["values0"]
+
+    def test_wrong_arity(self):
+        with pytest.raises(ValueError, match="값 1개, 이름 2개"):
+            _spill([(1,)], ["a", "b"])
+
+    def test_missing_field(self, tmp_path):
+        path = tmp_path / "cases.jsonl"
+        path.write_text('{"score": 1}\n', encoding="utf-8")
+        with pytest.raises(KeyError, match="expected 필드 없음"):
+            _scan_file(str(path), ["score", "expected"], None, {})
+
+    def test_file_scanned_once(self):
+        jsonl = [key for key in _TABLES if isinstance(key[0], str) and key[0].endswith("grade_cases.jsonl")]
+        assert len(jsonl) == 1
@@ -0,0 +1,146 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from main import main
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# 명령 하나 실행까지의 import 시간 예산 (인터프리터 기본 import 포함)
+IMPORT_BUDGET_MS = 60
+
+
+def import_times(*args, nested=False):
+    """
+    python -X importtime main.py ... 의 최상위 import별 누적 시간(μs)
+
+    nested=True면 다른 모듈 안에서 import된 모듈까지 모두 담는다.
+    """
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "main.py", *args],
+        cwd=ROOT, capture_output=True, text=True,
+    ).stderr
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if nested or not name.startswith("  "):  # 들여쓰기 없음 = 최상위 import
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+class TestCommands:
+
+    def test_grade(self, capsys):
+        assert main(["grade", "95", "85", "59"]) == 0
+        assert capsys.readouterr().out.split() == ["A", "B", "F"]
+
+    def test_grade_invalid(self, capsys):
+        assert main(["grade", "95", "101", "abc"]) == 1
+        captured = capsys.readouterr()
+        assert captured.out.split() == ["A"]
+        assert "101: 100 초과는 안 됨" in captured.err
+        assert "abc:" in captured.err
+
+    def test_grade_file(self, tmp_path, capsys):
+        path = tmp_path / "scores.txt"
+        path.write_text("95\n90\n72\nabc\n", encoding="utf-8")
+        assert main(["grade", "--file", str(path)]) == 1
+        captured = capsys.readouterr()
+        assert captured.out.splitlines()[:3] == ["A\t2", "B\t0", "C\t1"]
+        assert "4번 줄" in captured.err
+
+    @pytest.mark.parametrize("args, expected", [
+        pytest.param(["abc", "user123"], 0, id="유효"),
+        pytest.param(["abc", "user@name"], 1, id="무효_포함"),
+        pytest.param(["--score", "0", "100"], 0, id="점수_유효"),
+        pytest.param(["--score", "-1"], 1, id="점수_음수"),
+    ])
+    def test_validate(self, args, expected):
+        assert main(["validate", *args]) == expected
+
+    def test_cart_total_json_and_jsonl(self, tmp_path, capsys):
+        items = [{"name": "사과", "price": 1000, "qty": 3}, {"name": "배", "price": 2500, "qty": 1}]
+        array_path = tmp_path / "cart.json"
+        array_path.write_text(json.dumps(items, ensure_ascii=False), encoding="utf-8")
+        lines_path = tmp_path / "cart.jsonl"
+        lines_path.write_text("\n".join(json.dumps(i) for i in items), encoding="utf-8")
+
+        assert main(["cart", "total", str(array_path)]) == 0
+        assert main(["cart", "total", str(lines_path)]) == 0
+        assert capsys.readouterr().out.split() == ["5500", "5500"]
+
+    def test_cart_import(self, tmp_path, capsys):
+        path = tmp_path / "orders.csv"
+        path.write_text("cart_id,name,price,qty\nc1,사과,1000,3\nc1,배,2500,1\nc2,귤,-1,1\n",
+                        encoding="utf-8")
+        assert main(["cart", "import", str(path)]) == 1
+        captured = capsys.readouterr()
+        assert captured.out.splitlines() == ["cart_id,total,lines,first_line", "c1,5500,2,2"]
+        assert "4번 줄" in captured.err
+
+    @pytest.mark.parametrize("command, content, message", [
+        pytest.param(["cart", "total"], None, "No such file", id="cart_total_파일_없음"),
+        pytest.param(["cart", "total"], '[{"name": "사과", "price": 1000', "Expecting",
+                     id="cart_total_JSON_오류"),
+        pytest.param(["cart", "total"], '{"name": "사과", "price": 1000}\n{oops\n', "Expecting",
+                     id="cart_total_JSONL_오류"),
+        pytest.param(["cart", "import"], None, "No such file", id="cart_import_파일_없음"),
+        pytest.param(["grade", "--file"], None, "No such file", id="grade_file_파일_없음"),
+        pytest.param(["grade", "--file"], b"90\n\xff\n", "utf-8", id="grade_file_인코딩"),
+    ])
+    def test_bad_files_print_message(self, tmp_path, capsys, command, content, message):
+        path = tmp_path / "input.json"
+        if isinstance(content, bytes):
+            path.write_bytes(content)
+        elif content is not None:
+            path.write_text(content, encoding="utf-8")
+        assert main([*command, str(path)]) == 1
+        captured = capsys.readouterr()
+        assert captured.err.startswith(f"{path}: ")
+        assert message in captured.err
+
+    @pytest.mark.parametrize("argv", [
+        pytest.param([], id="명령_없음"),
+        pytest.param(["unknown"], id="모르는_명령"),
+        pytest.param(["grade"], id="점수_없음"),
+        pytest.param(["cart", "sum", "x"], id="cart_형식"),
+    ])
+    def test_usage_errors(self, argv, capsys):
+        assert main(argv) == 2
+        assert "사용법" in capsys.readouterr().err
+
+    def test_help(self, capsys):
+        assert main(["--help"]) == 0
+        assert "grade SCORE" in capsys.readouterr().out
+
+
+class TestStartup:
+
+    @pytest.mark.parametrize("args, forbidden", [
+        pytest.param(["--help"], {"src", "argparse", "json"}, id="help"),
+        pytest.param(["grade", "95"],
+                     {"argparse", "json", "decimal", "numpy", "mmap", "src.score_file", "src.cart",
+                      "src.usernames"},
+                     id="grade"),
+        pytest.param(["validate", "abc"], {"argparse", "json", "src.grading", "src.cart"},
+                     id="validate"),
+    ])
+    def test_imports_only_what_command_needs(self, args, forbidden):
+        imported = set(import_times(*args, nested=True))
+        assert not imported & forbidden
+
+    @pytest.mark.parametrize("args", [
+        pytest.param(["grade", "95"], id="grade"),
+        pytest.param(["validate", "abc"], id="validate"),
+        pytest.param(["validate", "--score", "50"], id="validate_score"),
+    ])
+    @pytest.mark.serial  # --workers로 돌릴 때 다른 테스트와 CPU를 나눠 쓰면 시간이 부풀려진다
+    def test_import_time_budget(self, args):
+        # 측정 잡음을 줄이려고 다섯 번 중 가장 빠른 값을 쓴다
+        total_ms = min(sum(import_times(*args).values()) for _ in range(5)) / 1000
+        assert total_ms < IMPORT_BUDGET_MS, f"import {total_ms:.1f}ms > 예산 {IMPORT_BUDGET_MS}ms"
@@ -0,0 +1,53 @@
+from array import array
+import pytest
+
+from src.grading import grade_stream
+from src.parallel import grade_parallel, new_pool
+
+
+@pytest.fixture(scope="module")
+def executor():
+    with new_pool(2) as pool:
+        yield pool
+
+
+def scores_with_errors(n):
+    return [(i * 37) % 130 - 10 for i in range(n)]
+
+
+class TestGradeParallel:
+
+    def test_matches_grade_stream(self, executor):
+        scores = scores_with_errors(10_000)
+        expected = grade_stream(scores)
+        report = grade_parallel(scores, workers=2, executor=executor, min_size=0)
+
+        assert list(report.histogram) == list(expected.histogram)
+        assert report.grade_counts() == expected.grade_counts()
+        assert report.error_counts == expected.error_counts
+        assert report.errors == expected.errors
+
+    @pytest.mark.parametrize("typecode", ["b", "h", "i", "q"])
+    def test_accepts_int_arrays(self, executor, typecode):
+        scores = array(typecode, (i % 101 for i in range(5_000)))
+        report = grade_parallel(scores, workers=2, executor=executor, min_size=0)
+        assert report.total == 5_000
+        assert report.grade_counts() == grade_stream(scores).grade_counts()
+
+    def test_own_pool(self):
+        report = grade_parallel(list(range(101)) * 10, workers=2, min_size=0)
+        assert report.total == 1010
+
+    def test_small_input_runs_in_process(self):
+        report = grade_parallel([95, 85, -1], workers=4)
+        assert report.grade_counts()["A"] == 1
+        assert report.errors == [(3, -1, "음수는 안 됨")]
+
+    def test_empty_input(self):
+        assert grade_parallel([], workers=2, min_size=0).total == 0
+
+    def test_numpy_input(self, executor):
+        np = pytest.importorskip("numpy")
+        scores = np.arange(10_000, dtype=np.int32) % 101
+        report = grade_parallel(scores, workers=2, executor=executor, min_size=0)
+        assert report.total == 10_000
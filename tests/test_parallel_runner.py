@@ -0,0 +1,127 @@
+import textwrap
+
+import pytest
+
+from src.plugins.parallel import partition
+
+
+PLUGIN = "src.plugins.parallel"
+
+
+class TestPartition:
+
+    def test_balances_by_duration(self):
+        ids = ["a", "b", "c", "d"]
+        durations = {"a": 3.0, "b": 1.0, "c": 1.0, "d": 1.0}
+        assert partition(ids, durations, 2) == [["a"], ["b", "c", "d"]]
+
+    def test_keeps_collection_order_inside_bucket(self):
+        ids = [f"t{i}" for i in range(10)]
+        for bucket in partition(ids, {}, 3):
+            assert bucket == sorted(bucket, key=ids.index)
+
+    def test_unknown_durations_use_average(self):
+        ids = ["slow", "fast", "new"]
+        buckets = partition(ids, {"slow": 10.0, "fast": 1.0}, 2)
+        assert buckets == [["slow"], ["fast", "new"]]  # new는 평균 5.5초로 취급
+
+    def test_more_workers_than_tests(self):
+        assert partition(["a"], {}, 4) == [["a"]]
+
+
+class TestParallelRun:
+
+    def test_merges_results_into_one_report(self, tmp_path, run_pytest):
+        (tmp_path / "test_sample.py").write_text(textwrap.dedent("""
+            import pytest
+
+            @pytest.mark.parametrize("n", range(6))
+            def test_ok(n):
+                assert n >= 0
+
+            def test_fail():
+                assert 1 + 1 == 3, "일부러 실패"
+
+            @pytest.mark.skip
+            def test_skip():
+                pass
+        """), encoding="utf-8")
+
+        result = run_pytest(tmp_path, "--workers", "3", "-q", plugin=PLUGIN)
+
+        assert result.returncode == 1
+        assert "1 failed, 6 passed, 1 skipped" in result.stdout
+        assert "일부러 실패" in result.stdout
+        assert (tmp_path / ".pytest_cache" / "v" / "parallel" / "durations").exists()
+
+    def test_serial_when_one_worker(self, tmp_path, run_pytest):
+        (tmp_path / "test_one.py").write_text("def test_a():\n    pass\n")
+        result = run_pytest(tmp_path, "--workers", "1", "-q", plugin=PLUGIN)
+        assert result.returncode == 0
+        assert "1 passed" in result.stdout
+
+    def test_serial_tests_run_after_workers(self, tmp_path, run_pytest):
+        (tmp_path / "test_mixed.py").write_text(textwrap.dedent("""
+            import time
+            from pathlib import Path
+
+            import pytest
+
+            HERE = Path(__file__).parent
+
+            # 수집 순서로는 맨 앞이지만 병렬 테스트가 모두 끝난 뒤에 실행되어야 한다
+            @pytest.mark.serial
+            def test_serial():
+                assert len(list(HERE.glob("done-*"))) == 4
+
+            @pytest.mark.parametrize("n", range(4))
+            def test_parallel(n):
+                time.sleep(0.2)
+                (HERE / f"done-{n}").touch()
+        """), encoding="utf-8")
+
+        result = run_pytest(tmp_path, "--workers", "2", "-q", plugin=PLUGIN)
+        assert result.returncode == 0, result.stdout
+        assert "5 passed" in result.stdout
+
+    def test_worker_output_in_crash_report(self, tmp_path, run_pytest):
+        (tmp_path / "conftest.py").write_text(textwrap.dedent("""
+            def pytest_configure(config):
+                if config.getoption("parallel_out", None):
+                    raise RuntimeError("워커에서만 실패")
+        """), encoding="utf-8")
+        (tmp_path / "test_a.py").write_text("def test_a():\n    pass\n", encoding="utf-8")
+
+        result = run_pytest(tmp_path, "--workers", "2", "-q", plugin=PLUGIN)
+        assert result.returncode == 1
+        assert "결과 없이 종료됨" in result.stdout
+        assert "워커에서만 실패" in result.stdout
+
+    @pytest.mark.parametrize("options, outcome", [
+        pytest.param([], "1 passed, 1 xfailed, 1 xpassed", id="기본"),
+        pytest.param(["-W", "error::UserWarning"], "1 failed, 1 xfailed, 1 xpassed", id="W"),
+        pytest.param(["-o", "xfail_strict=true"], "1 failed, 1 passed, 1 xfailed", id="o"),
+        pytest.param(["--runxfail"], "1 failed, 2 passed", id="runxfail"),
+    ])
+    def test_result_options_reach_workers(self, tmp_path, run_pytest, options, outcome):
+        (tmp_path / "test_options.py").write_text(textwrap.dedent("""
+            import warnings
+
+            import pytest
+
+            def test_warns():
+                warnings.warn("경고", UserWarning)
+
+            @pytest.mark.xfail
+            def test_xpass():
+                pass
+
+            @pytest.mark.xfail
+            def test_xfail():
+                assert False
+        """), encoding="utf-8")
+
+        serial = run_pytest(tmp_path, "-q", *options, plugin=PLUGIN)
+        parallel = run_pytest(tmp_path, "-q", "--workers", "2", *options, plugin=PLUGIN)
+        assert outcome in serial.stdout
+        assert outcome in parallel.stdout
@@ -0,0 +1,199 @@
+import itertools
+
+import pytest
+
+from src.parsing import (
+    DIVISION_BY_ZERO,
+    EMPTY,
+    EMPTY_TEXT,
+    INVALID,
+    NEGATIVE_VALUE,
+    NONE,
+    NONE_VALUE,
+    NOT_AN_INT,
+    OK,
+    OUT_OF_RANGE,
+    SCORE_NEGATIVE,
+    SCORE_TOO_LARGE,
+    divide,
+    divide_result,
+    parse,
+    parse_many,
+    parse_result,
+    process,
+    process_result,
+    to_int,
+    validate_score,
+    validate_score_result,
+    validate_scores,
+)
+
+
+def scalar_error(value):
+    """parse/to_int로 하나씩 처리했을 때의 예외 (없으면 None)"""
+    try:
+        parse(to_int(value) if value is None else value)
+    except (ValueError, TypeError, OverflowError) as e:
+        return e
+    return None
+
+
+class TestScalarHelpers:
+
+    def test_parse(self):
+        assert parse("42") == 42
+        with pytest.raises(ValueError, match="빈 문자열 불가"):
+            parse("")
+
+    def test_to_int(self):
+        assert to_int("7") == 7
+        with pytest.raises(TypeError, match="None은 변환 불가"):
+            to_int(None)
+
+    @pytest.mark.parametrize("value, error_message", [
+        pytest.param(-1, "음수", id="negative"),
+        pytest.param(101, "100 초과", id="over_100"),
+    ])
+    def test_validate_score(self, value, error_message):
+        with pytest.raises(ValueError, match=error_message):
+            validate_score(value)
+
+    def test_validate_scores_matches_scalar(self):
+        values = [-1, 0, 50, 100, 101, 99.5, 100.5, float("nan"), True, "50", None]
+        expected = []
+        for value in values:
+            try:
+                validate_score(value)
+            except (ValueError, TypeError):
+                expected.append(False)
+            else:
+                expected.append(True)
+        assert validate_scores(values) == expected
+
+
+class TestResultVariants:
+
+    @pytest.mark.parametrize("func, args, expected", [
+        pytest.param(parse_result, ("42",), 42, id="parse"),
+        pytest.param(parse_result, (" -1_000 ",), -1000, id="parse_부호"),
+        pytest.param(parse_result, ("٣",), 3, id="parse_유니코드"),
+        pytest.param(validate_score_result, (100,), 100, id="validate_score"),
+        pytest.param(divide_result, (10, 4), 2.5, id="divide"),
+        pytest.param(process_result, (0,), 0, id="process"),
+    ])
+    def test_ok(self, func, args, expected):
+        assert func(*args) == (True, expected)
+
+    @pytest.mark.parametrize("func, args, error", [
+        pytest.param(parse_result, ("",), EMPTY_TEXT, id="parse_빈"),
+        pytest.param(parse_result, ("1.5",), NOT_AN_INT, id="parse_소수"),
+        pytest.param(parse_result, ("9" * 5000,), NOT_AN_INT, id="parse_긴"),
+        pytest.param(parse_result, (float("inf"),), NOT_AN_INT, id="parse_inf"),
+        pytest.param(validate_score_result, (-1,), SCORE_NEGATIVE, id="score_음수"),
+        pytest.param(validate_score_result, (101,), SCORE_TOO_LARGE, id="score_초과"),
+        pytest.param(divide_result, (1, 0), DIVISION_BY_ZERO, id="divide"),
+        pytest.param(process_result, (None,), NONE_VALUE, id="process_none"),
+        pytest.param(process_result, (-1,), NEGATIVE_VALUE, id="process_음수"),
+    ])
+    def test_error_singletons(self, func, args, error):
+        ok, value = func(*args)
+        assert ok is False
+        assert value is error
+        assert func(*args) is func(*args)  # 실패 결과는 매번 같은 객체
+
+    @pytest.mark.parametrize("func, args, exception, message", [
+        pytest.param(divide, (10, 0), ValueError, "0으로 나눌 수 없습니다", id="divide"),
+        pytest.param(process, (None,), TypeError, "None 안 됨", id="process_none"),
+        pytest.param(process, (-1,), ValueError, "음수 안 됨", id="process_음수"),
+        pytest.param(parse, ("hello",), ValueError, "invalid literal", id="parse_int_메시지"),
+        pytest.param(parse, (float("inf"),), OverflowError, "infinity", id="parse_inf"),
+    ])
+    def test_raising_wrappers(self, func, args, exception, message):
+        with pytest.raises(exception, match=message):
+            func(*args)
+
+    @pytest.mark.parametrize("raising, result, values", [
+        pytest.param(parse, parse_result, ["7", "", "x", " 3 ", None, b"12", 0], id="parse"),
+        pytest.param(validate_score, validate_score_result, [-1, 0, 100, 101, 50.5], id="score"),
+        pytest.param(process, process_result, [None, -1, 0, 3], id="process"),
+    ])
+    def test_raising_and_result_agree(self, raising, result, values):
+        for value in values:
+            ok, outcome = result(value)
+            if ok:
+                assert raising(value) == outcome
+            else:
+                expected = outcome.exception(value)
+                with pytest.raises(type(expected)) as exc_info:
+                    raising(value)
+                assert str(exc_info.value) == str(expected)
+
+    def test_parse_agrees_with_int(self):
+        for text in ["0", "+7", "١٢", "²", " ", "1 2", "0x10", "_1", "1_", "-0"]:
+            try:
+                expected = (True, int(text))
+            except ValueError:
+                expected = (False, NOT_AN_INT)
+            assert parse_result(text) == expected, text
+
+
+class TestParseMany:
+
+    def test_values_and_codes(self):
+        result = parse_many(["1", "", None, "hello", " -42 ", "1_000", 7])
+        assert list(result.values) == [1, 0, 0, 0, -42, 1000, 7]
+        assert list(result.errors) == [OK, EMPTY, NONE, INVALID, OK, OK, OK]
+        assert result.error_rows() == [1, 2, 3]
+        assert result.error_count == 3
+
+    @pytest.mark.parametrize("value", ["", None, "hello", "!@#", "1.5", "1__0", "abc"])
+    def test_messages_match_scalar_exceptions(self, value):
+        expected = scalar_error(value)
+        actual = parse_many([value]).exception(0)
+        assert type(actual) is type(expected)
+        assert str(actual) == str(expected)
+
+    def test_ok_row_has_no_message(self):
+        assert parse_many(["5"]).message(0) is None
+
+    def test_known_messages(self):
+        result = parse_many(["", None])
+        assert result.message(0) == "빈 문자열 불가"
+        assert result.message(1) == "None은 변환 불가"
+
+    def test_out_of_range(self):
+        result = parse_many([str(1 << 63), str(-(1 << 63))])
+        assert list(result.errors) == [OUT_OF_RANGE, OK]
+        assert isinstance(result.exception(0), OverflowError)
+
+    def test_agrees_with_int_on_generated_strings(self):
+        """정규식 사전 검사가 int()와 같은 판단을 해야 한다"""
+        alphabet = ["1", "0", "_", "-", "+", " ", "a", "٣", "　", "."]
+        for length in range(1, 5):
+            for chars in itertools.product(alphabet, repeat=length):
+                text = "".join(chars)
+                result = parse_many([text])
+                error = scalar_error(text)
+                assert (result.errors[0] == OK) == (error is None), text
+                if error is None:
+                    assert result.values[0] == parse(text)
+
+    def test_very_long_string(self):
+        text = " " * 100 + "12"
+        assert list(parse_many([text]).values) == [12]
+        assert parse_many(["9" * 5000]).errors[0] in (INVALID, OUT_OF_RANGE)
+
+    @pytest.mark.parametrize("value", [float("inf"), float("-inf"), float("nan")])
+    def test_non_finite_float_is_invalid(self, value):
+        result = parse_many(["1", value])
+        assert list(result.errors) == [OK, INVALID]
+        assert type(result.exception(1)) is type(scalar_error(value))
+
+    def test_zero_is_not_empty(self):
+        """parse(0)은 거짓 값이라 거부하지만 parse_many는 빈 문자열만 EMPTY"""
+        assert list(parse_many([0]).errors) == [OK]
+
+    def test_accepts_generator(self):
+        result = parse_many(str(i) for i in range(1000))
+        assert list(result.values) == list(range(1000))
+        assert not any(result.errors)
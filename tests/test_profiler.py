@@ -0,0 +1,92 @@
+import json
+import textwrap
+
+import pytest
+
+
+SAMPLE = textwrap.dedent("""
+    import time
+
+    import pytest
+
+    @pytest.fixture(scope="session")
+    def database():
+        time.sleep(0.05)
+        yield "db"
+        time.sleep(0.02)
+
+    @pytest.fixture
+    def resource_with_cleanup(database):
+        print("[Setup]")
+        data = [0] * 100_000
+        yield data
+        print("[Teardown]")
+
+    @pytest.mark.parametrize("n", range(3))
+    def test_uses_resource(resource_with_cleanup, n):
+        assert len(resource_with_cleanup) == 100_000
+
+    def test_slow_body():
+        time.sleep(0.03)
+""")
+
+
+PLUGIN = "src.plugins.profiler"
+
+
+@pytest.fixture
+def sample_dir(tmp_path):
+    (tmp_path / "test_sample.py").write_text(SAMPLE, encoding="utf-8")
+    return tmp_path
+
+
+class TestProfiler:
+
+    def test_report_sorted_and_fixture_counts(self, sample_dir, run_pytest):
+        result = run_pytest(sample_dir, "-q", "--profile-report", "report.json", plugin=PLUGIN)
+        assert result.returncode == 0, result.stdout
+        report = json.loads((sample_dir / "report.json").read_text(encoding="utf-8"))
+
+        fixtures = {entry["name"]: entry for entry in report["fixtures"]}
+        assert fixtures["database"]["scope"] == "session"
+        assert fixtures["database"]["setup"]["count"] == 1
+        assert fixtures["database"]["setup"]["wall_ms"] >= 50
+        assert fixtures["database"]["teardown"]["wall_ms"] >= 20
+        assert fixtures["resource_with_cleanup"]["setup"]["count"] == 3
+        assert report["fixtures"][0]["name"] == "database"
+
+        walls = [entry["wall_ms"] for entry in report["tests"]]
+        assert walls == sorted(walls, reverse=True)
+        assert report["phases"]["call"]["count"] == 4
+        assert report["phases"]["collection"]["count"] == 1
+
+    def test_summary_printed(self, sample_dir, run_pytest):
+        result = run_pytest(sample_dir, "-q", "--profile", "--profile-top", "2", plugin=PLUGIN)
+        assert "테스트 시간 프로파일" in result.stdout
+        assert "scope 확대 후보" in result.stdout
+        assert "database (session)" in result.stdout
+
+    def test_chrome_trace_nests_fixtures_in_setup(self, sample_dir, run_pytest):
+        result = run_pytest(sample_dir, "-q", "--profile-trace", "trace.json", plugin=PLUGIN)
+        assert result.returncode == 0, result.stdout
+        trace = json.loads((sample_dir / "trace.json").read_text(encoding="utf-8"))
+        events = trace["traceEvents"]
+        assert {event["ph"] for event in events} == {"X"}
+
+        setup = next(e for e in events if e["cat"] == "setup")
+        fixture = next(e for e in events if e["name"] == "database" and e["cat"] == "fixture setup")
+        assert setup["ts"] <= fixture["ts"]
+        assert fixture["ts"] + fixture["dur"] <= setup["ts"] + setup["dur"]
+
+    def test_memory_peak(self, sample_dir, run_pytest):
+        result = run_pytest(sample_dir, "-q", "--profile-memory", "--profile-report", "report.json",
+                            plugin=PLUGIN)
+        assert result.returncode == 0, result.stdout
+        report = json.loads((sample_dir / "report.json").read_text(encoding="utf-8"))
+        fixtures = {entry["name"]: entry for entry in report["fixtures"]}
+        # [0] * 100_000 리스트 (약 800KB)
+        assert fixtures["resource_with_cleanup"]["setup"]["memory_peak_bytes"] >= 800_000
+
+    def test_disabled_by_default(self, sample_dir, run_pytest):
+        result = run_pytest(sample_dir, "-q", plugin=PLUGIN)
+        assert "테스트 시간 프로파일" not in result.stdout
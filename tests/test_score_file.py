@@ -0,0 +1,174 @@
+import os
+import subprocess
+import sys
+from array import array
+from pathlib import Path
+
+import pytest
+
+from src.grading import grade_many, grade_stream
+from src.parallel import grade_parallel, new_pool
+from src.score_file import ScoreFile, convert_fixed_width, validate_range, write_scores
+
+
+ROOT = Path(__file__).resolve().parent.parent
+
+CHUNK = 4096  # 테스트에서는 조각을 작게 잘라서 경계를 여러 번 지나게 한다
+
+
+def scores_with_errors(n):
+    return [(i * 37) % 130 - 10 for i in range(n)]
+
+
+@pytest.fixture
+def score_path(tmp_path):
+    path = tmp_path / "scores.bin"
+    write_scores(path, scores_with_errors(10_000), "h")
+    return path
+
+
+class TestScoreFile:
+
+    @pytest.mark.parametrize("typecode", ["h", "i"])
+    def test_view_matches_written_scores(self, tmp_path, typecode):
+        path = tmp_path / "scores.bin"
+        scores = scores_with_errors(5000)
+        assert write_scores(path, scores, typecode) == 5000
+        with ScoreFile(path, typecode) as f:
+            assert len(f) == 5000
+            assert f.view.format == typecode
+            assert f.view.readonly
+            assert f.view.tolist() == scores
+
+    def test_chunks_cover_range(self, score_path):
+        with ScoreFile(score_path, chunk_bytes=CHUNK) as f:
+            starts = []
+            values = []
+            for start, chunk in f.chunks(100, 9_000):
+                starts.append(start)
+                values.extend(chunk)
+            assert starts == list(range(100, 9_000, CHUNK // 2))
+            assert values == scores_with_errors(10_000)[100:9_000]
+
+    def test_header_offset(self, tmp_path):
+        path = tmp_path / "scores.bin"
+        path.write_bytes(b"HDR" + array("h", [1, 2, 3]).tobytes())
+        with ScoreFile(path, offset=3) as f:
+            assert list(f.view) == [1, 2, 3]
+            assert [list(chunk) for _, chunk in f.chunks()] == [[1, 2, 3]]
+
+    def test_empty_file(self, tmp_path):
+        path = tmp_path / "empty.bin"
+        path.write_bytes(b"")
+        with ScoreFile(path) as f:
+            assert len(f) == 0
+            assert list(f.chunks()) == []
+            assert grade_parallel(f).total == 0
+
+    @pytest.mark.parametrize("kwargs, message", [
+        pytest.param({"typecode": "q"}, "typecode", id="typecode"),
+        pytest.param({"offset": 1}, "2바이트 단위", id="크기"),
+        pytest.param({"offset": 99_999}, "offset", id="offset"),
+        pytest.param({"chunk_bytes": 1000}, "페이지 크기", id="chunk_bytes"),
+    ])
+    def test_rejects(self, score_path, kwargs, message):
+        with pytest.raises(ValueError, match=message):
+            ScoreFile(score_path, **kwargs)
+
+    def test_numpy_view(self, score_path):
+        np = pytest.importorskip("numpy")
+        with ScoreFile(score_path) as f:
+            data = f.numpy()
+            assert data.dtype == np.int16
+            assert not data.flags.owndata
+            assert data.tolist() == scores_with_errors(10_000)
+            del data
+
+
+class TestConsumers:
+
+    def test_grade_many(self, score_path):
+        with ScoreFile(score_path, chunk_bytes=CHUNK) as f:
+            assert grade_many(f) == grade_many(scores_with_errors(10_000))
+
+    def test_grade_parallel_in_process(self, score_path):
+        expected = grade_stream(scores_with_errors(10_000))
+        with ScoreFile(score_path, chunk_bytes=CHUNK) as f:
+            report = grade_parallel(f, workers=1)
+        assert list(report.histogram) == list(expected.histogram)
+        assert report.error_counts == expected.error_counts
+        assert report.errors == expected.errors
+
+    def test_grade_parallel_workers_map_file(self, score_path):
+        expected = grade_stream(scores_with_errors(10_000))
+        with new_pool(2) as pool, ScoreFile(score_path) as f:
+            report = grade_parallel(f, workers=2, executor=pool, min_size=0)
+        assert report.grade_counts() == expected.grade_counts()
+        assert report.errors == expected.errors
+
+    def test_validate_range(self, score_path):
+        scores = scores_with_errors(10_000)
+        expected = [(i + 1, s) for i, s in enumerate(scores) if not 0 <= s <= 100]
+        with ScoreFile(score_path, chunk_bytes=CHUNK) as f:
+            check = validate_range(f, max_errors=5)
+        assert check.checked == 10_000
+        assert check.invalid == len(expected)
+        assert check.samples == expected[:5]
+        assert validate_range(array("h", scores), max_errors=5) == check
+        assert validate_range(range(101)).invalid == 0
+
+
+class TestConvertFixedWidth:
+
+    def test_convert(self, tmp_path):
+        source = tmp_path / "scores.txt"
+        source.write_bytes(b" 85\n100\n -1\n  7\n")
+        dest = tmp_path / "scores.bin"
+        assert convert_fixed_width(source, dest, width=4) == 4
+        with ScoreFile(dest) as f:
+            assert list(f.view) == [85, 100, -1, 7]
+
+    @pytest.mark.parametrize("data, message", [
+        pytest.param(b" 85\n abc\n", "2번 줄: 길이", id="길이"),
+        pytest.param(b" 85\nabc\n", "2번 줄: 점수가 아님", id="문자"),
+        pytest.param(b"99999\n", "1번 줄: 범위 밖", id="int16"),
+    ])
+    def test_errors_have_line_numbers(self, tmp_path, data, message):
+        source = tmp_path / "scores.txt"
+        source.write_bytes(data)
+        width = 4 if data.startswith(b" 85") else 6
+        with pytest.raises(ValueError, match=message):
+            convert_fixed_width(source, tmp_path / "out.bin", width=width)
+
+
+RSS_SCRIPT = """
+import resource, sys
+from src.parallel import grade_parallel
+from src.score_file import ScoreFile
+
+def peak():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+with ScoreFile(sys.argv[1], chunk_bytes=1 << 20) as f:
+    before = peak()
+    report = grade_parallel(f, workers=1)
+    print(report.total, peak() - before)
+"""
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="madvise 동작은 리눅스 기준")
+def test_peak_rss_stays_near_chunk_size(tmp_path):
+    """파일 크기(32MB)만큼 RSS가 늘지 않아야 한다"""
+    path = tmp_path / "big.bin"
+    block = array("h", (i % 101 for i in range(1 << 16))).tobytes()
+    with open(path, "wb") as f:
+        for _ in range(256):
+            f.write(block)
+    output = subprocess.run(
+        [sys.executable, "-c", RSS_SCRIPT, str(path)],
+        check=True, capture_output=True, text=True, cwd=ROOT,
+        env={**os.environ, "PYTHONPATH": str(ROOT)},
+    ).stdout
+    total, growth = map(int, output.split())
+    assert total == 16 << 20
+    assert growth < 8 << 20
@@ -0,0 +1,66 @@
+import io
+
+import pytest
+
+from src.usernames import is_valid_username, iter_username_file, validate_usernames
+
+
+# test_with_descriptive_ids와 같은 케이스 + 유니코드
+USERNAME_CASES = [
+    pytest.param("abc", True, id="최소길이_3자"),
+    pytest.param("user123", True, id="영문숫자_혼합"),
+    pytest.param("abcdefghij", True, id="최대길이_10자"),
+    pytest.param("", False, id="빈문자열"),
+    pytest.param("ab", False, id="너무짧음_2자"),
+    pytest.param("abcdefghijk", False, id="너무김_11자"),
+    pytest.param("user@name", False, id="특수문자_포함"),
+    pytest.param("홍길동", True, id="한글"),
+    pytest.param("user_1", False, id="밑줄"),
+    pytest.param("١٢٣", True, id="아랍숫자"),
+    pytest.param("x²³", True, id="위첨자"),
+    pytest.param("abc\n", False, id="개행"),
+]
+
+
+class TestValidateUsernames:
+
+    @pytest.mark.parametrize("username, expected", USERNAME_CASES)
+    def test_matches_is_valid_username(self, username, expected):
+        assert is_valid_username(username) == expected
+        assert validate_usernames([username]) == [expected]
+
+    def test_none_is_invalid(self):
+        assert validate_usernames([None]) == [is_valid_username(None)]
+
+    def test_agrees_on_every_bmp_character(self):
+        """isalnum 유니코드 규칙과 정규식이 모든 BMP 문자에서 일치해야 한다"""
+        names = [chr(cp) * 3 for cp in range(0x10000)]
+        assert validate_usernames(names) == [is_valid_username(n) for n in names]
+
+
+class TestIterUsernameFile:
+
+    def test_yields_line_numbers(self, tmp_path):
+        path = tmp_path / "users.txt"
+        path.write_text("abc\nab\n홍길동\r\n\nuser@name\n", encoding="utf-8")
+
+        assert list(iter_username_file(path)) == [
+            (1, "abc", True),
+            (2, "ab", False),
+            (3, "홍길동", True),
+            (4, "", False),
+            (5, "user@name", False),
+        ]
+
+    def test_accepts_open_file(self):
+        f = io.StringIO("user123\nabcdefghijk")
+        assert list(iter_username_file(f)) == [
+            (1, "user123", True),
+            (2, "abcdefghijk", False),
+        ]
+
+    def test_is_lazy(self):
+        f = io.StringIO("abc\nabd\n")
+        rows = iter_username_file(f)
+        assert next(rows) == (1, "abc", True)
+        assert f.readline() == "abd\n"
@@ -0,0 +1,150 @@
+import io
+import json
+import tracemalloc
+
+import pytest
+
+from src.users import User, UserStore
+
+
+def make_records(n, domains=("example.com", "test.co.kr", "mail.net")):
+    names = ["홍길동", "김철수", "이영희", "박민수"]
+    return [
+        {
+            "id": i,
+            "name": names[i % len(names)],
+            "email": f"user{i}@{domains[i % len(domains)]}",
+            "active": i % 3 != 0,
+        }
+        for i in range(1, n + 1)
+    ]
+
+
+@pytest.fixture
+def store(shared_user_data):
+    return UserStore.from_records([
+        shared_user_data,
+        {"id": 2, "name": "김철수", "email": "kim@example.com", "active": False},
+    ])
+
+
+class TestUserStore:
+
+    def test_lookup_by_id(self, store, shared_user_data):
+        assert store[1].to_dict() == shared_user_data
+        assert store.get(3) is None
+        assert 2 in store and 3 not in store
+        with pytest.raises(KeyError):
+            store[3]
+
+    def test_lookup_by_email(self, store):
+        assert store.by_email("kim@example.com") == User(2, "김철수", "kim@example.com", False)
+        assert store.by_email("nobody@example.com") is None
+        assert store.by_email("kim@other.com") is None
+        assert store.by_email("no-at-sign") is None
+
+    def test_domains_and_names_are_interned(self):
+        store = UserStore.from_records(make_records(1000))
+        assert store.domains == ["test.co.kr", "mail.net", "example.com"]
+        assert len({id(name) for name in store.names}) == 4
+
+    @pytest.mark.parametrize("record, error", [
+        pytest.param({"id": 1, "name": "x", "email": "new@example.com"}, "id 중복", id="id"),
+        pytest.param({"id": 9, "name": "x", "email": "hong@example.com"}, "email 중복", id="email"),
+        pytest.param({"id": 9, "name": "x", "email": "example.com"}, "이메일 형식", id="format"),
+        pytest.param({"id": 1 << 63, "name": "x", "email": "new@example.com"}, "64비트", id="id_범위"),
+    ])
+    def test_add_rejects(self, store, record, error):
+        with pytest.raises(ValueError, match=error):
+            store.add(**{"user_id": record["id"], "name": record["name"], "email": record["email"]})
+        assert len(store) == 2
+
+    @pytest.mark.parametrize("name, email", [
+        pytest.param("x", 5, id="email_정수"),
+        pytest.param("x", None, id="email_None"),
+        pytest.param(["x"], "new@example.com", id="name_리스트"),
+    ])
+    def test_add_rejects_types(self, store, name, email):
+        with pytest.raises(TypeError, match="문자열"):
+            store.add(9, name, email)
+        assert len(store) == 2
+
+    def test_active_bitmap(self, store):
+        assert store.active_count() == 1
+        store.set_active(2, True)
+        store.set_active(1, False)
+        assert (store[1].active, store[2].active) == (False, True)
+        assert store.active_count() == 1
+
+    def test_grows_and_keeps_every_record(self):
+        records = make_records(5000)
+        store = UserStore.from_records(records)
+        assert [user.to_dict() for user in store] == records
+        for record in records[::97]:
+            assert store[record["id"]].email == record["email"]
+            assert store.by_email(record["email"]).id == record["id"]
+        assert store.active_count() == sum(r["active"] for r in records)
+
+    def test_sparse_ids(self):
+        ids = [-5, 0, 2**40, 7, 2**62]
+        store = UserStore.from_records(
+            {"id": i, "name": "n", "email": f"u{n}@x.com"} for n, i in enumerate(ids)
+        )
+        assert [store[i].id for i in ids] == ids
+
+
+class TestLoadJsonl:
+
+    def test_load(self, tmp_path):
+        records = make_records(100)
+        path = tmp_path / "users.jsonl"
+        path.write_text("\n".join(json.dumps(r, ensure_ascii=False) for r in records) + "\n\n",
+                        encoding="utf-8")
+        store = UserStore.load_jsonl(path)
+        assert len(store) == 100
+        assert store[50].to_dict() == records[49]
+
+    @pytest.mark.parametrize("line, message", [
+        pytest.param('{"id": 2, "name": "x"}', "2번 줄: email 필드 없음", id="missing"),
+        pytest.param('{"id": 1, "name": "x", "email": "a@b.c"}', "2번 줄: id 중복", id="duplicate"),
+        pytest.param("{oops", "2번 줄", id="json"),
+        pytest.param('{"id": 2, "name": "x", "email": 5}', "2번 줄: email은 문자열", id="email_타입"),
+        pytest.param('{"id": 99999999999999999999, "name": "x", "email": "a@b.c"}',
+                     "2번 줄: id가 64비트", id="id_범위"),
+        pytest.param('{"id": 2, "name": null, "email": "a@b.c"}', "2번 줄: name은 문자열",
+                     id="name_타입"),
+    ])
+    def test_errors_have_line_numbers(self, line, message):
+        source = io.StringIO('{"id": 1, "name": "홍길동", "email": "hong@example.com"}\n' + line)
+        with pytest.raises(ValueError, match=message):
+            UserStore.load_jsonl(source)
+
+
+class TestMemory:
+
+    def test_memory_per_record(self):
+        store = UserStore.from_records(make_records(20_000))
+        # 열 + 색인 + 이메일 앞부분 문자열. dict 하나(빈 dict도 64바이트 이상)보다 작다
+        assert 0 < store.memory_per_record() < 200
+
+    def test_smaller_than_dicts(self):
+        records = make_records(20_000)
+        lines = [json.dumps(r, ensure_ascii=False) for r in records]
+        del records
+
+        tracemalloc.start()
+        try:
+            dicts = [json.loads(line) for line in lines]
+            by_id = {d["id"]: d for d in dicts}
+            by_email = {d["email"]: d for d in dicts}
+            dict_bytes = tracemalloc.get_traced_memory()[0]
+            del dicts, by_id, by_email
+
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            store = UserStore.load_jsonl(lines)
+            store_bytes = tracemalloc.get_traced_memory()[0] - before
+        finally:
+            tracemalloc.stop()
+        assert len(store) == 20_000
+        assert store_bytes < dict_bytes / 2